@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Parser backend parity check and benchmark over the saved page corpus.
+
+    python benchmarks/bench_parsers.py [--rounds 20]
+
+Every available backend must extract exactly the same record as the default
+html.parser backend from each saved detail page; any difference is printed
+and the script exits non-zero (tests/test_parsers.py checks the same in the
+test suite). Then ms/page is reported per backend for listing pages (full
+parse vs. the strained listing parse) and detail pages (parse + extraction).
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from jobau.parsers import BACKENDS, make_listing_soup, make_soup  # noqa: E402
+from jobau.scraper_api import parse_job_details  # noqa: E402
+
+CORPUS_DIR = os.path.join(ROOT, "benchmarks", "corpus")
+PAGE_URL = "https://www.myjobmag.com/job/corpus-page"
+
+
+def load_corpus(pattern):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, pattern))):
+        with open(path, encoding="utf-8") as f:
+            pages.append((os.path.basename(path), f.read()))
+    return pages
+
+
+def available_backends():
+    usable = []
+    for backend in BACKENDS:
+        try:
+            make_soup("<p></p>", backend)
+            usable.append(backend)
+        except RuntimeError as e:
+            print(f"⚠️  Skipping {backend}: {e}")
+    return usable
+
+
+def check_parity(backends, details):
+    """Compare each backend's records with html.parser's. Returns the mismatch count."""
+    mismatches = 0
+    for name, html in details:
+        expected = parse_job_details(html, PAGE_URL, backend="html.parser")
+        for backend in backends:
+            actual = parse_job_details(html, PAGE_URL, backend=backend)
+            for field in expected:
+                if actual.get(field) != expected[field]:
+                    mismatches += 1
+                    print(f"❌ {backend} / {name} / {field}:")
+                    print(f"      html.parser: {expected[field]!r}"[:200])
+                    print(f"      {backend}: {actual.get(field)!r}"[:200])
+    return mismatches
+
+
+def time_per_page(func, pages, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, html in pages:
+            func(html)
+    return (time.perf_counter() - start) * 1000 / (rounds * len(pages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=20, help="passes over the corpus per backend")
+    args = parser.parse_args()
+
+    listings = load_corpus("listing_*.html")
+    details = load_corpus("detail_*.html")
+    backends = available_backends()
+
+    print(f"\n🔎 Parity over {len(details)} detail pages")
+    mismatches = check_parity(backends, details)
+    if not mismatches:
+        print("✅ All backends extract identical records")
+
+    print(f"\n⏱️  ms/page over {args.rounds} rounds")
+    print(f"   {'backend':<12} {'listing':>10} {'strained':>10} {'detail':>10}")
+    baseline = None
+    for backend in backends:
+        listing_ms = time_per_page(lambda html: make_soup(html, backend).select("li.job-list-li"),
+                                   listings, args.rounds)
+        strained_ms = time_per_page(
+            lambda html: make_listing_soup(html, backend).select("li.job-list-li"), listings, args.rounds
+        )
+        detail_ms = time_per_page(lambda html: parse_job_details(html, PAGE_URL, backend=backend),
+                                  details, args.rounds)
+        baseline = baseline or detail_ms
+        print(f"   {backend:<12} {listing_ms:>10.2f} {strained_ms:>10.2f} {detail_ms:>10.2f}"
+              f"   ({baseline / detail_ms:.1f}x)")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
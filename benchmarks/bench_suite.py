@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmarks for the per-job hot paths, at realistic batch sizes.
+
+    python benchmarks/bench_suite.py [--sizes 100 1000 10000] [--cases parse filter]
+                                     [--compare [RESULTS.json]] [--threshold 1.2]
+
+Cases (each run over a batch of jobs cycled from benchmarks/corpus):
+
+    parse        scraper_api.parse_job_details on saved detail HTML
+    clean_text   schema.clean_text on the raw description text
+    map_api      scraper_api.map_job_to_api_format (skills, dates, salary)
+    should_send  scraper_api.should_send_job, one job at a time
+    filter       JobFilter.evaluate over the whole batch (what main() runs)
+    dataframe    DataFrame construction for the Sheets sinks
+
+Every run is saved to .benchmarks/<time>_<commit>.json. With --compare
+the results are checked against an earlier run (the latest saved one by
+default) and the script exits non-zero when any case got slower than
+--threshold times its previous per-job time.
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from jobau import scraper_api  # noqa: E402
+from jobau.schema import clean_text  # noqa: E402
+from jobau.sheets import frames  # noqa: E402
+
+CORPUS_DIR = os.path.join(ROOT, "benchmarks", "corpus")
+RESULTS_DIR = os.path.join(ROOT, ".benchmarks")
+
+# Stop repeating a case once one batch takes this long
+REPEAT_BUDGET_SECONDS = 2.0
+
+FILTERS = {
+    'required_fields': ['Company', 'Description', 'Apply Now'],
+    'industries': [
+        'Telecommunication', 'Technical', 'Security / Intelligence', 'ict / computer',
+        'ict / telecommunication', 'Data, Business Analysis and AI', 'Product Management',
+        'Project Management',
+    ],
+    'blocked_industries': [],
+    'job_types': [],
+    'locations': [],
+    'min_experience': None,
+    'require_salary': False,
+}
+
+
+# --------------------------------------------
+# FIXTURES
+# --------------------------------------------
+def load_pages():
+    pages = []
+    for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "detail_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def make_batch(pages, records, size):
+    """`size` (url, html, record) jobs cycled from the corpus, each with its own URL."""
+    batch = []
+    for i in range(size):
+        url = f"https://www.myjobmag.com/job/corpus-{i}"
+        record = records[i % len(records)].replace({"Original URL": url})
+        batch.append((url, pages[i % len(pages)], record))
+    return batch
+
+
+# --------------------------------------------
+# CASES: each takes a batch and processes every job in it
+# --------------------------------------------
+def case_parse(batch):
+    for url, html, _ in batch:
+        scraper_api.parse_job_details(html, url)
+
+
+def case_clean_text(batch):
+    for _, _, record in batch:
+        clean_text(record.get("Overview"))
+        clean_text(record.get("Description"))
+
+
+def case_map_api(batch):
+    for _, _, record in batch:
+        scraper_api.map_job_to_api_format(record)
+
+
+def case_should_send(batch):
+    for _, _, record in batch:
+        scraper_api.should_send_job(record, FILTERS)
+
+
+def case_filter(batch):
+    from jobau.filter_engine import compile_filters
+
+    compile_filters(FILTERS).evaluate([record for _, _, record in batch])
+
+
+def case_dataframe(batch):
+    for _ in frames([[record for _, _, record in batch]], scraper_api.DETAILS_COLUMNS):
+        pass
+
+
+CASES = {
+    "parse": case_parse,
+    "clean_text": case_clean_text,
+    "map_api": case_map_api,
+    "should_send": case_should_send,
+    "filter": case_filter,
+    "dataframe": case_dataframe,
+}
+
+
+def measure(func, batch, repeat):
+    """Best wall time of `func(batch)` over up to `repeat` runs (fewer for slow batches)."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(batch)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        if elapsed > REPEAT_BUDGET_SECONDS:
+            break
+    return best
+
+
+# --------------------------------------------
+# RESULTS
+# --------------------------------------------
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def latest_results():
+    paths = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")))
+    return paths[-1] if paths else None
+
+
+def compare(results, baseline_path, threshold):
+    """Print per-case ratios against a saved run. Returns the number of regressions."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    before = {(r["case"], r["size"]): r["us_per_job"] for r in baseline["results"]}
+
+    print(f"\n📊 Compared with {os.path.basename(baseline_path)} (commit {baseline.get('commit')}):")
+    regressions = 0
+    for r in results:
+        previous = before.get((r["case"], r["size"]))
+        if not previous:
+            continue
+        ratio = r["us_per_job"] / previous
+        flag = ""
+        if ratio > threshold:
+            flag = "  ❌ slower"
+            regressions += 1
+        elif ratio < 1 / threshold:
+            flag = "  ✅ faster"
+        print(f"   {r['case']:<12}{r['size']:>7}   {previous:>10.1f} -> {r['us_per_job']:>10.1f} us/job"
+              f"   {ratio:5.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for extraction, mapping and filtering.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case and size; the best counts")
+    parser.add_argument("--compare", nargs="?", const="latest", metavar="RESULTS.json",
+                        help="compare with a saved run (default: the latest one)")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="per-job slowdown counted as a regression")
+    parser.add_argument("--no-save", action="store_true", help="don't store this run under .benchmarks/")
+    args = parser.parse_args()
+
+    baseline = latest_results() if args.compare == "latest" else args.compare
+
+    pages = load_pages()
+    records = [scraper_api.parse_job_details(html, f"https://www.myjobmag.com/job/corpus-{i}")
+               for i, html in enumerate(pages)]
+
+    results = []
+    print(f"{'case':<12}{'size':>7}{'total ms':>12}{'us/job':>12}")
+    for size in args.sizes:
+        batch = make_batch(pages, records, size)
+        for case in args.cases:
+            seconds = measure(CASES[case], batch, args.repeat)
+            result = {"case": case, "size": size, "seconds": round(seconds, 6),
+                      "us_per_job": round(seconds / size * 1e6, 3)}
+            results.append(result)
+            print(f"{case:<12}{size:>7}{seconds * 1000:>12.2f}{result['us_per_job']:>12.1f}")
+
+    run = {
+        "commit": git_commit(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}_{run['commit']}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        print(f"\n📝 Saved to {os.path.relpath(path, ROOT)}")
+
+    if args.compare:
+        if not baseline:
+            print("\n⚠️  No earlier results to compare with.")
+        elif compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Offline end-to-end load test of the scrapers against the local stub.
+
+    python benchmarks/load_harness.py [--scripts scraper scraperr scraper_api]
+                                      [--pages 10] [--latency-ms 50] [--throttle-rate 0.05] ...
+                                      [--polite] [--json results.json]
+
+Each script runs as its own process against a fresh stub (see
+stub_server.py), with the HTTP cache, seen-jobs index and page archive
+turned off so every run does the full work. scraper.py and scraperr.py run
+with --dry-run (no Google Sheets); scraper_api.py posts to the stub's fake
+job API. Reported per script: wall time, jobs/second, p50/p95 request
+latency as seen by the client, failed requests and API posts received.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+from stub_server import add_stub_arguments, config_from_args, start_stub
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPTS = {
+    "scraper": ["--dry-run"],
+    "scraperr": ["--dry-run"],
+    "scraper_api": [],
+}
+
+
+# --------------------------------------------
+# CHILD: run one script with request timing
+# --------------------------------------------
+def run_child(script, log_path, args):
+    """Run a top-level script as __main__, logging (method, url, status, seconds) per request."""
+    import atexit
+    import runpy
+
+    import requests
+
+    timings = []
+    send = requests.Session.send
+
+    def timed_send(session, request, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = send(session, request, **kwargs)
+        except Exception:
+            timings.append((request.method, request.url, None, time.perf_counter() - started))
+            raise
+        timings.append((request.method, request.url, response.status_code, time.perf_counter() - started))
+        return response
+
+    requests.Session.send = timed_send
+
+    def dump():
+        with open(log_path, "w", encoding="utf-8") as f:
+            json.dump(timings, f)
+
+    atexit.register(dump)
+    sys.argv = [script] + args
+    runpy.run_path(os.path.join(ROOT, f"{script}.py"), run_name="__main__")
+
+
+# --------------------------------------------
+# PARENT: stub + one process per script
+# --------------------------------------------
+def percentile(values, pct):
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def run_script(script, stub_args, polite=False, timeout=600):
+    """Run one script against a fresh stub and return its measurements."""
+    server, site, base_url = start_stub(config_from_args(stub_args))
+    log_path = tempfile.mktemp(suffix=".json")
+    workdir = tempfile.mkdtemp()
+    env = {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "SCRAPER_BASE_URL": base_url,
+        "API_BASE_URL": base_url,
+        "SCRAPER_CACHE": "0",
+        "SCRAPER_INCREMENTAL": "0",
+        "SCRAPER_ARCHIVE": "0",
+        # --polite applies the production per-host rate limit to the stub
+        "SCRAPER_RATE_LIMITED_HOSTS": urlparse(base_url).netloc if polite else "",
+    }
+    command = [sys.executable, os.path.abspath(__file__), "--child", script, "--log", log_path, "--",
+               *SCRIPTS[script]]
+
+    started = time.perf_counter()
+    child = subprocess.run(command, env=env, cwd=workdir, capture_output=True, text=True, timeout=timeout)
+    wall = time.perf_counter() - started
+    server.shutdown()
+
+    if child.returncode != 0 or not os.path.exists(log_path):
+        print(child.stdout[-2000:], child.stderr[-2000:], sep="\n")
+        raise SystemExit(f"❌ {script} exited with {child.returncode}")
+
+    with open(log_path, encoding="utf-8") as f:
+        timings = json.load(f)
+    os.remove(log_path)
+
+    latencies = sorted(seconds * 1000 for _, _, _, seconds in timings)
+    jobs = {url for method, url, status, _ in timings
+            if method == "GET" and status == 200 and urlparse(url).path.startswith("/job/")}
+    stub = site.snapshot()
+    return {
+        "script": script,
+        "wall_seconds": round(wall, 3),
+        "jobs": len(jobs),
+        "jobs_per_second": round(len(jobs) / wall, 2) if wall else None,
+        "requests": len(timings),
+        "failed_requests": sum(1 for _, _, status, _ in timings if status is None or status >= 400),
+        "p50_ms": round(percentile(latencies, 50), 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95), 2) if latencies else None,
+        "api_posts": stub["posts"],
+        "stub": stub,
+    }
+
+
+def print_report(results):
+    print(f"\n{'script':<13}{'wall s':>9}{'jobs':>7}{'jobs/s':>9}{'reqs':>7}{'failed':>8}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'posts':>7}")
+    for r in results:
+        print(f"{r['script']:<13}{r['wall_seconds']:>9.2f}{r['jobs']:>7}{r['jobs_per_second']:>9.2f}"
+              f"{r['requests']:>7}{r['failed_requests']:>8}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}"
+              f"{r['api_posts']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test of the scrapers against the local stub.")
+    parser.add_argument("--scripts", nargs="+", choices=sorted(SCRIPTS), default=list(SCRIPTS))
+    parser.add_argument("--polite", action="store_true", help="rate limit the stub like www.myjobmag.com")
+    parser.add_argument("--timeout", type=int, default=600, help="seconds allowed per script")
+    parser.add_argument("--json", help="also write the results to this file")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    results = []
+    for script in args.scripts:
+        print(f"🏃 {script}: {args.pages} pages x {args.jobs_per_page} jobs, "
+              f"{args.latency_ms:g} ms latency, {args.error_rate:g} errors, {args.throttle_rate:g} 429s")
+        results.append(run_script(script, args, polite=args.polite, timeout=args.timeout))
+    print_report(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": {k: v for k, v in vars(args).items() if k != "json"}, "results": results}, f, indent=2)
+        print(f"\n📝 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        # load_harness.py --child SCRIPT --log FILE -- ARGS...
+        separator = sys.argv.index("--")
+        run_child(sys.argv[2], sys.argv[4], sys.argv[separator + 1:])
+    else:
+        main()
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Local stand-in for www.myjobmag.com and the AlumUnite job API.
+
+    python benchmarks/stub_server.py [--pages 10] [--latency-ms 50] [--error-rate 0.02] [--throttle-rate 0.05]
+
+Serves listing pages (/jobs-by-date/today, /jobs-by-date/today/{n} and
+?page={n}) and detail pages (/job/...) built from the saved corpus in
+benchmarks/corpus, with configurable latency, 5xx error rate and 429
+injection. POST /v1/store-job-api accepts jobs like the real API and
+records them; GET /_stats returns what was served and posted as JSON.
+
+Point the scrapers at it with SCRAPER_BASE_URL and API_BASE_URL (see
+benchmarks/load_harness.py).
+"""
+
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(ROOT, "benchmarks", "corpus")
+
+JOB_ITEM = re.compile(r'  <li class="job-list-li">.*?\n  </li>\n', re.DOTALL)
+JOB_HREF = re.compile(r'href="/job/([^"]*?)-\d+"')
+PAGINATION = re.compile(r'<ul class="setPaginate">.*?</ul>', re.DOTALL)
+
+
+class StubConfig:
+    """What the stub serves and how badly it behaves."""
+
+    def __init__(self, pages=10, jobs_per_page=20, latency_ms=0.0, jitter_ms=0.0,
+                 error_rate=0.0, throttle_rate=0.0, retry_after=1, seed=0):
+        self.pages = pages
+        self.jobs_per_page = jobs_per_page
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.seed = seed
+
+
+class StubSite:
+    """Listing/detail pages synthesized from the corpus, plus the fake API's post log."""
+
+    def __init__(self, config):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "listing": 0, "detail": 0, "errors": 0, "throttled": 0}
+        self.posts = []
+
+        listings = [self._read(path) for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "listing_*.html")))]
+        self.details = [self._read(path) for path in sorted(glob.glob(os.path.join(CORPUS_DIR, "detail_*.html")))]
+        self.items = [item for html in listings for item in JOB_ITEM.findall(html)]
+        # Page shell: the first listing with its job list and pagination cut out
+        first = listings[0]
+        first_items = JOB_ITEM.findall(first)
+        start = first.index(first_items[0])
+        end = first.rindex(first_items[-1]) + len(first_items[-1])
+        self.shell_head, self.shell_tail = first[:start], first[end:]
+
+    @staticmethod
+    def _read(path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    # ---------- pages ----------
+    def listing(self, page):
+        """Listing page `page`: jobs_per_page unique jobs, or none past the last page."""
+        items = []
+        if 1 <= page <= self.config.pages:
+            for i in range(self.config.jobs_per_page):
+                n = (page - 1) * self.config.jobs_per_page + i
+                item = self.items[n % len(self.items)]
+                items.append(JOB_HREF.sub(lambda m: f'href="/job/{m.group(1)}-{n}"', item))
+        links = "".join(
+            f'  <li><a href="/jobs-by-date/today/{n}">{n}</a></li>\n' for n in range(1, self.config.pages + 1)
+        )
+        pagination = f'<ul class="setPaginate">\n{links} </ul>'
+        return PAGINATION.sub(lambda m: pagination, self.shell_head + "".join(items) + self.shell_tail)
+
+    def detail(self, path):
+        """A detail page from the corpus, picked deterministically by path."""
+        return self.details[zlib.crc32(path.encode("utf-8")) % len(self.details)]
+
+    # ---------- behaviour ----------
+    def delay(self):
+        jitter = self.random.uniform(-self.config.jitter_ms, self.config.jitter_ms) if self.config.jitter_ms else 0
+        seconds = max(0.0, self.config.latency_ms + jitter) / 1000
+        if seconds:
+            time.sleep(seconds)
+
+    def fault(self):
+        """None, or the (status, headers) of an injected failure."""
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.config.throttle_rate:
+            return 429, {"Retry-After": str(self.config.retry_after)}
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            return 503 if roll < self.config.throttle_rate + self.config.error_rate / 2 else 500, {}
+        return None
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {**self.stats, "posts": len(self.posts),
+                    "idempotency_keys": len({key for key, _ in self.posts})}
+
+
+def make_handler(site):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _fault(self):
+            fault = site.fault()
+            if fault:
+                status, headers = fault
+                site.count("throttled" if status == 429 else "errors")
+                self._send(status, f"Stub {status}", headers=headers)
+            return fault
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/_stats":
+                return self._send(200, json.dumps(site.snapshot()), "application/json")
+
+            site.count("requests")
+            site.delay()
+            if self._fault():
+                return
+
+            if url.path.rstrip("/").startswith("/jobs-by-date/today"):
+                tail = url.path.rstrip("/").rsplit("/", 1)[1]
+                page = int(tail) if tail.isdigit() else int(parse_qs(url.query).get("page", ["1"])[0])
+                site.count("listing")
+                return self._send(200, site.listing(page))
+            if url.path.startswith("/job/"):
+                site.count("detail")
+                return self._send(200, site.detail(url.path))
+            self._send(404, "Not found")
+
+        def do_POST(self):
+            site.count("requests")
+            site.delay()
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length)
+            if urlparse(self.path).path != "/v1/store-job-api":
+                return self._send(404, "Not found")
+            if self._fault():
+                return
+            with site.lock:
+                site.posts.append((self.headers.get("Idempotency-Key"), json.loads(body or b"null")))
+            self._send(201, json.dumps({"status": "success"}), "application/json")
+
+    return StubHandler
+
+
+def start_stub(config, host="127.0.0.1", port=0):
+    """Start the stub in a background thread. Returns (server, site, base_url)."""
+    site = StubSite(config)
+    server = ThreadingHTTPServer((host, port), make_handler(site))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, site, f"http://{host}:{server.server_port}"
+
+
+def add_stub_arguments(parser):
+    parser.add_argument("--pages", type=int, default=10, help="listing pages with jobs")
+    parser.add_argument("--jobs-per-page", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="+/- random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 500/503 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on a 429")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args):
+    return StubConfig(args.pages, args.jobs_per_page, args.latency_ms, args.jitter_ms,
+                      args.error_rate, args.throttle_rate, args.retry_after, args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a local myjobmag + job API stand-in.")
+    parser.add_argument("--port", type=int, default=8765)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    server, site, base_url = start_stub(config_from_args(args), port=args.port)
+    print(f"🧪 Stub listening on {base_url}")
+    print(f"   SCRAPER_BASE_URL={base_url} API_BASE_URL={base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+jobau: job board scrapers and the Google Sheets / job API sinks they feed.
+
+Entry points (each also runnable through the top-level script of the same name):
+
+    python -m jobau.scraper       MyJobMag -> "AlumUnite Job Board" sheet
+    python -m jobau.scraperr      MyJobMag -> "MyJobMag_Jobs_Latest" sheet
+    python -m jobau.scraper_api   MyJobMag -> AlumUnite job API
+    python -m jobau.automate      AlumUnite stats -> Google Sheets
+    python -m jobau.daily_visit   AlumUnite daily users -> Google Sheets
+
+Heavy dependencies (pandas, gspread, google-auth) are imported and the
+Google client is authenticated only on the paths that write to Sheets, so
+--help, --dry-run and --parse-only start fast and need no credentials.
+"""
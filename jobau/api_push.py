@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Push jobs to the job board API: pooled, concurrent, optionally batched, safe to retry."""
+
+import hashlib
+import os
+import time
+
+import requests
+
+from . import metrics
+from .fetch import polite_post, run_concurrently
+from .seen_index import canonical_job_key
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# Requests to the API allowed in flight at the same time
+API_MAX_IN_FLIGHT = int(os.environ.get("SCRAPER_API_MAX_IN_FLIGHT", "4"))
+
+# Jobs per request. 1 posts one job object per request; above 1 posts a JSON
+# array of jobs - only enable it for endpoints that accept arrays
+API_BATCH_SIZE = int(os.environ.get("SCRAPER_API_BATCH_SIZE", "1"))
+
+# Retries for throttling, server errors and dropped connections
+API_MAX_RETRIES = int(os.environ.get("SCRAPER_API_MAX_RETRIES", "3"))
+API_RETRY_BACKOFF = 1.0  # seconds, doubled after every attempt
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def idempotency_key(job):
+    """
+    Deterministic key for a job, so a retried or re-run push is recognizable.
+
+    Built from the job's canonical URL, or from title + company when the job
+    has no URL.
+    """
+    url = job.get("Original URL") or job.get("Apply") or job.get("Apply Now")
+    identity = canonical_job_key(url) if url else f"{job.get('Title')}|{job.get('Company')}"
+    return "jobau-" + hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+
+
+def batch_key(keys):
+    """Idempotency key for a request carrying several jobs."""
+    if len(keys) == 1:
+        return keys[0]
+    return "jobau-batch-" + hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()[:32]
+
+
+def post_with_retries(endpoint, body, key, max_retries=API_MAX_RETRIES):
+    """POST one request body, retrying throttled/failed attempts under the same idempotency key."""
+    headers = {"Content-Type": "application/json", "Idempotency-Key": key}
+    delay = API_RETRY_BACKOFF
+    for attempt in range(max_retries + 1):
+        try:
+            response = polite_post(endpoint, json=body, headers=headers, timeout=30)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                return response
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+        time.sleep(delay)
+        delay *= 2
+
+
+def push_jobs(jobs, endpoint, to_payload, batch_size=None, max_in_flight=None, test_mode=False):
+    """
+    Push jobs to the API. Returns (successful, failed) job counts.
+
+    `to_payload` maps a job to its API payload. Requests run concurrently over
+    the shared session; each carries an Idempotency-Key header derived from
+    its jobs, so retries and re-runs don't create duplicates on a server that
+    honors it.
+    """
+    batch_size = max(1, batch_size or API_BATCH_SIZE)
+
+    # Build payloads up front so a mapping error only drops that job
+    prepared = []
+    failed = 0
+    for job in jobs:
+        try:
+            with metrics.timed("map"):
+                payload = to_payload(job)
+            prepared.append((job, payload, idempotency_key(job)))
+        except Exception as e:
+            print(f"   ❌ Exception preparing {job.get('Title')}: {e}")
+            failed += 1
+
+    if test_mode:
+        for job, payload, key in prepared:
+            print(f"   🧪 TEST MODE - Would send:")
+            print(f"      Title: {payload['title']}")
+            print(f"      Company: {payload['company']}")
+            print(f"      Location: {payload['location']}")
+            print(f"      Job Type: {payload['job_type']}")
+        return len(prepared), failed
+
+    batches = [prepared[i:i + batch_size] for i in range(0, len(prepared), batch_size)]
+
+    def send(batch):
+        body = batch[0][1] if batch_size == 1 else [payload for _, payload, _ in batch]
+        with metrics.timed("push", items=len(batch)) as call:
+            response = post_with_retries(endpoint, body, batch_key([key for _, _, key in batch]))
+            call["bytes"] = len(response.request.body or b"")
+            call["error"] = response.status_code not in (200, 201)
+        return response
+
+    successful = 0
+    results = run_concurrently(send, batches, max_in_flight=max_in_flight or API_MAX_IN_FLIGHT)
+    for batch, response, error in results:
+        titles = ", ".join(str(job.get("Title")) for job, _, _ in batch)
+        if error:
+            print(f"   ❌ Exception posting {titles}: {error}")
+            failed += len(batch)
+        elif response.status_code in [200, 201]:
+            print(f"   ✅ Successfully posted: {titles}")
+            successful += len(batch)
+        else:
+            print(f"   ❌ API Error ({response.status_code}): {titles}")
+            print(f"      Response: {response.text[:200]}")
+            failed += len(batch)
+    return successful, failed
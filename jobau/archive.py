@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only archive of every fetched page, and offline replay from it.
+
+Each GET answered by the network (listing and detail pages alike) is
+appended to the current segment file as one zlib-compressed entry holding
+its URL, status, headers and body; pages the HTTP cache serves (fresh hits
+and 304 revalidations) are added too when the archive has no copy yet. A
+SQLite index maps URLs to (segment, offset, length). Segments are never
+rewritten; a new one is started once the current one reaches SEGMENT_BYTES.
+
+Retention works on whole segments: at the end of a run, segments whose
+newest entry is older than MAX_AGE_SECONDS are deleted, then the oldest
+ones until the archive fits in MAX_BYTES (the newest segment is kept).
+
+In replay mode (--replay) polite_get answers from the archive instead of
+the network: segments are memory-mapped and each page is one slice plus
+a decompress, so re-running the extractor over thousands of archived
+pages is CPU-bound and works offline. A replay always runs as a dry run:
+nothing is written to Google Sheets or posted to the job API.
+
+    python -m jobau.archive            # archive summary
+    python -m jobau.archive --reindex  # rebuild the index from the segments
+    python -m jobau.archive --prune    # apply the retention limits now
+"""
+
+import glob
+import json
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+ARCHIVE_DIR = os.environ.get("SCRAPER_ARCHIVE_DIR", ".scraper_archive")
+
+# Set SCRAPER_ARCHIVE=0 to stop archiving fetched pages
+ARCHIVE_ENABLED = os.environ.get("SCRAPER_ARCHIVE", "1") != "0"
+
+# Start a new segment file once the current one is this big
+SEGMENT_BYTES = int(os.environ.get("SCRAPER_ARCHIVE_SEGMENT_MB", "64")) * 1024 * 1024
+
+# Delete segments whose newest page is older than this...
+MAX_AGE_SECONDS = int(os.environ.get("SCRAPER_ARCHIVE_MAX_AGE_DAYS", "30")) * 24 * 3600
+
+# ...and then the oldest segments until the archive is at most this big
+MAX_BYTES = int(os.environ.get("SCRAPER_ARCHIVE_MAX_MB", "512")) * 1024 * 1024
+
+# Response headers worth keeping with the body
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+# Every entry: magic + payload length, then the compressed payload
+ENTRY_HEADER = struct.Struct(">4sI")
+ENTRY_MAGIC = b"JBA1"
+
+
+def _segment_name(number):
+    return f"segment-{number:05d}.jba"
+
+
+class Archive:
+    """Compressed, append-only segment files plus a SQLite index of their entries."""
+
+    def __init__(self, directory, segment_bytes=SEGMENT_BYTES):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.lock = threading.Lock()
+        self.stats = {"archived": 0, "replayed": 0, "missing": 0}
+        self.conn = sqlite3.connect(os.path.join(directory, "index.sqlite"), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT NOT NULL,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                status INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS pages_url ON pages (url)")
+        self.conn.commit()
+        self._writer = None
+        self._segment = None
+        self._maps = {}
+
+    # ---------- writes ----------
+    def _open_writer(self, size):
+        """The segment file to append an entry of `size` bytes to, rotating when full."""
+        if self._writer and self._writer.tell() + size > self.segment_bytes and self._writer.tell():
+            self._writer.close()
+            self._writer = None
+        if self._writer is None:
+            existing = sorted(glob.glob(os.path.join(self.directory, "segment-*.jba")))
+            number = int(os.path.basename(existing[-1])[8:13]) if existing else 0
+            if existing and os.path.getsize(existing[-1]) + size > self.segment_bytes:
+                number += 1
+            self._segment = _segment_name(number)
+            self._writer = open(os.path.join(self.directory, self._segment), "ab")
+        return self._writer
+
+    def record(self, url, response):
+        """Append one response (status, kept headers, body) to the archive."""
+        meta = {
+            "url": url,
+            "final_url": response.url,
+            "status": response.status_code,
+            "headers": {k: response.headers[k] for k in KEPT_HEADERS if k in response.headers},
+            "encoding": response.encoding,
+            "fetched_at": time.time(),
+        }
+        payload = zlib.compress(json.dumps(meta).encode("utf-8") + b"\n" + response.content)
+        entry = ENTRY_HEADER.pack(ENTRY_MAGIC, len(payload)) + payload
+        with self.lock:
+            writer = self._open_writer(len(entry))
+            offset = writer.tell() + ENTRY_HEADER.size
+            writer.write(entry)
+            writer.flush()
+            self.conn.execute(
+                "INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (url, self._segment, offset, len(payload), meta["status"], meta["fetched_at"]),
+            )
+            self.conn.commit()
+            self.stats["archived"] += 1
+
+    # ---------- reads ----------
+    def _map(self, segment):
+        """Memory-map a segment file (once) for reading."""
+        mapped = self._maps.get(segment)
+        if mapped is None:
+            with open(os.path.join(self.directory, segment), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def read(self, segment, offset, length):
+        """Decode one entry into (meta, body)."""
+        with self.lock:
+            mapped = self._map(segment)
+        meta, _, body = zlib.decompress(mapped[offset:offset + length]).partition(b"\n")
+        return json.loads(meta), body
+
+    def contains(self, url):
+        """True if the URL has an archived entry."""
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM pages WHERE url = ? LIMIT 1", (url,)).fetchone()
+        return row is not None
+
+    def lookup(self, url):
+        """The latest archived (meta, body) for a URL, or None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT segment, offset, length FROM pages WHERE url = ? ORDER BY rowid DESC LIMIT 1",
+                (url,),
+            ).fetchone()
+        return self.read(*row) if row else None
+
+    def response(self, url):
+        """The latest archived response for a URL, rebuilt as a requests.Response (404 if absent)."""
+        entry = self.lookup(url)
+        response = requests.Response()
+        response.url = url
+        if entry is None:
+            self.stats["missing"] += 1
+            response.status_code = 404
+            response.reason = "Not in archive"
+            response._content = b""
+            return response
+        meta, body = entry
+        self.stats["replayed"] += 1
+        response.status_code = meta["status"]
+        response.url = meta.get("final_url") or url
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = meta["encoding"]
+        response._content = body
+        return response
+
+    # ---------- maintenance ----------
+    def iter_segment(self, segment):
+        """Yield (offset, length) of every entry in a segment, stopping at a torn tail."""
+        mapped = self._map(segment)
+        position = 0
+        while position + ENTRY_HEADER.size <= len(mapped):
+            magic, length = ENTRY_HEADER.unpack_from(mapped, position)
+            start = position + ENTRY_HEADER.size
+            if magic != ENTRY_MAGIC or start + length > len(mapped):
+                break
+            yield start, length
+            position = start + length
+
+    def reindex(self):
+        """Rebuild the index by scanning every segment. Returns the number of entries."""
+        segments = self._segments()
+        rows = []
+        for segment in segments:
+            if not os.path.getsize(os.path.join(self.directory, segment)):
+                continue
+            for offset, length in self.iter_segment(segment):
+                meta, _ = self.read(segment, offset, length)
+                rows.append((meta["url"], segment, offset, length, meta["status"], meta["fetched_at"]))
+        with self.lock:
+            self.conn.execute("DELETE FROM pages")
+            self.conn.executemany("INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.conn.commit()
+        return len(rows)
+
+    def _segments(self):
+        return sorted(os.path.basename(path) for path in glob.glob(os.path.join(self.directory, "segment-*.jba")))
+
+    def prune(self, max_age_seconds=MAX_AGE_SECONDS, max_bytes=MAX_BYTES):
+        """Delete whole segments past the age and size limits, newest kept. Returns segments removed."""
+        with self.lock:
+            if self._writer:
+                self._writer.close()
+                self._writer = None
+            segments = self._segments()
+            newest = dict(self.conn.execute("SELECT segment, MAX(fetched_at) FROM pages GROUP BY segment"))
+            sizes = {segment: os.path.getsize(os.path.join(self.directory, segment)) for segment in segments}
+            cutoff = time.time() - max_age_seconds
+            total = sum(sizes.values())
+
+            victims = []
+            for segment in segments[:-1]:
+                if newest.get(segment, 0) < cutoff or total > max_bytes:
+                    victims.append(segment)
+                    total -= sizes[segment]
+
+            for segment in victims:
+                mapped = self._maps.pop(segment, None)
+                if mapped is not None:
+                    mapped.close()
+                os.remove(os.path.join(self.directory, segment))
+            self.conn.executemany("DELETE FROM pages WHERE segment = ?", [(segment,) for segment in victims])
+            self.conn.commit()
+        return len(victims)
+
+    def summary(self):
+        """(entries, distinct URLs, segment count, bytes on disk)."""
+        with self.lock:
+            entries, urls = self.conn.execute("SELECT COUNT(*), COUNT(DISTINCT url) FROM pages").fetchone()
+        paths = glob.glob(os.path.join(self.directory, "segment-*.jba"))
+        return entries, urls, len(paths), sum(os.path.getsize(path) for path in paths)
+
+    def print_stats(self):
+        if self.stats["archived"]:
+            print(f"\n🗄️  Archive: {self.stats['archived']} pages archived to {self.directory}")
+        if self.stats["replayed"] or self.stats["missing"]:
+            print(f"\n🗄️  Replay: {self.stats['replayed']} pages from {self.directory}, "
+                  f"{self.stats['missing']} not in the archive")
+
+    def close(self):
+        with self.lock:
+            if self._writer:
+                self._writer.close()
+                self._writer = None
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+            self.conn.close()
+
+
+# --------------------------------------------
+# SHARED INSTANCE
+# --------------------------------------------
+_archive = None
+_replay = False
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """Return the process-wide archive, or None when archiving is off and not replaying."""
+    global _archive
+    if not (ARCHIVE_ENABLED or _replay):
+        return None
+    with _archive_lock:
+        if _archive is None:
+            _archive = Archive(ARCHIVE_DIR)
+        return _archive
+
+
+def enable_replay(directory=None):
+    """Serve every polite GET from the archive instead of the network, for the rest of the run."""
+    global ARCHIVE_DIR, _replay
+    if directory:
+        ARCHIVE_DIR = directory
+    if not os.path.exists(os.path.join(ARCHIVE_DIR, "index.sqlite")):
+        raise FileNotFoundError(f"No page archive in {ARCHIVE_DIR}")
+    _replay = True
+    print(f"🗄️  Replaying pages from {ARCHIVE_DIR} (no network)")
+
+
+def replaying():
+    """True when pages come from the archive (--replay)."""
+    return _replay
+
+
+def archive_response(url, response):
+    """Archive a response fetched from the network (no-op when archiving is off)."""
+    archive = get_archive()
+    if archive and not _replay and response.status_code != 304:
+        archive.record(url, response)
+
+
+def archive_cached(url, response):
+    """
+    Archive a page the HTTP cache served (fresh hit or 304), unless the archive already has it.
+
+    The cached body is the one archived when it was downloaded, so it is
+    only added for URLs the archive lacks (e.g. cached before archiving
+    was on, or whose segment was pruned), and replay finds every page.
+    """
+    archive = get_archive()
+    if archive and not _replay and not archive.contains(url):
+        archive.record(url, response)
+
+
+def replay_get(url):
+    """The archived response for a URL."""
+    return get_archive().response(url)
+
+
+def close_archive():
+    """Apply the retention limits, report and close the shared archive at the end of a run."""
+    global _archive
+    with _archive_lock:
+        if _archive is not None:
+            _archive.print_stats()
+            if not _replay:
+                removed = _archive.prune()
+                if removed:
+                    print(f"🧹 Pruned {removed} old segments from the archive")
+            _archive.close()
+            _archive = None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect the raw page archive.")
+    parser.add_argument("--dir", default=ARCHIVE_DIR, help="archive directory")
+    parser.add_argument("--reindex", action="store_true", help="rebuild the index from the segment files")
+    parser.add_argument("--prune", action="store_true", help="delete segments past the retention limits")
+    args = parser.parse_args()
+
+    archive = Archive(args.dir)
+    if args.reindex:
+        print(f"🔁 Reindexed {archive.reindex()} entries")
+    if args.prune:
+        print(f"🧹 Pruned {archive.prune()} segments")
+    entries, urls, segments, size = archive.summary()
+    print(f"🗄️  {entries} entries for {urls} URLs in {segments} segments ({size / 1024 / 1024:.1f} MB)")
+    archive.close()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+
+from . import metrics
+from .cli import add_profile_argument
+from .google import open_spreadsheet
+from .profiling import start_profiling
+from .sheets import append_sink
+
+
+def save_to_google_sheet(df, sheet_name, worksheet_name, replace=True):
+    """Save job data to Google Sheets."""
+    import gspread
+    from gspread_dataframe import set_with_dataframe
+
+    sh = open_spreadsheet(sheet_name)
+
+    try:
+        worksheet = sh.worksheet(worksheet_name)
+    except gspread.exceptions.WorksheetNotFound:
+        worksheet = sh.add_worksheet(title=worksheet_name, rows=1000, cols=20)
+        print(f"➕ Created new worksheet: {worksheet_name}")
+
+    if replace:
+        with metrics.timed("sheet_write", items=len(df)):
+            worksheet.clear()
+            set_with_dataframe(worksheet, df)
+        print(f"✅ Worksheet '{worksheet_name}' replaced with latest data.")
+    else:
+        # Sheets append API: finds the last row itself, no need to read the sheet
+        append_sink(worksheet, df)
+        print("➕ New data appended.")
+
+    print(f"🔗 Google Sheet link: https://docs.google.com/spreadsheets/d/{sh.id}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Copy AlumUnite user and scholarship stats to Google Sheets.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="fetch the stats, but print them instead of writing to Google Sheets")
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    metrics.start_run("automate")
+    if args.profile:
+        start_profiling("automate", args.profile)
+
+    import pandas as pd
+
+    # Daily user
+    with metrics.timed("stats_fetch"):
+        user = pd.read_json("https://api.alumunite.co/v1/user-daily-count")['data']
+    user = pd.DataFrame(user.tolist())
+    user.columns = ['date', "new_signups"]
+    user['date'] = pd.to_datetime(user['date']).dt.strftime('%Y-%m-%d')
+    user['cum_new_signups'] =user['new_signups'].cumsum()
+
+    # Scholarship
+    with metrics.timed("stats_fetch"):
+        scholarship = pd.read_json("https://api.alumunite.co/v1/get-scholarship-fund" )['data']
+    scholarship = pd.DataFrame(scholarship.tolist())
+
+
+    configs = {
+        "scholarship": {
+            "df": scholarship,
+            "sheet_name": "Scholarship Submission",
+            "worksheet_name": "scholarship_submission"
+        },
+        "user": {
+            "df": user,
+            "sheet_name": "Daily User Data",
+            "worksheet_name": "Sheet1"
+        }
+    }
+
+    # Loop through and save
+    for cfg in configs.values():
+        if args.dry_run:
+            print(f"🧪 DRY RUN - {cfg['sheet_name']} / {cfg['worksheet_name']}:")
+            print(cfg["df"].head())
+            continue
+        save_to_google_sheet(
+            cfg["df"],
+            sheet_name=cfg["sheet_name"],
+            worksheet_name=cfg["worksheet_name"]
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Command-line flags shared by the scraper entry points."""
+
+import argparse
+import json
+from pathlib import Path
+
+from .archive import ARCHIVE_DIR
+from .profiling import PROFILE_DIR
+from .seen_index import FULL_CRAWL
+
+
+def build_parser(description, sink, full_crawl=False):
+    """
+    Argument parser with the common --dry-run, --replay, --parse-only and --profile flags.
+
+    With full_crawl, it also has --full-crawl, for scrapers that stop
+    paginating once the seen-jobs index knows every job on a page.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help=f"scrape and parse as usual, but print the jobs instead of writing to {sink}",
+    )
+    if full_crawl:
+        parser.add_argument(
+            "--full-crawl", action="store_true", default=FULL_CRAWL,
+            help="walk every listing page even when the seen-jobs index says the rest are known "
+                 "(default from SCRAPER_FULL_CRAWL)",
+        )
+    parser.add_argument(
+        "--replay", nargs="?", const=ARCHIVE_DIR, metavar="ARCHIVE_DIR",
+        help="run the whole pipeline from the page archive instead of the network (implies --dry-run)",
+    )
+    parser.add_argument(
+        "--parse-only", nargs="+", metavar="HTML",
+        help="parse saved detail pages offline and print their records as JSON",
+    )
+    add_profile_argument(parser)
+    return parser
+
+
+def add_profile_argument(parser):
+    parser.add_argument(
+        "--profile", nargs="?", const=PROFILE_DIR, metavar="PROFILE_DIR",
+        help="sample CPU and memory per pipeline stage and write flame graph stacks and a report",
+    )
+
+
+def print_parsed(paths, parse_job_details):
+    """Parse saved detail pages with a scraper's parse_job_details and print the records."""
+    for path in paths:
+        html = Path(path).read_text(encoding="utf-8")
+        record = parse_job_details(html, Path(path).resolve().as_uri())
+        print(json.dumps(dict(record), ensure_ascii=False, indent=2))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+
+from . import metrics
+from .cli import add_profile_argument
+from .google import open_spreadsheet
+from .profiling import start_profiling
+from .sheets import append_sink
+
+
+def save_to_google_sheet(df, sheet_name="Daily User Data", replace=True):
+    from gspread_dataframe import set_with_dataframe
+
+    sh = open_spreadsheet(sheet_name)
+
+    try:
+        worksheet = sh.get_worksheet(0)
+    except IndexError:
+        worksheet = sh.add_worksheet(title="User_visits", rows=1000, cols=20)
+
+    if replace:
+        with metrics.timed("sheet_write", items=len(df)):
+            worksheet.clear()
+            set_with_dataframe(worksheet, df)
+        print("✅ Sheet replaced with latest visits.")
+    else:
+        # Sheets append API: finds the last row itself, no need to read the sheet
+        append_sink(worksheet, df)
+        print("➕ New visit data appended.")
+
+    print(f"🔗 Google Sheet link: https://docs.google.com/spreadsheets/d/{sh.id}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Copy AlumUnite daily sign-ups to Google Sheets.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="fetch the sign-ups, but print them instead of writing to Google Sheets")
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    metrics.start_run("daily_visit")
+    if args.profile:
+        start_profiling("daily_visit", args.profile)
+
+    import pandas as pd
+
+    with metrics.timed("stats_fetch", items=2):
+        dat = pd.read_json("https://api.alumunite-staging.com/v1/user-daily-count" )['data']
+        df = pd.read_json("https://api.alumunite.co/v1/user-daily-count")['data']
+
+    dat = pd.DataFrame(dat.tolist())
+    df = pd.DataFrame(df.tolist())
+
+    # df = pd.merge(dat, data, on='date', how='inner')
+    df.columns = ['date', "new_signups"]
+
+    # Convert the 'date' column to datetime objects
+    df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+    df['cum_new_signups'] = df['new_signups'].cumsum()
+    if args.dry_run:
+        print("🧪 DRY RUN - Daily User Data:")
+        print(df.head())
+        return
+    save_to_google_sheet(df)
+
+
+if __name__ == "__main__":
+    main()
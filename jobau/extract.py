@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+Single-pass extraction engine for declarative field schemas.
+
+A schema is a list of `Field`s. `Plan` compiles the fields an entry point
+needs - their CSS selectors, regexes and post-processors - once, and then
+extracts every field from one traversal of each parsed page.
+
+Supported selectors: tag, `.class`, `#id`, `[attr]`, `[attr=value]`,
+`[attr*=value]` and `:first-of-type`, joined by the descendant combinator
+(`div.job-details-section p:first-of-type`), or comma groups of
+single-element selectors (`h2, h3`).
+"""
+
+import re
+
+from bs4 import NavigableString, Tag
+
+from .records import record_layout
+
+_SIMPLE_TOKEN = re.compile(
+    r"\.([\w-]+)"                                  # .class
+    r"|#([\w-]+)"                                  # #id
+    r"|\[([\w-]+)(?:(\*?=)['\"]?([^'\"\]]*)['\"]?)?\]"  # [attr], [attr=v], [attr*=v]
+    r"|(:first-of-type)"
+)
+_TAG_NAME = re.compile(r"^([a-zA-Z][\w-]*|\*)?")
+
+
+def _attr_text(node, attr):
+    value = node.attrs.get(attr)
+    if isinstance(value, list):
+        return " ".join(value)
+    return value
+
+
+def _compile_simple(text):
+    """Compile one simple selector (e.g. `div.job-summary`) into (tag name or None, predicate)."""
+    tag_name = _TAG_NAME.match(text).group(1)
+    rest = text[len(tag_name or ""):]
+    checks = []
+    position = 0
+    for match in _SIMPLE_TOKEN.finditer(rest):
+        if match.start() != position:
+            raise ValueError(f"Unsupported selector: {text!r}")
+        position = match.end()
+        cls, node_id, attr, op, value, first_of_type = match.groups()
+        if cls:
+            checks.append(lambda n, c=cls: c in (n.attrs.get("class") or ()))
+        elif node_id:
+            checks.append(lambda n, v=node_id: n.attrs.get("id") == v)
+        elif attr and not op:
+            checks.append(lambda n, a=attr: a in n.attrs)
+        elif attr and op == "=":
+            checks.append(lambda n, a=attr, v=value: _attr_text(n, a) == v)
+        elif attr:
+            checks.append(lambda n, a=attr, v=value: v in (_attr_text(n, a) or ""))
+        elif first_of_type:
+            checks.append(lambda n: n.find_previous_sibling(n.name) is None)
+    if position != len(rest):
+        raise ValueError(f"Unsupported selector: {text!r}")
+
+    if tag_name == "*":
+        tag_name = None
+    if not checks:
+        return tag_name, None
+    if len(checks) == 1:
+        return tag_name, checks[0]
+    return tag_name, lambda n: all(check(n) for check in checks)
+
+
+class Selector:
+    """A compiled selector: simple selectors matched during the walk, plus descendant steps."""
+
+    def __init__(self, css):
+        self.css = css
+        alternatives = [part.strip() for part in css.split(",")]
+        if len(alternatives) > 1:
+            # Comma groups: each alternative is a single simple selector
+            self.heads = [_compile_simple(alt) for alt in alternatives]
+            self.tails = []
+        else:
+            steps = css.split()
+            self.heads = [_compile_simple(steps[0])]
+            self.tails = [_compile_simple(step) for step in steps[1:]]
+
+    @staticmethod
+    def _matcher(tag_name, predicate):
+        if predicate is None:
+            return lambda n: isinstance(n, Tag) and (tag_name is None or n.name == tag_name)
+        return lambda n: isinstance(n, Tag) and (tag_name is None or n.name == tag_name) and predicate(n)
+
+    def resolve(self, heads, first):
+        """Apply the descendant steps to the matched heads; matches come back in document order."""
+        if not self.tails:
+            return heads[:1] if first else heads
+        nodes = heads
+        for index, (tag_name, predicate) in enumerate(self.tails):
+            last_step = index == len(self.tails) - 1
+            matcher = self._matcher(tag_name, predicate)
+            found, seen = [], set()
+            for node in nodes:
+                if first and last_step:
+                    hit = node.find(matcher)
+                    if hit is not None:
+                        return [hit]
+                    continue
+                for hit in node.find_all(matcher):
+                    if id(hit) not in seen:
+                        seen.add(id(hit))
+                        found.append(hit)
+            nodes = found
+        return [] if first else nodes
+
+
+class Field:
+    """
+    One extractable value.
+
+    select:   CSS selector, or a priority list of them (the first selector with a match wins)
+    all:      pass every match to `extract` instead of only the first
+    extract:  callable(node_or_nodes, record) -> value; default is the node's text
+    text:     keyword arguments for get_text() when `extract` is not given
+    source:   "page_text" for the whole page text (what soup.get_text(" ", strip=True) gives)
+    derive:   callable(record) -> value computed from other fields
+    needs:    fields and context keys that `extract`/`derive` read from the record
+    regex:    compiled pattern searched in the value; group 1 (stripped) becomes the value
+    post:     callables applied to the value in order
+    fallback: field used when the value is empty
+    """
+
+    def __init__(self, name, select=None, all=False, extract=None, text=None, source=None,
+                 derive=None, needs=(), regex=None, post=(), fallback=None):
+        self.name = name
+        self.selectors = [select] if isinstance(select, str) else list(select or [])
+        self.all = all
+        self.extract = extract
+        self.text = text or {}
+        self.source = source
+        self.derive = derive
+        self.needs = tuple(needs) + ((fallback,) if fallback else ())
+        self.regex = regex
+        self.post = tuple(post)
+        self.fallback = fallback
+
+
+class Record:
+    """Lazily computed field values for one page; fields are evaluated on first access."""
+
+    def __init__(self, plan, matches, strings, context):
+        self.plan = plan
+        self.matches = matches
+        self.strings = strings
+        self.values = dict(context)
+
+    def __getitem__(self, name):
+        if name not in self.values:
+            self.values[name] = self.plan.evaluate(self.plan.fields[name], self)
+        return self.values[name]
+
+
+class Plan:
+    """
+    A schema compiled for one projection of output columns.
+
+    `columns` maps each output column to a field name or a context key (such
+    as "job_url"). Only the fields those columns depend on are compiled and
+    extracted.
+    """
+
+    def __init__(self, fields, columns, context_keys=("job_url", "page_url")):
+        self.fields = {field.name: field for field in fields}
+        self.columns = dict(columns)
+        self.layout = record_layout(self.columns)
+        self.context_keys = set(context_keys)
+
+        needed = []
+        pending = list(self.columns.values())
+        while pending:
+            name = pending.pop()
+            if name in self.context_keys or name in needed:
+                continue
+            if name not in self.fields:
+                raise KeyError(f"Unknown field in extraction plan: {name!r}")
+            needed.append(name)
+            pending.extend(self.fields[name].needs)
+
+        # Compile every selector once and index its heads by tag name for the walk
+        self.selectors = {}
+        self.by_tag = {}
+        self.any_tag = []
+        self.needs_text = False
+        for name in needed:
+            field = self.fields[name]
+            self.needs_text = self.needs_text or field.source == "page_text"
+            for css in field.selectors:
+                if css in self.selectors:
+                    continue
+                selector = self.selectors[css] = Selector(css)
+                for tag_name, predicate in selector.heads:
+                    target = self.by_tag.setdefault(tag_name, []) if tag_name else self.any_tag
+                    target.append((css, predicate))
+
+    # ---------- traversal ----------
+    def walk(self, soup):
+        """Visit every node once; return the head matches per selector and the page strings."""
+        matches = {css: [] for css in self.selectors}
+        strings = []
+        by_tag = self.by_tag
+        any_tag = self.any_tag
+        needs_text = self.needs_text
+        text_types = soup.interesting_string_types or soup.MAIN_CONTENT_STRING_TYPES
+        single_text_type = isinstance(text_types, type)
+
+        for node in soup.descendants:
+            if isinstance(node, NavigableString):
+                if not needs_text:
+                    continue
+                # Same string filter as soup.get_text(" ", strip=True)
+                node_type = type(node)
+                if (node_type is not text_types) if single_text_type else (node_type not in text_types):
+                    continue
+                text = node.strip()
+                if text:
+                    strings.append(text)
+                continue
+            if not isinstance(node, Tag):
+                continue
+
+            candidates = by_tag.get(node.name)
+            if candidates:
+                for css, predicate in candidates:
+                    if predicate is None or predicate(node):
+                        found = matches[css]
+                        # Comma groups can match the same node through two alternatives
+                        if not found or found[-1] is not node:
+                            found.append(node)
+            for css, predicate in any_tag:
+                if predicate is None or predicate(node):
+                    found = matches[css]
+                    if not found or found[-1] is not node:
+                        found.append(node)
+        return matches, strings
+
+    # ---------- evaluation ----------
+    def evaluate(self, field, record):
+        value = None
+        if field.selectors:
+            for css in field.selectors:
+                nodes = self.selectors[css].resolve(record.matches[css], first=not field.all)
+                if not nodes:
+                    continue
+                target = nodes if field.all else nodes[0]
+                if field.extract:
+                    value = field.extract(target, record)
+                else:
+                    value = target.get_text(**field.text)
+                break
+        elif field.source == "page_text":
+            value = " ".join(record.strings)
+        elif field.derive:
+            value = field.derive(record)
+
+        if field.regex is not None and value is not None:
+            match = field.regex.search(value)
+            value = match.group(1).strip() if match else None
+        for post in field.post:
+            value = post(value)
+        if not value and field.fallback:
+            value = record[field.fallback]
+        return value
+
+    def extract(self, soup, **context):
+        """Extract the projected columns from a parsed page as a JobRecord (see records.py)."""
+        matches, strings = self.walk(soup)
+        record = Record(self, matches, strings, context)
+        return self.layout.record([record[name] for name in self.columns.values()])
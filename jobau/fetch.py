@@ -0,0 +1,416 @@
+# -*- coding: utf-8 -*-
+"""Shared HTTP layer: pooled keep-alive session, adaptive per-host rate limiting and a concurrent fetch engine."""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+from .archive import archive_response, replay_get, replaying
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode "br" responses)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# Maximum number of requests allowed in flight at the same time
+MAX_IN_FLIGHT = int(os.environ.get("SCRAPER_MAX_IN_FLIGHT", "4"))
+
+# Requests-per-second budget for each rate-limited host
+REQUESTS_PER_SECOND = float(os.environ.get("SCRAPER_REQUESTS_PER_SECOND", "2"))
+
+# Default (connect, read) timeouts in seconds for every request
+DEFAULT_TIMEOUT = (10, 30)
+
+# Keep-alive pool sizing: hosts kept in the pool, connections kept per host
+POOL_HOSTS = 10
+POOL_CONNECTIONS_PER_HOST = max(MAX_IN_FLIGHT * 2, 10)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# Hosts we must be polite to (hosts not listed here are not rate limited);
+# SCRAPER_RATE_LIMITED_HOSTS takes a comma-separated list of host[:port]
+RATE_LIMITED_HOSTS = {
+    host.strip(): REQUESTS_PER_SECOND
+    for host in os.environ.get("SCRAPER_RATE_LIMITED_HOSTS", "www.myjobmag.com").split(",")
+    if host.strip()
+}
+
+# Adaptive (AIMD) control: concurrency and request rate start at the values
+# above, grow while the host answers quickly and are cut on 429/503 or when
+# latency stays high. Latency alone never cuts them below the values above;
+# only throttling does. Set SCRAPER_ADAPTIVE=0 to keep them fixed.
+ADAPTIVE = os.environ.get("SCRAPER_ADAPTIVE", "1") != "0"
+MAX_IN_FLIGHT_CEILING = int(os.environ.get("SCRAPER_MAX_IN_FLIGHT_CEILING", str(max(MAX_IN_FLIGHT * 4, 16))))
+MAX_REQUESTS_PER_SECOND = float(os.environ.get("SCRAPER_MAX_REQUESTS_PER_SECOND", str(REQUESTS_PER_SECOND * 2)))
+MIN_REQUESTS_PER_SECOND = 0.25
+BACKOFF_FACTOR = 0.5          # multiplicative decrease on throttling
+LATENCY_TOLERANCE = 2.0       # recent latency above this multiple of the baseline counts as congestion...
+LATENCY_SLACK = 0.05          # ...when it is also this many seconds above it (ignores jitter on fast hosts)
+CONGESTION_SAMPLES = 5        # ...for this many responses in a row
+BASELINE_WEIGHT = 0.05        # weight of each response in the slow-moving baseline latency
+THROTTLE_STATUSES = {429, 503}
+
+# Retries for throttled or dropped GETs (POSTs are never retried here)
+MAX_RETRIES = int(os.environ.get("SCRAPER_MAX_RETRIES", "4"))
+RETRY_BACKOFF = 1.0           # seconds, doubled per consecutive throttle
+MAX_RETRY_WAIT = 60.0
+
+
+# --------------------------------------------
+# SHARED SESSION
+# --------------------------------------------
+class TimeoutSession(requests.Session):
+    """Session that applies DEFAULT_TIMEOUT when a call does not pass one."""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide keep-alive session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = TimeoutSession()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_HOSTS,
+                pool_maxsize=max(POOL_CONNECTIONS_PER_HOST, MAX_IN_FLIGHT_CEILING),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+        return _session
+
+
+def connection_stats():
+    """
+    Per-host connection reuse statistics for the shared session.
+
+    Returns a dict of host -> {"requests", "connections", "reused"} where
+    `connections` counts new TCP/TLS connections opened for that host.
+    """
+    stats = {}
+    if _session is None:
+        return stats
+    for adapter in set(_session.adapters.values()):
+        for key in adapter.poolmanager.pools.keys():
+            pool = adapter.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            entry = stats.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+            entry["requests"] += pool.num_requests
+            entry["connections"] += pool.num_connections
+            entry["reused"] = entry["requests"] - entry["connections"]
+    return stats
+
+
+def print_connection_stats():
+    """Print the connection reuse summary for this run."""
+    stats = connection_stats()
+    if not stats:
+        return
+    print("\n🔌 Connection reuse:")
+    for host, entry in sorted(stats.items()):
+        print(f"   {host}: {entry['requests']} requests over "
+              f"{entry['connections']} connections ({entry['reused']} reused)")
+    print_adaptive_stats()
+
+
+# --------------------------------------------
+# RATE LIMITING
+# --------------------------------------------
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def set_rate(self, rate):
+        with self.lock:
+            self.rate = rate
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(host):
+    """Return the shared token bucket for a host, or None if it is not rate limited."""
+    rate = RATE_LIMITED_HOSTS.get(host)
+    if not rate:
+        return None
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(rate)
+        return _buckets[host]
+
+
+def wait_for_host(url):
+    """Block until the URL's host allows another request."""
+    bucket = get_bucket(urlparse(url).netloc)
+    if bucket:
+        bucket.acquire()
+
+
+# --------------------------------------------
+# ADAPTIVE CONCURRENCY (AIMD)
+# --------------------------------------------
+def retry_after_seconds(response):
+    """Seconds asked for by a Retry-After header (delta-seconds or HTTP date), or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveController:
+    """
+    Per-host AIMD controller for concurrency and request rate.
+
+    Every response that comes back fast raises the concurrency limit by
+    about one per window of requests and nudges the host's request rate up
+    towards its ceiling. A 429/503 or a dropped connection cuts both
+    multiplicatively and pauses the host for Retry-After (or an exponential
+    backoff) before anything else is sent.
+
+    Latency is compared against a slow-moving baseline: only when the recent
+    latency stays past LATENCY_TOLERANCE times the baseline for
+    CONGESTION_SAMPLES responses in a row are the limits cut, and then no
+    further than the configured starting values, so a jittery but healthy
+    host keeps its configured throughput.
+    """
+
+    def __init__(self, host, limit=None, bucket=None):
+        self.host = host
+        self.bucket = bucket
+        self.limit = float(limit or MAX_IN_FLIGHT)
+        self.min_limit = self.limit
+        self.min_rate = bucket.rate if bucket else None
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.backoff = RETRY_BACKOFF
+        self.baseline = None
+        self.latency = None
+        self.congested = 0
+        self.last_decrease = 0.0
+        self.throttled = 0
+        self.condition = threading.Condition()
+
+    @property
+    def rate(self):
+        return self.bucket.rate if self.bucket else None
+
+    def acquire(self):
+        """Block until the host is not paused and below its concurrency limit."""
+        with self.condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self.condition.wait(timeout=wait if wait > 0 else None)
+
+    def _decrease(self, now, throttled):
+        # At most one cut per round trip, so one burst of 429s isn't counted many times
+        if now - self.last_decrease < (self.latency or 0):
+            return
+        self.last_decrease = now
+        # Only the host saying so (429/503, dropped connections) goes below the configured limits
+        min_limit = 1.0 if throttled else self.min_limit
+        self.limit = max(min(min_limit, self.limit), self.limit * BACKOFF_FACTOR)
+        if self.bucket:
+            min_rate = MIN_REQUESTS_PER_SECOND if throttled else self.min_rate
+            self.bucket.set_rate(max(min(min_rate, self.bucket.rate), self.bucket.rate * BACKOFF_FACTOR))
+
+    def release(self, latency=None, throttled=False, retry_after=None):
+        """Record one finished request and adapt the limits."""
+        with self.condition:
+            now = time.monotonic()
+            self.in_flight -= 1
+            if throttled:
+                self.throttled += 1
+                self.congested = 0
+                self._decrease(now, throttled=True)
+                pause = retry_after if retry_after is not None else self.backoff
+                self.paused_until = max(self.paused_until, now + min(pause, MAX_RETRY_WAIT))
+                self.backoff = min(self.backoff * 2, MAX_RETRY_WAIT)
+            elif latency is not None:
+                self.backoff = RETRY_BACKOFF
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+                # The baseline follows slowly, so a lasting shift in the host's speed becomes the new normal
+                if self.baseline is None:
+                    self.baseline = latency
+                else:
+                    self.baseline += BASELINE_WEIGHT * (latency - self.baseline)
+                slow = (self.latency > self.baseline * LATENCY_TOLERANCE
+                        and self.latency > self.baseline + LATENCY_SLACK)
+                self.congested = self.congested + 1 if slow else 0
+                if self.congested >= CONGESTION_SAMPLES:
+                    self._decrease(now, throttled=False)
+                elif not slow:
+                    self.limit = min(MAX_IN_FLIGHT_CEILING, self.limit + 1 / self.limit)
+                    if self.bucket:
+                        ceiling = max(MAX_REQUESTS_PER_SECOND, RATE_LIMITED_HOSTS.get(self.host, 0))
+                        self.bucket.set_rate(min(ceiling, self.bucket.rate + 0.1 / self.bucket.rate))
+            self.condition.notify_all()
+
+
+_controllers = {}
+_controllers_lock = threading.Lock()
+
+
+def get_controller(host):
+    """Return the shared adaptive controller for a host."""
+    with _controllers_lock:
+        if host not in _controllers:
+            _controllers[host] = AdaptiveController(host, bucket=get_bucket(host))
+        return _controllers[host]
+
+
+def polite_request(method, url, retries=0, **kwargs):
+    """
+    Send a request over the shared session under the host's rate limit and adaptive controller.
+
+    Throttled (429/503) responses and dropped connections are retried up to
+    `retries` times, after the pause the controller imposes.
+    """
+    host = urlparse(url).netloc
+    controller = get_controller(host) if ADAPTIVE else None
+    for attempt in range(retries + 1):
+        if controller:
+            controller.acquire()
+        wait_for_host(url)
+        started = time.monotonic()
+        try:
+            response = get_session().request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            metrics.observe("http", time.monotonic() - started, error=True)
+            if controller:
+                controller.release(throttled=True)
+            if attempt == retries:
+                raise
+            if not controller:
+                time.sleep(RETRY_BACKOFF * 2 ** attempt)
+            continue
+
+        metrics.observe("http", time.monotonic() - started, nbytes=len(response.content),
+                        error=response.status_code >= 400)
+        throttled = response.status_code in THROTTLE_STATUSES
+        if throttled:
+            metrics.incr("http_throttled")
+        retry_after = retry_after_seconds(response) if throttled else None
+        if controller:
+            controller.release(time.monotonic() - started, throttled, retry_after)
+        if not throttled or attempt == retries:
+            return response
+        print(f"   ⏳ {host} answered {response.status_code}; retrying ({attempt + 1}/{retries})")
+        if not controller:
+            time.sleep(min(retry_after or RETRY_BACKOFF * 2 ** attempt, MAX_RETRY_WAIT))
+    return response
+
+
+def polite_get(url, **kwargs):
+    """
+    GET a URL politely, retrying throttled or dropped requests.
+
+    Responses are added to the page archive; in replay mode they come from
+    it instead, without touching the network.
+    """
+    if replaying():
+        return replay_get(url)
+    response = polite_request("GET", url, retries=MAX_RETRIES, **kwargs)
+    archive_response(url, response)
+    return response
+
+
+def polite_post(url, **kwargs):
+    """POST to a URL politely (never retried here; see api_push.py)."""
+    return polite_request("POST", url, **kwargs)
+
+
+def print_adaptive_stats():
+    """Print where each host's adaptive limits settled."""
+    if not _controllers:
+        return
+    print("\n📈 Adaptive limits:")
+    for host, controller in sorted(_controllers.items()):
+        rate = f", {controller.rate:.2f} req/s" if controller.rate else ""
+        latency = f", ~{controller.latency * 1000:.0f} ms" if controller.latency else ""
+        print(f"   {host}: {int(controller.limit)} in flight{rate}{latency}, "
+              f"{controller.throttled} throttled/failed")
+
+
+# --------------------------------------------
+# CONCURRENT FETCH ENGINE
+# --------------------------------------------
+def run_concurrently(func, items, max_in_flight=None):
+    """
+    Call `func(item)` for every item using a bounded thread pool.
+
+    Results are yielded in input order as (item, result, error) tuples, where
+    `error` is the exception raised by `func` (or None). At most
+    `max_in_flight` calls run at once, and items are consumed lazily so a
+    generator of items is never fully materialized ahead of the workers.
+    """
+    # With adaptive control the pool only caps concurrency; each host's controller gates it
+    max_in_flight = max_in_flight or (MAX_IN_FLIGHT_CEILING if ADAPTIVE else MAX_IN_FLIGHT)
+
+    def call(item):
+        try:
+            return func(item), None
+        except Exception as e:
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        pending = deque()
+        for item in items:
+            pending.append((item, pool.submit(call, item)))
+            if len(pending) >= max_in_flight * 2:
+                done_item, future = pending.popleft()
+                yield (done_item, *future.result())
+        while pending:
+            done_item, future = pending.popleft()
+            yield (done_item, *future.result())
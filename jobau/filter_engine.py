@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized job filters.
+
+`compile_filters()` turns the `filters` config from scraper_api.main() into
+an ordered list of column checks once. `JobFilter.evaluate()` runs them over
+a whole DataFrame of detailed jobs and returns a boolean mask plus, for each
+job, the reason of the first check it fails - in the same order and wording
+as the per-job should_send_job() had.
+
+`JobFilter.check()` runs the same rules on a single job dict, for callers
+that filter one job at a time; it needs neither pandas nor numpy, which
+are only imported once jobs are evaluated in bulk.
+
+Free-text columns (Description, Apply Now) are checked in one pass over
+the column's array. The rest are low-cardinality (a few dozen fields, job types and
+cities across thousands of jobs), so those checks run their predicate once
+per distinct value and broadcast the result back to the rows, instead of
+once per job.
+"""
+
+import copy
+
+from .records import to_frame
+
+PASSED = "Passed all filters"
+
+
+def _missing(value):
+    # NaN is the only float unequal to itself
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _lower(value):
+    """The old `(job_data.get(col) or "").lower()` for a cell value."""
+    if _missing(value) or not value:
+        return ""
+    return str(value).lower()
+
+
+def _as_list(value):
+    """Field/Industry value as a list of lowercase strings (handles strings or lists)."""
+    if isinstance(value, list):
+        return [str(item).lower() for item in value]
+    value = _lower(value)
+    return [value] if value else []
+
+
+def experience_years(exp):
+    """Rough years of experience from the Experience field (entry/junior 0, mid 2, senior 5)."""
+    exp = _lower(exp)
+    if 'entry' in exp or 'junior' in exp:
+        return 0
+    elif 'senior' in exp:
+        return 5
+    elif 'mid' in exp:
+        return 2
+    return 0
+
+
+def _column(frame, name):
+    """A column as-is, or all-missing if the jobs don't have it."""
+    import pandas as pd
+
+    if name in frame.columns:
+        return frame[name]
+    return pd.Series(None, index=frame.index, dtype=object)
+
+
+def by_value(columns, func):
+    """
+    Vectorize func(*row values) for low-cardinality columns.
+
+    The returned frame -> array function calls `func` once per distinct value
+    (or combination of values) and broadcasts the results back to the rows.
+    """
+    def apply(frame):
+        import numpy as np
+        import pandas as pd
+
+        if len(columns) == 1:
+            try:
+                codes, uniques = pd.factorize(_column(frame, columns[0]), use_na_sentinel=True)
+            except TypeError:
+                # Unhashable cells (e.g. lists) - evaluate row by row
+                return np.array([func(value) for value in _column(frame, columns[0])], dtype=object)
+            results = np.empty(len(uniques) + 1, dtype=object)
+            results[:-1] = [func(value) for value in uniques]
+            results[-1] = func(None)  # code -1 = missing
+            return results[codes]
+
+        keys = frame.reindex(columns=columns)
+        try:
+            codes = keys.groupby(columns, dropna=False, sort=False).ngroup().to_numpy()
+        except TypeError:
+            return np.array([func(*row) for row in keys.itertuples(index=False)], dtype=object)
+        uniques = keys.drop_duplicates()
+        results = np.empty(len(uniques), dtype=object)
+        results[:] = [func(*row) for row in uniques.itertuples(index=False)]
+        return results[codes]
+    return apply
+
+
+def per_row(column, func):
+    """Vectorize func(value) over a high-cardinality column in one pass over its array."""
+    import numpy as np
+
+    vectorized = np.frompyfunc(func, 1, 1)
+
+    def apply(frame):
+        return vectorized(_column(frame, column).to_numpy(dtype=object)).astype(bool)
+    return apply
+
+
+class JobFilter:
+    """
+    A compiled filters config: an ordered list of rules over job columns.
+
+    Each rule is a scalar predicate on a job's values for some columns.
+    `evaluate()` runs the rules vectorized over many jobs; `check()` runs
+    them directly on one job, without building a DataFrame.
+    """
+
+    def __init__(self, filters):
+        self.filters = filters
+        # Each rule: (columns, fails(*values) -> bool, reason str or reason(*values) -> str, per-value?)
+        self.rules = []
+        rule = self.rules.append
+
+        # Required fields
+        for field in filters.get('required_fields', []):
+            rule(([field],
+                  lambda value: _missing(value) or not value or (isinstance(value, str) and value.strip() == ""),
+                  f"Missing required field: {field}", False))
+
+        # Exclude email-based applications
+        rule((['Apply Now'], lambda url: _lower(url).startswith("mailto:") or "@" in _lower(url),
+              "Email-based application excluded", False))
+
+        allowed_industries = {industry.lower() for industry in filters.get('industries', [])}
+        if allowed_industries:
+            rule((['Field', 'Industry'],
+                  lambda field, industry: not allowed_industries.intersection(_as_list(field) + _as_list(industry)),
+                  lambda field, industry: f"Industry not in allowed list: {_as_list(field) + _as_list(industry)}",
+                  True))
+
+        blocked_industries = [industry.lower() for industry in filters.get('blocked_industries', [])]
+        if blocked_industries:
+            rule((['Field'], lambda field: any(blocked in _lower(field) for blocked in blocked_industries),
+                  lambda field: f"Industry is blocked: {_lower(field)}", True))
+
+        allowed_job_types = [job_type.lower() for job_type in filters.get('job_types', [])]
+        if allowed_job_types:
+            rule((['Job Type'], lambda job_type: not any(jt in _lower(job_type) for jt in allowed_job_types),
+                  lambda job_type: f"Job type not allowed: {_lower(job_type)}", True))
+
+        allowed_locations = [location.lower() for location in filters.get('locations', [])]
+        if allowed_locations:
+            rule((['City', 'State'],
+                  lambda city, state: not any(loc in f"{_lower(city)} {_lower(state)}" for loc in allowed_locations),
+                  "Location not in allowed list", True))
+
+        min_experience = filters.get('min_experience')
+        if min_experience:
+            rule((['Experience'], lambda exp: experience_years(exp) < min_experience,
+                  lambda exp: f"Experience level too low: {_lower(exp)}", True))
+
+        if filters.get('require_salary', False):
+            rule((['Salary'], lambda salary: _missing(salary) or not salary or salary == "Not specified",
+                  "Salary not specified", True))
+
+        self._checks = None
+
+    @property
+    def checks(self):
+        """
+        The rules vectorized: (fails(frame) -> bool array, reason str or reason(frame) -> str array).
+
+        Free-text columns run per row, low-cardinality ones once per distinct
+        value. Built on first use, so one-off check() calls don't pay for it.
+        """
+        if self._checks is None:
+            checks = []
+            for columns, fails, reason, per_value in self.rules:
+                if per_value:
+                    vectorized = by_value(columns, fails)
+                    if not isinstance(reason, str):
+                        reason = by_value(columns, reason)
+                else:
+                    vectorized = per_row(columns[0], fails)
+                checks.append((vectorized, reason))
+            self._checks = checks
+        return self._checks
+
+    # ---------- evaluation ----------
+    def evaluate(self, jobs):
+        """
+        Run every check over the jobs (a DataFrame, or a list of JobRecords or job dicts).
+
+        Returns (mask, reasons): a boolean Series that is True for jobs to
+        send, and a Series with each job's first failed check (or "Passed all
+        filters").
+        """
+        import numpy as np
+        import pandas as pd
+
+        frame = jobs if isinstance(jobs, pd.DataFrame) else to_frame(jobs)
+        index = frame.index
+        frame = frame.reset_index(drop=True)
+
+        passing = np.ones(len(frame), dtype=bool)
+        reasons = np.full(len(frame), PASSED, dtype=object)
+        for fails, reason in self.checks:
+            if not passing.any():
+                break
+            failed = np.asarray(fails(frame), dtype=bool) & passing
+            if not failed.any():
+                continue
+            rows = np.flatnonzero(failed)
+            if isinstance(reason, str):
+                reasons[rows] = reason
+            else:
+                # Messages quoting the job's values are only built for the rejected rows
+                reasons[rows] = reason(frame.iloc[rows])
+            passing &= ~failed
+
+        return pd.Series(passing, index=index), pd.Series(reasons, index=index, dtype=object)
+
+    def check(self, job_data):
+        """Filter one job (a dict or JobRecord). Returns (should_send, reason) like should_send_job."""
+        get = job_data.get
+        for columns, fails, reason, _ in self.rules:
+            values = tuple(map(get, columns))
+            if fails(*values):
+                return False, reason if isinstance(reason, str) else reason(*values)
+        return True, PASSED
+
+
+_last_compiled = (None, None)
+
+
+def compile_filters(filters):
+    """
+    Compile a filters config (see scraper_api.main) into a reusable JobFilter.
+
+    The last config compiled is remembered, so per-job callers passing the
+    same filters every time (should_send_job) compile them once.
+    """
+    global _last_compiled
+    config, job_filter = _last_compiled
+    if job_filter is None or config != filters:
+        # Compared against a copy, so a config edited in place is compiled afresh
+        job_filter = JobFilter(filters)
+        _last_compiled = (copy.deepcopy(filters), job_filter)
+    return job_filter
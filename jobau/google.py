@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Google Sheets client, authenticated on first use rather than at import."""
+
+import json
+import os
+
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+
+_client = None
+
+
+def get_gspread_client():
+    """
+    The shared gspread client, authorized on the first call.
+
+    Uses the service account in GOOGLE_CREDENTIALS (GitHub Actions), or
+    credentials.json when that is not set.
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    try:
+        creds_json = os.environ.get('GOOGLE_CREDENTIALS')
+        if creds_json:
+            creds = Credentials.from_service_account_info(json.loads(creds_json), scopes=SCOPES)
+        else:
+            creds = Credentials.from_service_account_file('credentials.json', scopes=SCOPES)
+        _client = gspread.authorize(creds)
+        print("✓ Google Sheets connected successfully")
+    except Exception as e:
+        print(f"✗ Failed to connect to Google Sheets: {e}")
+        raise
+    return _client
+
+
+def open_spreadsheet(sheet_name):
+    """Open a spreadsheet by name, creating it if it doesn't exist yet."""
+    import gspread
+
+    gc = get_gspread_client()
+    try:
+        sh = gc.open(sheet_name)
+        print(f"📘 Found existing Google Sheet: {sheet_name}")
+    except gspread.SpreadsheetNotFound:
+        sh = gc.create(sheet_name)
+        print(f"🆕 Created new Google Sheet: {sheet_name}")
+    return sh
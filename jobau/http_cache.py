@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""On-disk HTTP response cache with ETag / Last-Modified revalidation."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .archive import archive_cached, replaying
+from .fetch import polite_get
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# Directory restored/saved by the GitHub Actions cache step
+CACHE_DIR = os.environ.get("SCRAPER_CACHE_DIR", ".scraper_cache")
+CACHE_ENABLED = os.environ.get("SCRAPER_CACHE", "1") != "0"
+
+# Serve a cached page without contacting the server while it is this fresh
+FRESH_SECONDS = int(os.environ.get("SCRAPER_CACHE_FRESH_SECONDS", str(30 * 60)))
+
+# Forget entries that have not been fetched or revalidated for this long
+MAX_AGE_SECONDS = int(os.environ.get("SCRAPER_CACHE_MAX_AGE_DAYS", "7")) * 24 * 3600
+
+# Upper bound for stored (compressed) bodies; least recently used go first
+MAX_BYTES = int(os.environ.get("SCRAPER_CACHE_MAX_MB", "200")) * 1024 * 1024
+
+# Response headers worth keeping with the body
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class HttpCache:
+    """SQLite-backed store of response bodies, validators and parsed records per URL."""
+
+    def __init__(self, path, fresh_seconds=FRESH_SECONDS, max_age_seconds=MAX_AGE_SECONDS,
+                 max_bytes=MAX_BYTES):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.fresh_seconds = fresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.stats = {"fresh": 0, "revalidated": 0, "downloaded": 0}
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                parsed TEXT
+            )
+        """)
+        self.conn.commit()
+
+    # ---------- lookups ----------
+    def lookup(self, url):
+        """Return the stored entry for a URL as a dict, or None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, headers, encoding, body, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if not row:
+            return None
+        status, headers, encoding, body, fetched_at = row
+        if time.time() - fetched_at > self.max_age_seconds:
+            return None
+        return {
+            "status": status,
+            "headers": json.loads(headers),
+            "encoding": encoding,
+            "body": zlib.decompress(body),
+            "fetched_at": fetched_at,
+        }
+
+    def load_parsed(self, url, parser_key):
+        """Return the record previously parsed from this URL's body by `parser_key`, or None."""
+        with self.lock:
+            row = self.conn.execute("SELECT parsed FROM responses WHERE url = ?", (url,)).fetchone()
+        if not row or not row[0]:
+            return None
+        return json.loads(row[0]).get(parser_key)
+
+    # ---------- writes ----------
+    def store(self, url, response):
+        """Store a fresh 200 response, dropping any records parsed from the old body."""
+        headers = {k: response.headers[k] for k in KEPT_HEADERS if k in response.headers}
+        body = zlib.compress(response.content)
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+                (url, response.status_code, json.dumps(headers), response.encoding,
+                 body, len(body), now, now),
+            )
+            self.conn.commit()
+
+    def touch(self, url, revalidated=False):
+        """Mark an entry as used; a 304 also restarts its freshness window."""
+        now = time.time()
+        with self.lock:
+            if revalidated:
+                self.conn.execute(
+                    "UPDATE responses SET fetched_at = ?, last_used = ? WHERE url = ?",
+                    (now, now, url),
+                )
+            else:
+                self.conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (now, url))
+            self.conn.commit()
+
+    def save_parsed(self, url, parser_key, record):
+        """Remember the record `parser_key` extracted from the current body of a URL."""
+        with self.lock:
+            row = self.conn.execute("SELECT parsed FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            parsed = json.loads(row[0]) if row[0] else {}
+            parsed[parser_key] = dict(record)
+            self.conn.execute(
+                "UPDATE responses SET parsed = ? WHERE url = ?", (json.dumps(parsed), url)
+            )
+            self.conn.commit()
+
+    def prune(self):
+        """Apply the TTL and size-bounded LRU eviction policies. Returns rows removed."""
+        with self.lock:
+            cutoff = time.time() - self.max_age_seconds
+            removed = self.conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+
+            total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                rows = self.conn.execute(
+                    "SELECT url, size FROM responses ORDER BY last_used ASC"
+                ).fetchall()
+                victims = []
+                for url, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    victims.append((url,))
+                    total -= size
+                self.conn.executemany("DELETE FROM responses WHERE url = ?", victims)
+                removed += len(victims)
+
+            self.conn.commit()
+            if removed:
+                self.conn.execute("PRAGMA incremental_vacuum")
+        return removed
+
+    # ---------- HTTP ----------
+    def get(self, url, headers=None, **kwargs):
+        """
+        GET a URL through the cache.
+
+        Fresh entries are served without a request; older ones are revalidated
+        with If-None-Match / If-Modified-Since, so an unchanged page costs a
+        304. The returned response has `from_cache` set when the body came
+        from disk. Bodies served from disk go to the page archive too, so a
+        replay finds them.
+        """
+        entry = self.lookup(url)
+        if entry and time.time() - entry["fetched_at"] < self.fresh_seconds:
+            self.touch(url)
+            self.stats["fresh"] += 1
+            response = self._build_response(url, entry)
+            archive_cached(url, response)
+            return response
+
+        request_headers = dict(headers or {})
+        if entry:
+            if "ETag" in entry["headers"]:
+                request_headers["If-None-Match"] = entry["headers"]["ETag"]
+            if "Last-Modified" in entry["headers"]:
+                request_headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+
+        response = polite_get(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.touch(url, revalidated=True)
+            self.stats["revalidated"] += 1
+            response = self._build_response(url, entry)
+            archive_cached(url, response)
+            return response
+
+        response.from_cache = False
+        if response.status_code == 200:
+            self.store(url, response)
+            self.stats["downloaded"] += 1
+        return response
+
+    @staticmethod
+    def _build_response(url, entry):
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry["encoding"]
+        response._content = entry["body"]
+        response.from_cache = True
+        return response
+
+    def print_stats(self):
+        print(f"\n💾 HTTP cache: {self.stats['fresh']} fresh hits, "
+              f"{self.stats['revalidated']} revalidated (304), "
+              f"{self.stats['downloaded']} downloaded")
+
+    def close(self):
+        self.prune()
+        with self.lock:
+            self.conn.close()
+
+
+# --------------------------------------------
+# SHARED INSTANCE
+# --------------------------------------------
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Return the process-wide cache, or None when caching is disabled or replaying."""
+    global _cache
+    if not CACHE_ENABLED or replaying():
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache(os.path.join(CACHE_DIR, "http_cache.sqlite"))
+        return _cache
+
+
+def cached_get(url, **kwargs):
+    """GET through the shared cache (falls back to a plain polite GET when disabled)."""
+    cache = get_cache()
+    if cache is None:
+        response = polite_get(url, **kwargs)
+        response.from_cache = False
+        return response
+    return cache.get(url, **kwargs)
+
+
+def load_parsed(url, parser_key):
+    """Return a memoized parse of an unchanged page, or None."""
+    cache = get_cache()
+    return cache.load_parsed(url, parser_key) if cache else None
+
+
+def save_parsed(url, parser_key, record):
+    """Memoize the record parsed from a page's current body."""
+    cache = get_cache()
+    if cache:
+        cache.save_parsed(url, parser_key, record)
+
+
+def close_cache():
+    """Prune, report and close the shared cache at the end of a run."""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.print_stats()
+            _cache.close()
+            _cache = None
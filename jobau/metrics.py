@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+Per-stage run metrics: counts, bytes, errors and latency histograms.
+
+Stages time themselves with `timed()` (or `observe()` for timings taken
+elsewhere, e.g. in a parse worker) and bump named counters with `incr()`:
+
+    listing       one listing page fetched and parsed
+    detail_fetch  one detail page downloaded (or served from the cache)
+    parse         one detail page parsed into a record
+    filter        one chunk of records through the JobFilter
+    map           one job mapped to its API payload
+    push          one request to the job API
+    sheet_read    one read of a worksheet
+    sheet_write   one write to a worksheet
+    dataframe     one chunk of records turned into a DataFrame
+    stats_fetch   one AlumUnite stats download (automate.py, daily_visit.py)
+    http          every request sent by fetch.polite_request
+
+`start_run(script)` at the top of an entry point's main() writes, when the
+process exits, a JSON report to METRICS_DIR/<script>.json and, if
+SCRAPER_METRICS_TEXTFILE is set, the same numbers as a Prometheus textfile
+(for node_exporter's textfile collector). Set SCRAPER_METRICS=0 to turn
+the reports off; recording itself is cheap and always on.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+METRICS_ENABLED = os.environ.get("SCRAPER_METRICS", "1") != "0"
+METRICS_DIR = os.environ.get("SCRAPER_METRICS_DIR", ".scraper_metrics")
+# Path of the Prometheus textfile; unset writes none
+METRICS_TEXTFILE = os.environ.get("SCRAPER_METRICS_TEXTFILE")
+
+# Histogram bucket upper bounds in seconds (Prometheus "le" labels)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class StageMetrics:
+    """Calls, items, bytes, errors and a latency histogram for one stage."""
+
+    __slots__ = ("calls", "items", "bytes", "errors", "seconds", "max_seconds", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+        self.bytes = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # the last one is +Inf
+
+    def add(self, seconds, items, nbytes, error):
+        self.calls += 1
+        self.items += items
+        self.bytes += nbytes
+        self.errors += bool(error)
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def quantile(self, q):
+        """Estimate a latency quantile from the histogram (like Prometheus' histogram_quantile)."""
+        if not self.calls:
+            return None
+        rank = q * self.calls
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(BUCKETS + (self.max_seconds,), self.buckets):
+            if count and seen + count >= rank:
+                upper = min(bound, self.max_seconds)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.max_seconds
+
+    def as_dict(self):
+        cumulative, total = {}, 0
+        for bound, count in zip([str(b) for b in BUCKETS] + ["+Inf"], self.buckets):
+            total += count
+            cumulative[bound] = total
+        return {
+            "calls": self.calls,
+            "items": self.items,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "seconds_total": round(self.seconds, 6),
+            "seconds_mean": round(self.seconds / self.calls, 6) if self.calls else None,
+            "seconds_p50": _round(self.quantile(0.5)),
+            "seconds_p95": _round(self.quantile(0.95)),
+            "seconds_max": round(self.max_seconds, 6),
+            "histogram": cumulative,
+        }
+
+
+def _round(value):
+    return None if value is None else round(value, 6)
+
+
+_stages = {}
+_counters = {}
+_lock = threading.Lock()
+_run = {}
+# thread ident -> stage that thread is running now (read by the sampling profiler, profiling.py)
+_active = {}
+
+
+# --------------------------------------------
+# RECORDING
+# --------------------------------------------
+def observe(stage, seconds, items=1, nbytes=0, error=False):
+    """Record one call of a stage that took `seconds`."""
+    with _lock:
+        metrics = _stages.get(stage)
+        if metrics is None:
+            metrics = _stages[stage] = StageMetrics()
+        metrics.add(seconds, items, nbytes, error)
+
+
+@contextmanager
+def active_stage(stage):
+    """Mark the current thread as running `stage`, without recording a call."""
+    ident = threading.get_ident()
+    outer = _active.get(ident)
+    _active[ident] = stage
+    try:
+        yield
+    finally:
+        if outer is None:
+            _active.pop(ident, None)
+        else:
+            _active[ident] = outer
+
+
+def active_stages():
+    """{thread ident: stage} for the threads inside a stage right now."""
+    return dict(_active)
+
+
+@contextmanager
+def timed(stage, items=1):
+    """
+    Time the block as one call of `stage`.
+
+    Yields a dict whose "items", "bytes" and "error" the block may set; an
+    exception escaping the block counts as an error.
+    """
+    call = {"items": items, "bytes": 0, "error": False}
+    started = time.perf_counter()
+    try:
+        with active_stage(stage):
+            yield call
+    except BaseException:
+        call["error"] = True
+        raise
+    finally:
+        observe(stage, time.perf_counter() - started, call["items"], call["bytes"], call["error"])
+
+
+def incr(name, n=1):
+    """Add n to a named run counter (jobs reused, records skipped by the filter, ...)."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def snapshot():
+    """The metrics recorded so far: {"stages": {...}, "counters": {...}}."""
+    with _lock:
+        return {
+            "stages": {stage: metrics.as_dict() for stage, metrics in sorted(_stages.items())},
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+# --------------------------------------------
+# RUN REPORT
+# --------------------------------------------
+def start_run(script):
+    """Mark the start of an entry point's run and write its report when the process exits."""
+    if _run:
+        return
+    _run.update(script=script, started=time.time(), started_monotonic=time.monotonic())
+    if METRICS_ENABLED:
+        atexit.register(finish_run)
+
+
+def run_report():
+    """The JSON run report for the current run."""
+    finished = time.time()
+    report = {
+        "script": _run.get("script"),
+        "started": _isoformat(_run.get("started", finished)),
+        "finished": _isoformat(finished),
+        "wall_seconds": round(time.monotonic() - _run["started_monotonic"], 3) if _run else None,
+    }
+    report.update(snapshot())
+    return report
+
+
+def _isoformat(timestamp):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+def finish_run():
+    """Print the stage summary and write the JSON report (and Prometheus textfile)."""
+    report = run_report()
+    print_stage_summary(report)
+
+    os.makedirs(METRICS_DIR, exist_ok=True)
+    path = os.path.join(METRICS_DIR, f"{report['script']}.json")
+    _write_atomic(path, json.dumps(report, indent=2))
+    print(f"📝 Run report written to {path}")
+
+    if METRICS_TEXTFILE:
+        _write_atomic(METRICS_TEXTFILE, prometheus_text(report))
+        print(f"📝 Prometheus metrics written to {METRICS_TEXTFILE}")
+
+
+def _write_atomic(path, text):
+    # Readers (the textfile collector, an artifact upload) never see a half-written file
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def print_stage_summary(report):
+    if not report["stages"]:
+        return
+    print(f"\n⏱️  Stage timings ({report['wall_seconds']}s wall):")
+    for stage, m in report["stages"].items():
+        p50 = f"{m['seconds_p50'] * 1000:.0f}" if m["seconds_p50"] is not None else "-"
+        p95 = f"{m['seconds_p95'] * 1000:.0f}" if m["seconds_p95"] is not None else "-"
+        print(f"   {stage:<13}{m['calls']:>6} calls {m['items']:>7} items {m['seconds_total']:>9.2f}s "
+              f"p50 {p50:>5} ms  p95 {p95:>5} ms {m['bytes'] / 1024:>9.0f} KiB {m['errors']:>4} errors")
+
+
+def prometheus_text(report):
+    """The report in the Prometheus text exposition format."""
+    script = report["script"]
+    lines = []
+
+    def sample(name, labels, value):
+        label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in {"script": script, **labels}.items())
+        lines.append(f"{name}{{{label_text}}} {value}")
+
+    def metric(name, kind, help_text, samples):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            sample(name, labels, value)
+
+    stages = report["stages"]
+    lines.append("# HELP jobau_stage_seconds Time per call of each pipeline stage.")
+    lines.append("# TYPE jobau_stage_seconds histogram")
+    for stage, m in stages.items():
+        for bound, count in m["histogram"].items():
+            sample("jobau_stage_seconds_bucket", {"stage": stage, "le": bound}, count)
+        sample("jobau_stage_seconds_sum", {"stage": stage}, m["seconds_total"])
+        sample("jobau_stage_seconds_count", {"stage": stage}, m["calls"])
+
+    metric("jobau_stage_items_total", "counter", "Items handled by each pipeline stage.",
+           [({"stage": stage}, m["items"]) for stage, m in stages.items()])
+    metric("jobau_stage_bytes_total", "counter", "Bytes handled by each pipeline stage.",
+           [({"stage": stage}, m["bytes"]) for stage, m in stages.items()])
+    metric("jobau_stage_errors_total", "counter", "Failed calls of each pipeline stage.",
+           [({"stage": stage}, m["errors"]) for stage, m in stages.items()])
+    metric("jobau_events_total", "counter", "Run counters (jobs fetched, reused, skipped, ...).",
+           [({"name": name}, value) for name, value in report["counters"].items()])
+    metric("jobau_run_duration_seconds", "gauge", "Wall time of the last run.",
+           [({}, report["wall_seconds"])])
+    metric("jobau_run_finished_timestamp_seconds", "gauge", "When the last run finished.",
+           [({}, round(time.time()))])
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Detail-page pipeline with a process-pool parse stage.
+
+Fetcher threads (fetch.run_concurrently) download pages and hand the raw
+HTML bytes to a ProcessPoolExecutor, where the compiled extraction plan
+parses them off the GIL. Both stages have bounded windows, so a fast
+network never piles up unparsed pages, and records stream back in input
+order.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from . import metrics
+from .fetch import run_concurrently
+from .http_cache import cached_get, load_parsed, save_parsed
+from .parsers import make_soup
+from .schema import compile_plan
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# Parser processes; 0 or 1 parses in the main process
+PARSE_WORKERS = int(os.environ.get("SCRAPER_PARSE_WORKERS", str(os.cpu_count() or 1)))
+
+# Pages fetched or being parsed, waiting for their turn to be yielded, per worker
+PARSE_QUEUE_PER_WORKER = 2
+
+
+class RawPage:
+    """A downloaded detail page waiting to be parsed."""
+
+    __slots__ = ("job_url", "page_url", "content", "encoding")
+
+    def __init__(self, job_url, page_url, content, encoding):
+        self.job_url = job_url
+        self.page_url = page_url
+        self.content = content
+        self.encoding = encoding
+
+
+def fetch_page(job_url, parser_key, headers=None):
+    """Download a detail page, or return its memoized record when the page is unchanged."""
+    with metrics.timed("detail_fetch") as call:
+        response = cached_get(job_url, headers=headers)
+        call["bytes"] = len(response.content)
+    if response.from_cache:
+        metrics.incr("detail_cache_hits")
+        record = load_parsed(job_url, parser_key)
+        if record is not None:
+            return record
+    # Decode in the worker exactly as response.text would
+    encoding = response.encoding or response.apparent_encoding
+    return RawPage(job_url, response.url, response.content, encoding)
+
+
+# --------------------------------------------
+# PARSE STAGE (runs in the worker processes)
+# --------------------------------------------
+_plans = {}
+
+
+def parse_page(columns, content, encoding, job_url, page_url=None, backend=None):
+    """Parse one detail page with the plan compiled for `columns` (a tuple of column/field pairs)."""
+    plan = _plans.get(columns)
+    if plan is None:
+        plan = _plans[columns] = compile_plan(dict(columns))
+    html = str(content, encoding, errors="replace") if encoding else content
+    return plan.extract(make_soup(html, backend), job_url=job_url, page_url=page_url or job_url)
+
+
+def timed_parse_page(*args):
+    """parse_page, returning (record, seconds) so the main process can record the timing."""
+    started = time.perf_counter()
+    with metrics.active_stage("parse"):
+        record = parse_page(*args)
+    return record, time.perf_counter() - started
+
+
+# --------------------------------------------
+# PIPELINE
+# --------------------------------------------
+def _ready():
+    return True
+
+
+def _resolved(func=None, *args, record=None, error=None):
+    """A finished Future: func(*args) run inline, or a known record/error."""
+    future = Future()
+    try:
+        if error is not None:
+            raise error
+        future.set_result(func(*args) if func else record)
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def fetch_and_parse(jobs, columns, parser_key, headers=None, workers=None, reuse=None):
+    """
+    Fetch and parse the detail page of every job ({"link": ...} dicts).
+
+    Yields (job, record, error) in input order, as soon as each record is
+    ready. `columns` maps output columns to schema fields (a scraper's
+    DETAILS_COLUMNS); `parser_key` is its memoization key for parsed records.
+    `reuse(job)` may return an already known record to skip the download.
+    """
+    columns = tuple(columns.items())
+    workers = PARSE_WORKERS if workers is None else workers
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if pool:
+            # Start the workers before any fetcher thread exists, so they fork from a quiet process
+            pool.submit(_ready).result()
+        def fetch(job):
+            record = reuse(job) if reuse else None
+            return record if record is not None else fetch_page(job["link"], parser_key, headers)
+
+        fetched = run_concurrently(fetch, jobs)
+
+        # (job, future, parsed page size or False) in input order
+        pending = deque()
+        window = max(workers, 1) * PARSE_QUEUE_PER_WORKER
+        for job, page, error in fetched:
+            if error:
+                pending.append((job, _resolved(error=error), False))
+            elif isinstance(page, RawPage):
+                args = (columns, page.content, page.encoding, page.job_url, page.page_url)
+                future = pool.submit(timed_parse_page, *args) if pool else _resolved(timed_parse_page, *args)
+                pending.append((job, future, len(page.content)))
+            else:
+                pending.append((job, _resolved(record=page), False))
+
+            # Bounded: stop pulling pages until the oldest one is parsed
+            while len(pending) >= window:
+                yield _collect(*pending.popleft(), parser_key)
+
+        while pending:
+            yield _collect(*pending.popleft(), parser_key)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def _collect(job, future, parsed_size, parser_key):
+    """
+    Wait for one page's record and return (job, record, error), memoizing fresh parses.
+
+    `parsed_size` is the byte size of the page parsed for this job, or False
+    when the record was reused or the fetch failed.
+    """
+    try:
+        result = future.result()
+    except Exception as e:
+        if parsed_size is not False:
+            metrics.observe("parse", 0.0, nbytes=parsed_size, error=True)
+        return job, None, e
+    if parsed_size is False:
+        return job, result, None
+    record, seconds = result
+    metrics.observe("parse", seconds, nbytes=parsed_size)
+    save_parsed(job["link"], parser_key, record)
+    return job, record, None
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Pluggable HTML parser backends that all produce a BeautifulSoup tree for the extractors."""
+
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# "html.parser" (pure Python, default) or "lxml" (C tokenizer, somewhat faster)
+PARSER_BACKEND = os.environ.get("SCRAPER_PARSER", "html.parser")
+
+
+# Listing pages are only read for their job items and pagination links
+LISTING_STRAINER = SoupStrainer(["li", "ul"], class_=["job-list-li", "setPaginate"])
+
+
+# --------------------------------------------
+# BACKEND SELECTION
+# --------------------------------------------
+def _builder_for(backend):
+    if backend == "html.parser":
+        return {"features": "html.parser"}
+    if backend == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            raise RuntimeError("The 'lxml' parser backend needs `pip install lxml`")
+        return {"features": "lxml"}
+    raise ValueError(f"Unknown parser backend: {backend!r}")
+
+
+BACKENDS = ("html.parser", "lxml")
+
+
+def make_soup(markup, backend=None, **kwargs):
+    """Parse HTML with the selected backend (SCRAPER_PARSER by default)."""
+    return BeautifulSoup(markup, **_builder_for(backend or PARSER_BACKEND), **kwargs)
+
+
+def make_listing_soup(markup, backend=None):
+    """
+    Parse a listing page, materializing only li.job-list-li and ul.setPaginate.
+
+    Headers, footers, ads and scripts are tokenized but never turned into
+    tree nodes, so `select("li.job-list-li")` and
+    `select("ul.setPaginate li a")` work as on a full parse at a fraction of
+    the memory.
+    """
+    return make_soup(markup, backend, parse_only=LISTING_STRAINER)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming stages shared by the scrapers.
+
+    listing pages -> plan_stage -> detail_stage -> filter_stage -> chunked -> sink
+
+Every stage is a lazy generator, so detail pages start downloading as soon
+as the first listing page is parsed, and records reach the sink in chunks
+instead of after the whole crawl. The Google Sheets sinks live in sheets.py.
+"""
+
+import os
+import random
+
+from . import metrics
+from .parse_pool import fetch_and_parse
+from .records import JobRecord, as_record, record_layout
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# Records handed to a sink (DataFrame / Google Sheets write) at a time
+SINK_CHUNK_SIZE = int(os.environ.get("SCRAPER_SINK_CHUNK_SIZE", "100"))
+
+
+def plan_stage(job_pages, index, known):
+    """
+    Flatten listing pages into jobs, marking each page in the seen-jobs index.
+
+    Unchanged jobs' stored records are added to `known` (link -> record) as
+    their page goes by, for detail_stage to reuse instead of fetching.
+    """
+    for page_jobs in job_pages:
+        if index:
+            _, page_known = index.plan(page_jobs)
+            known.update(page_known)
+        yield from page_jobs
+
+
+def detail_stage(jobs, columns, parser_key, headers, known=None, index=None, stats=None):
+    """
+    Yield (job, details) in listing order, reusing `known` records and fetching the rest.
+
+    Details are JobRecords laid out by `columns`, including the ones reused
+    from the caches. Freshly fetched details are recorded in the seen-jobs
+    index; jobs whose page failed to download or parse are reported and
+    skipped. `stats`, if given, counts "fetched", "reused" and "failed" jobs.
+    """
+    known = {} if known is None else known
+    stats = {} if stats is None else stats
+    layout = record_layout(columns)
+    for key in ("fetched", "reused", "failed"):
+        stats.setdefault(key, 0)
+
+    results = fetch_and_parse(jobs, columns, parser_key, headers, reuse=lambda job: known.get(job["link"]))
+    for job, details, error in results:
+        if error:
+            stats["failed"] += 1
+            metrics.incr("jobs_failed")
+            print(f"❌ Error fetching {job['link']}: {error}")
+            continue
+        if job["link"] in known:
+            stats["reused"] += 1
+            metrics.incr("jobs_reused")
+        else:
+            stats["fetched"] += 1
+            metrics.incr("jobs_fetched")
+            print(f"🔍 Fetched job {stats['fetched']}: {job['title']}")
+            if index:
+                index.record_fetch(job, details)
+        if details:
+            yield job, as_record(details, layout)
+
+    if index:
+        print(f"♻️  Reused {stats['reused']} unchanged jobs from the seen-jobs index; "
+              f"fetched {stats['fetched']} new or changed jobs.")
+
+
+def filter_stage(records, job_filter, chunk_size=None):
+    """Yield the records that pass a compiled JobFilter, evaluating a chunk at a time."""
+    for chunk in chunked(records, chunk_size):
+        with metrics.timed("filter", items=len(chunk)):
+            mask, reasons = job_filter.evaluate(chunk)
+        passed = int(mask.sum())
+        metrics.incr("jobs_qualified", passed)
+        metrics.incr("jobs_skipped", len(chunk) - passed)
+        for details, should_send, reason in zip(chunk, mask, reasons):
+            if should_send:
+                yield details
+            else:
+                print(f"   ⏭️  Skipped {details.get('Title')}: {reason}")
+
+
+def unique(records):
+    """Drop records identical to one already yielded (like DataFrame.drop_duplicates)."""
+    seen = set()
+    for record in records:
+        key = record.values if isinstance(record, JobRecord) else tuple(record.items())
+        if key in seen:
+            continue
+        seen.add(key)
+        yield record
+
+
+def reservoir_sample(items, k):
+    """
+    Uniform random sample of up to k items from a stream, without holding the stream.
+
+    Returns (sample, number of items seen). Like random.sample(list(items), k),
+    every item is equally likely to be picked.
+    """
+    sample = []
+    count = 0
+    for count, item in enumerate(items, start=1):
+        if len(sample) < k:
+            sample.append(item)
+        else:
+            slot = random.randrange(count)
+            if slot < k:
+                sample[slot] = item
+    random.shuffle(sample)
+    return sample, count
+
+
+def chunked(items, size=None):
+    """Group an iterable into lists of at most `size` items."""
+    size = size or SINK_CHUNK_SIZE
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def print_sink(chunks, preview=5):
+    """Dry-run sink: report the records instead of writing them anywhere."""
+    rows = 0
+    for chunk in chunks:
+        for record in chunk:
+            if rows < preview:
+                print(f"   🧪 {record.get('Title')} - {record.get('Company')}")
+            rows += 1
+    print(f"🧪 DRY RUN - would write {rows} rows.")
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in CPU and memory profiling per pipeline stage (--profile).
+
+A sampling profiler: a background thread looks at every thread's stack
+every PROFILE_INTERVAL_MS and files the sample under the stage that thread
+is running (the stages timed in metrics.py; main-thread time outside any
+stage is "(main)"). Sampling sees the fetcher and API threads as well as
+the main thread, costs the same whatever the code does, and includes time
+spent waiting on the network, so the stages add up to where the run went.
+
+tracemalloc runs alongside: whenever the traced memory reaches a new high
+while a stage is running, the largest allocation sites are captured for
+that stage, so e.g. the DOM built while parsing or the DataFrames built
+for the sheet show up with the line that allocated them.
+
+Written to PROFILE_DIR (or the directory given to --profile) when the
+process exits:
+
+    <script>.folded        collapsed stacks, stage as the root frame - feed to
+                           flamegraph.pl, speedscope or inferno for a flame graph
+    <script>-profile.txt   per stage: samples, top-N functions by self and
+                           total time, peak traced memory and its top-N sites
+
+Detail pages are parsed in the main process while profiling, so the parse
+stage is sampled too (worker processes are not).
+"""
+
+import atexit
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from . import metrics
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+PROFILE_DIR = ".scraper_profile"
+PROFILE_INTERVAL_MS = float(os.environ.get("SCRAPER_PROFILE_INTERVAL_MS", "5"))
+# Hotspots and allocation sites listed per stage
+PROFILE_TOP = int(os.environ.get("SCRAPER_PROFILE_TOP", "15"))
+# Frames kept per allocation; 0 turns tracemalloc off. One frame (the allocating
+# line) roughly doubles the run time; 8 show the jobau line each allocation
+# came from but make the run many times slower
+PROFILE_TRACE_FRAMES = int(os.environ.get("SCRAPER_PROFILE_TRACE_FRAMES", "1"))
+# A stage's allocation sites are captured again once traced memory grows past
+# its last capture by this factor and at least PEAK_MIN_GROWTH bytes
+PEAK_GROWTH = 1.25
+PEAK_MIN_GROWTH = 1024 * 1024
+
+MAIN_STAGE = "(main)"
+
+
+def short_path(filename):
+    """dir/file.py: enough of a path to tell files apart in reports."""
+    return "/".join(filename.replace("\\", "/").split("/")[-2:])
+
+
+def frame_label(code):
+    """A function as it appears in stacks and reports: name (dir/file.py:line)."""
+    return f"{code.co_name} ({short_path(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StageSampler:
+    """Background thread sampling stacks and memory peaks per stage."""
+
+    def __init__(self, interval_ms=None, top=None):
+        self.interval = (interval_ms or PROFILE_INTERVAL_MS) / 1000
+        self.top = top or PROFILE_TOP
+        self.stacks = {}         # stage -> Counter of stacks (tuples of frame labels, outermost first)
+        self.peaks = {}          # stage -> (traced bytes, [allocation site statistics])
+        self.samples = Counter()
+        self.started = None
+        self.elapsed = 0.0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="stage-sampler", daemon=True)
+        self.main_ident = threading.main_thread().ident
+
+    def start(self):
+        if PROFILE_TRACE_FRAMES and not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_TRACE_FRAMES)
+        self.started = time.perf_counter()
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
+        self.elapsed = time.perf_counter() - self.started
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def run(self):
+        own = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            active = metrics.active_stages()
+            frames = sys._current_frames()
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                stage = active.get(ident) or (MAIN_STAGE if ident == self.main_ident else None)
+                if stage is None:
+                    continue  # idle pool threads
+                stack = []
+                while frame is not None:
+                    stack.append(frame_label(frame.f_code))
+                    frame = frame.f_back
+                self.stacks.setdefault(stage, Counter())[tuple(reversed(stack))] += 1
+                self.samples[stage] += 1
+            del frames
+            if tracemalloc.is_tracing():
+                self.check_memory(set(active.values()) or {MAIN_STAGE})
+
+    def check_memory(self, stages):
+        """Capture allocation sites for the stages running at a new memory high."""
+        current, _ = tracemalloc.get_traced_memory()
+        due = []
+        for stage in stages:
+            captured = self.peaks.get(stage, (0, None))[0]
+            if current > max(captured * PEAK_GROWTH, captured + PEAK_MIN_GROWTH):
+                due.append(stage)
+        if not due:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        sites = snapshot.statistics("traceback" if PROFILE_TRACE_FRAMES > 1 else "lineno")[:self.top]
+        for stage in due:
+            self.peaks[stage] = (current, sites)
+
+    # ---------- output ----------
+    def folded(self):
+        """Collapsed stacks ("stage;outer;...;inner count" lines) for flame graph tools."""
+        lines = []
+        for stage, stacks in sorted(self.stacks.items()):
+            for stack, count in stacks.most_common():
+                lines.append(";".join((stage,) + stack) + f" {count}")
+        return "\n".join(lines) + "\n"
+
+    def report(self, script):
+        """Per-stage top-N hotspots and peak allocation sites as text."""
+        total = sum(self.samples.values()) or 1
+        lines = [f"Profile of {script}: {self.elapsed:.1f}s wall, {total} samples "
+                 f"every {self.interval * 1000:g} ms (thread time, so concurrent stages add up past the wall time)"]
+        for stage, samples in self.samples.most_common():
+            stacks = self.stacks[stage]
+            own, inclusive = Counter(), Counter()
+            for stack, count in stacks.items():
+                own[stack[-1]] += count
+                for label in set(stack):
+                    inclusive[label] += count
+            lines.append("")
+            lines.append(f"== {stage}: {samples} samples (~{samples * self.interval:.2f}s, "
+                         f"{samples / total:.0%} of all samples)")
+            lines.append("   top by self time:")
+            for label, count in own.most_common(self.top):
+                lines.append(f"   {count / samples:6.1%} {count:>7}  {label}")
+            lines.append("   top by total time:")
+            for label, count in inclusive.most_common(self.top):
+                lines.append(f"   {count / samples:6.1%} {count:>7}  {label}")
+            if stage in self.peaks:
+                peak, sites = self.peaks[stage]
+                lines.append(f"   highest traced memory captured while running: {peak / 1024 / 1024:.1f} MiB; "
+                             f"largest allocation sites then:")
+                for stat in sites:
+                    lines.append(f"   {stat.size / 1024:10.0f} KiB {stat.count:>8} blocks  {site_label(stat.traceback)}")
+        return "\n".join(lines) + "\n"
+
+
+def site_label(traceback):
+    """Innermost frame of an allocation, plus the nearest jobau frame that led to it."""
+    if not traceback:
+        return "?"
+    inner = traceback[-1]
+    label = f"{short_path(inner.filename)}:{inner.lineno}"
+    for frame in reversed(traceback[:-1]):
+        if short_path(frame.filename).startswith("jobau/"):
+            return f"{label}  via {short_path(frame.filename)}:{frame.lineno}"
+    return label
+
+
+_sampler = None
+
+
+def start_profiling(script, directory=None):
+    """Profile the rest of the run; the files are written when the process exits."""
+    global _sampler
+    if _sampler is not None:
+        return
+    from . import parse_pool
+
+    # Parse in this process, where the sampler can see it
+    parse_pool.PARSE_WORKERS = 0
+    directory = directory or PROFILE_DIR
+    _sampler = StageSampler()
+    _sampler.start()
+    print(f"🔬 Profiling every {_sampler.interval * 1000:g} ms "
+          f"({'tracemalloc on' if tracemalloc.is_tracing() else 'tracemalloc off'}); output in {directory}/")
+    atexit.register(write_profile, script, directory)
+
+
+def write_profile(script, directory):
+    """Stop the sampler and write the flame graph stacks and the per-stage report."""
+    _sampler.stop()
+    os.makedirs(directory, exist_ok=True)
+    folded = os.path.join(directory, f"{script}.folded")
+    with open(folded, "w", encoding="utf-8") as f:
+        f.write(_sampler.folded())
+    report = os.path.join(directory, f"{script}-profile.txt")
+    with open(report, "w", encoding="utf-8") as f:
+        f.write(_sampler.report(script))
+    print(f"🔬 Profile written to {report} (flame graph stacks: {folded})")
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Compact record types for the jobs moving through the pipeline.
+
+`ListingRecord` is one job summary from a listing page; `JobRecord` is one
+job's details, with its values in a tuple ordered by a `RecordLayout` (a
+scraper's DETAILS_COLUMNS) shared by every record of that scraper. Neither
+carries a per-instance dict, and the low-cardinality values (state, job
+type, field, qualification, ...) are interned, so thousands of jobs share
+one copy of "Lagos" or "Full Time".
+
+Both are read-only mappings (job["link"], record.get("Title"), dict(record)),
+so code written against the old per-job dicts keeps working. Convert with
+dict(record) wherever a real dict is needed, e.g. before json.dumps.
+"""
+
+import sys
+from collections.abc import Mapping
+
+# Schema fields (see schema.py) whose values repeat across jobs and are interned
+INTERNED_FIELDS = frozenset({
+    "experience", "qualification", "job_type", "state", "city", "job_field", "industry",
+    "listed_salary", "salary", "salary_in_text", "posted_date", "deadline_date",
+})
+
+
+def intern_text(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+# --------------------------------------------
+# LISTING STAGE
+# --------------------------------------------
+class ListingRecord(Mapping):
+    """One job as a listing page shows it: title, company, location and link."""
+
+    __slots__ = ("title", "company", "location", "link")
+    KEYS = __slots__
+
+    def __init__(self, title, company, location, link):
+        self.title = title
+        self.company = intern_text(company)
+        self.location = intern_text(location)
+        self.link = link
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.KEYS else default
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __reduce__(self):
+        return ListingRecord, (self.title, self.company, self.location, self.link)
+
+    def __repr__(self):
+        return f"ListingRecord({self.title!r}, {self.company!r}, {self.location!r}, {self.link!r})"
+
+
+# --------------------------------------------
+# DETAIL STAGE
+# --------------------------------------------
+class RecordLayout:
+    """The columns of one scraper's JobRecords and which of them are interned."""
+
+    __slots__ = ("items", "columns", "positions", "interned")
+
+    def __init__(self, columns):
+        self.items = tuple(columns.items())
+        self.columns = tuple(columns)
+        self.positions = {column: i for i, column in enumerate(self.columns)}
+        self.interned = tuple(i for i, (_, field) in enumerate(self.items) if field in INTERNED_FIELDS)
+
+    def record(self, values):
+        """A JobRecord from values in column order."""
+        if self.interned:
+            values = list(values)
+            for i in self.interned:
+                values[i] = intern_text(values[i])
+        return JobRecord(self, tuple(values))
+
+    def from_mapping(self, mapping):
+        """A JobRecord from a dict (or any mapping) keyed by column; missing columns are None."""
+        return self.record([mapping.get(column) for column in self.columns])
+
+
+_layouts = {}
+
+
+def record_layout(columns):
+    """The shared layout for a column -> field mapping (one per scraper)."""
+    key = tuple(columns.items()) if isinstance(columns, Mapping) else tuple(columns)
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = RecordLayout(dict(key))
+    return layout
+
+
+class JobRecord(Mapping):
+    """One job's details: a tuple of values read through its layout's columns."""
+
+    __slots__ = ("layout", "values")
+
+    def __init__(self, layout, values):
+        self.layout = layout
+        self.values = values
+
+    def __getitem__(self, column):
+        return self.values[self.layout.positions[column]]
+
+    def get(self, column, default=None):
+        position = self.layout.positions.get(column)
+        return default if position is None else self.values[position]
+
+    def __iter__(self):
+        return iter(self.layout.columns)
+
+    def __len__(self):
+        return len(self.values)
+
+    def replace(self, changes):
+        """A copy with some columns set to new values."""
+        values = list(self.values)
+        for column, value in changes.items():
+            values[self.layout.positions[column]] = value
+        return self.layout.record(values)
+
+    def __reduce__(self):
+        # Rebuilt through the shared layout (and re-interned) when it comes back from a parse worker
+        return _restore, (self.layout.items, self.values)
+
+    def __repr__(self):
+        return f"JobRecord({dict(self)!r})"
+
+
+def _restore(items, values):
+    return record_layout(items).record(values)
+
+
+def as_record(record, layout):
+    """`record` as a JobRecord with `layout`, converting dicts (e.g. loaded from the caches)."""
+    if isinstance(record, JobRecord) and record.layout is layout:
+        return record
+    return layout.from_mapping(record)
+
+
+# --------------------------------------------
+# CONVERSION
+# --------------------------------------------
+def as_rows(records, columns):
+    """Records as tuples of their values for `columns`, reusing JobRecord tuples as they are."""
+    columns = tuple(columns)
+    rows = []
+    for record in records:
+        if isinstance(record, JobRecord) and record.layout.columns == columns:
+            rows.append(record.values)
+        else:
+            rows.append(tuple(record.get(column) for column in columns))
+    return rows
+
+
+def to_frame(records, columns=None):
+    """
+    A DataFrame of records, built from their value tuples rather than per-row dicts.
+
+    Without `columns`, records sharing one layout give its columns; anything
+    else (e.g. plain dicts) goes through pandas' own dict handling.
+    """
+    import pandas as pd
+
+    records = list(records)
+    if columns is None:
+        layouts = {record.layout if isinstance(record, JobRecord) else None for record in records}
+        if len(layouts) != 1 or None in layouts:
+            return pd.DataFrame(records)
+        columns = layouts.pop().columns
+    return pd.DataFrame(as_rows(records, columns), columns=list(columns))
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Declarative extraction schema for MyJobMag job detail pages.
+
+Every field the scrapers read from a detail page is declared here once, as
+selector chains, regexes and post-processors. Each scraper picks the
+columns it outputs (a projection) and compiles them into an extraction
+plan at import time; see extract.py.
+"""
+
+import re
+
+from .extract import Field, Plan
+
+# Precompiled once instead of on every page
+SALARY_PATTERN = re.compile(
+    r'(?:salary|remuneration)[:\s]*([₦N]?\s?\d{1,3}(?:[,.\d]*)(?:\s?[KkMm]\b)?)',
+    flags=re.IGNORECASE
+)
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Heading phrases that open the responsibilities / requirements blocks
+RESPONSIBILITY_PATTERNS = ["responsibilities", "duties", "key responsibilities", "what you'll do"]
+REQUIREMENT_PATTERNS = ["requirements", "qualifications", "what we're looking for", "you should have"]
+
+
+# --------------------------------------------
+# POST-PROCESSORS
+# --------------------------------------------
+def clean_text(text):
+    """Clean unwanted special characters and Unicode from text."""
+    if not text:
+        return None
+    text = text.replace('\r', ' ').replace('\n', ' ').replace('’', "'")
+    text = WHITESPACE_PATTERN.sub(' ', text)  # collapse multiple spaces
+    return text.strip()
+
+
+def element(node, record):
+    """Keep the matched element(s) themselves, for fields other fields navigate from."""
+    return node
+
+
+def split_title(title_text):
+    """Split "HR Associate at HR Aid" into (title, company)."""
+    if title_text and " at " in title_text:
+        parts = title_text.split(" at ", 1)
+        return parts[0].strip(), parts[1].strip()
+    return title_text, None
+
+
+def key_info_pairs(items, record):
+    """The `ul.job-key-info li` key/value pairs, keyed by lowercased label."""
+    details = {}
+    for li in items:
+        key_tag = li.find("span", class_="jkey-title")
+        val_tag = li.find("span", class_="jkey-info")
+
+        if not key_tag or not val_tag:
+            continue
+
+        details[key_tag.get_text(strip=True).lower()] = val_tag.get_text(" ", strip=True)
+    return details
+
+
+def labelled_date(*labels):
+    """Text of the marker's parent with the "Posted:"-style label removed."""
+    def extract(marker, record):
+        if not marker.parent:
+            return None
+        text = marker.parent.get_text(" ", strip=True)
+        for label in labels:
+            text = text.replace(label, "")
+        return text.strip()
+    return extract
+
+
+def key_info(key):
+    """Derive a field from one job-key-info entry."""
+    return lambda record: (record["key_info"] or {}).get(key)
+
+
+def first_with_text(fragment):
+    """The first matched heading whose text mentions `fragment`."""
+    def extract(headings, record):
+        for heading in headings:
+            if fragment in heading.get_text(strip=True).lower():
+                return heading
+        return None
+    return extract
+
+
+def application(record):
+    """Return (application_method, application_instructions) from the application section."""
+    method = None
+    instructions = None
+
+    heading = record["application_heading"]
+    if not heading:
+        return method, instructions
+
+    # Get the div that follows the heading
+    app_div = heading.find_next_sibling("div")
+    if not app_div:
+        return method, instructions
+
+    instructions = app_div.get_text(separator=" ", strip=True)
+    title = record["title"]
+    subject = title.replace(" ", "%20") if title else "Job%20Application"
+
+    # Look for ANY link with href in the application div
+    app_link = app_div.find("a", href=True)
+
+    if app_link:
+        link_href = app_link.get('href', '')
+
+        if link_href.startswith('http'):
+            # It's already a full URL - use it directly
+            method = link_href
+        elif link_href.startswith('/apply-now/'):
+            # Internal apply link - construct full URL
+            page_url = record["page_url"] or record["job_url"]
+            method = '/'.join(page_url.split('/')[:3]) + link_href
+        else:
+            # Might be email-based application
+            email_tag = app_div.find("strong")
+            if email_tag:
+                email_text = email_tag.get_text(strip=True)
+                if '@' in email_text:
+                    method = f"mailto:{email_text}?subject={subject}"
+
+            if not method:
+                email_match = EMAIL_PATTERN.search(instructions)
+                if email_match:
+                    method = f"mailto:{email_match.group(0)}?subject={subject}"
+    else:
+        # No link found, must be email-based
+        email_tag = app_div.find("strong")
+        if email_tag:
+            email_text = email_tag.get_text(strip=True)
+            if '@' in email_text:
+                method = f"mailto:{email_text}"
+
+        if not method:
+            # Last resort: regex search for email
+            email_match = EMAIL_PATTERN.search(instructions)
+            if email_match:
+                method = f"mailto:{email_match.group(0)}"
+
+    return method, instructions
+
+
+def section_block(patterns):
+    """Text under the first heading that mentions one of `patterns`, up to the next heading."""
+    def derive(record):
+        for heading in record["section_headings"] or []:
+            heading_text = heading.get_text(strip=True).lower()
+            if not any(pattern in heading_text for pattern in patterns):
+                continue
+
+            content = []
+            for sibling in heading.find_next_siblings():
+                if sibling.name in ['h2', 'h3', 'h4'] or (sibling.name in ['strong', 'b'] and len(sibling.get_text(strip=True)) > 20):
+                    break
+                text = sibling.get_text(separator="\n", strip=True)
+                if text:
+                    content.append(text)
+
+            if content:
+                return "\n".join(content)
+        return None
+    return derive
+
+
+def lead_text(section, record):
+    """First text node directly inside the section, else its first paragraph."""
+    text_nodes = [t for t in section.contents if isinstance(t, str) and t.strip()]
+    if text_nodes:
+        return text_nodes[0].strip()
+    p = section.find("p")
+    return p.get_text(strip=True) if p else None
+
+
+def industry_name(section, record):
+    """The industry named by the first link in li.job-industry."""
+    first_link = section.find("a")
+    if not first_link:
+        return None
+    return first_link.get_text(strip=True).replace("View Jobs in", "").strip()
+
+
+# --------------------------------------------
+# SCHEMA
+# --------------------------------------------
+FIELDS = [
+    # Title and company: "<title> at <company>" in the h1, else div.company-name
+    Field("heading", select="h1", text={"strip": True}),
+    Field("title", derive=lambda r: split_title(r["heading"])[0], needs=["heading"]),
+    Field("company_link", select="div.company-name a", text={"strip": True}),
+    Field("company",
+          derive=lambda r: split_title(r["heading"])[1] if r["heading"] and " at " in r["heading"] else r["company_link"],
+          needs=["heading", "company_link"]),
+
+    # Key info list and dates
+    Field("key_info", select="ul.job-key-info li", all=True, extract=key_info_pairs),
+    Field("experience", derive=key_info("experience"), needs=["key_info"]),
+    Field("qualification", derive=key_info("qualification"), needs=["key_info"]),
+    Field("job_type", derive=key_info("job type"), needs=["key_info"]),
+    Field("state", derive=key_info("location"), needs=["key_info"]),
+    Field("city", derive=key_info("city"), needs=["key_info"]),
+    Field("job_field", derive=key_info("job field"), needs=["key_info"]),
+    Field("listed_salary", derive=key_info("salary"), needs=["key_info"]),
+    Field("posted_date", select="b.tc-o", extract=labelled_date("Posted :", "Posted:")),
+    Field("deadline_date", select="b.tc-bl3", extract=labelled_date("Deadline :", "Deadline:")),
+    Field("industry", select="li.job-industry", extract=industry_name, post=[clean_text]),
+
+    # Salary: first figure mentioned in the page text, else the key-info entry
+    Field("salary_in_text", source="page_text", regex=SALARY_PATTERN),
+    Field("salary", derive=lambda r: r["salary_in_text"] or r["listed_salary"],
+          needs=["salary_in_text", "listed_salary"]),
+
+    # Application method
+    Field("application_heading_by_text", select="h2, h3", all=True, extract=first_with_text("application")),
+    Field("application_heading", select="h2#application-method", extract=element,
+          fallback="application_heading_by_text"),
+    Field("application", derive=application,
+          needs=["application_heading", "title", "page_url", "job_url"]),
+    Field("application_method", derive=lambda r: r["application"][0], needs=["application"]),
+    Field("application_instructions", derive=lambda r: r["application"][1], needs=["application"]),
+
+    # Overview, description and section blocks
+    Field("first_paragraph", select="div.job-details-section p:first-of-type", text={"strip": True}),
+    Field("overview",
+          select=["div.job-overview", "div.job-summary", "div[class*='overview']",
+                  "div[class*='summary']", "section.overview", "div.description-summary"],
+          text={"separator": "\n", "strip": True}, fallback="first_paragraph"),
+    Field("lead_text", select=".job-description", extract=lead_text, post=[clean_text]),
+    Field("description",
+          select=["div.job-details-section", "div.job-description", "div[class*='description']",
+                  "div.job-details", "section.job-content", "div#job-description"],
+          text={"separator": "\n", "strip": True}),
+    Field("clean_description", derive=lambda r: clean_text(r["description"]), needs=["description"]),
+    Field("section_headings", select="h2, h3, h4, strong, b", all=True, extract=element),
+    Field("responsibilities", derive=section_block(RESPONSIBILITY_PATTERNS), needs=["section_headings"]),
+    Field("requirements", derive=section_block(REQUIREMENT_PATTERNS), needs=["section_headings"]),
+]
+
+
+def compile_plan(columns):
+    """Compile the schema for one scraper's output columns (column -> field or context key)."""
+    return Plan(FIELDS, columns)
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+import os
+from datetime import date, datetime
+from itertools import chain
+
+from . import metrics
+from .archive import close_archive, enable_replay
+from .cli import build_parser, print_parsed
+from .fetch import polite_get, print_connection_stats
+from .google import open_spreadsheet
+from .http_cache import cached_get, close_cache, load_parsed, save_parsed
+from .parsers import make_listing_soup, make_soup
+from .pipeline import chunked, detail_stage, plan_stage, print_sink
+from .profiling import start_profiling
+from .records import ListingRecord
+from .schema import compile_plan
+from .seen_index import FULL_CRAWL, STOP_AFTER_KNOWN_PAGES, open_seen_index
+from .sheets import frames, sheet_sink, upsert_sink
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# SCRAPER_BASE_URL points the scraper at another host, e.g. the local stub (benchmarks/stub_server.py)
+BASE_URL = os.environ.get("SCRAPER_BASE_URL", "https://www.myjobmag.com").rstrip("/")
+TODAY_URL = f"{BASE_URL}/jobs-by-date/today"
+headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+# Cache key for parsed detail pages - bump it whenever get_job_details output changes
+DETAILS_PARSER_KEY = "scraper:2"
+
+# Detail page columns -> schema fields (see schema.py)
+DETAILS_COLUMNS = {
+    "Title": "title",
+    "Company": "company",
+    "Experience": "experience",
+    "Qualification": "qualification",
+    "Job Type": "job_type",
+    "State": "state",
+    "City": "city",
+    "Salary": "salary",
+    "Field": "job_field",
+    "Posted on": "posted_date",
+    "Deadline": "deadline_date",
+    # "Overview": "overview",
+    "Description": "description",
+    # "Responsibilities": "responsibilities",
+    # "Requirements": "requirements",
+    "Apply Now": "application_method",
+    # "Apply": "job_url",
+    "URL": "job_url",  # upsert key for the Google Sheet
+    # "Application Instructions": "application_instructions",
+    # "Raw_Details": "key_info"
+}
+DETAILS_PLAN = compile_plan(DETAILS_COLUMNS)
+
+
+# --------------------------------------------
+# SCRAPING FUNCTIONS
+# --------------------------------------------
+def iter_today_job_pages(seen=None, full_crawl=FULL_CRAWL):
+    """
+    Yield today's job listings one page (a list of jobs) at a time.
+
+    When a seen-jobs index is given, pagination stops early once
+    STOP_AFTER_KNOWN_PAGES consecutive pages hold only known jobs
+    (unless full_crawl, i.e. --full-crawl or SCRAPER_FULL_CRAWL=1).
+    """
+    total = 0
+    page = 1
+    known_pages = 0
+
+    while True:
+        # Build URL for each page
+        if page == 1:
+            url = TODAY_URL
+        else:
+            url = f"{TODAY_URL}/{page}"
+
+        print(f"Scraping page {page}: {url}")
+        with metrics.timed("listing") as call:
+            response = polite_get(url, headers=headers)
+            call["bytes"] = len(response.content)
+            call["error"] = response.status_code != 200
+            if not call["error"]:
+                soup = make_listing_soup(response.text)
+                job_divs = soup.select("li.job-list-li")
+                call["items"] = len(job_divs)
+        # polite_get already retried throttled (429/503) and dropped requests
+        if response.status_code != 200:
+            print(f"❌ Failed to fetch page {page} ({response.status_code}). Stopping.")
+            break
+
+        # Stop when no job listings are found (end of pages)
+        if not job_divs:
+            print(f"✅ No more jobs found after page {page-1}.")
+            break
+
+        page_jobs = []
+        for job_div in job_divs:
+            title_tag = job_div.select_one("h2 a")
+            location_tag = job_div.select_one("span a")
+
+            if not title_tag or not title_tag.get("href"):
+                continue
+
+            title_text = title_tag.get_text(strip=True)
+
+            # Split "at" if it exists, e.g., "HR Associate at HR Aid"
+            if " at " in title_text:
+                parts = title_text.split(" at ", 1)
+                title = parts[0].strip()
+                company = parts[1].strip()
+            else:
+                title = title_text.strip()
+                company = None
+
+            location = location_tag.get_text(strip=True) if location_tag else None
+            link = BASE_URL + title_tag["href"]
+
+            page_jobs.append(ListingRecord(title, company, location, link))
+
+        print(f"✅ Page {page} - {len(job_divs)} jobs scraped.")
+
+        # Incremental mode: later pages only hold jobs we already have
+        # (checked before the page is handed on and marked as seen)
+        stop = False
+        if seen is not None and not full_crawl:
+            known_pages = known_pages + 1 if seen.all_known(page_jobs) else 0
+            if known_pages >= STOP_AFTER_KNOWN_PAGES:
+                print(f"⏹️  {known_pages} pages in a row held only known jobs. Stopping early.")
+                stop = True
+
+        total += len(page_jobs)
+        yield page_jobs
+        if stop:
+            break
+        page += 1
+
+    print(f"\n🎯 Total jobs found across all pages: {total}")
+
+
+def get_today_jobs(seen=None, full_crawl=FULL_CRAWL):
+    """Fetch all job listings across all pages for today's postings."""
+    return [job for page_jobs in iter_today_job_pages(seen, full_crawl) for job in page_jobs]
+
+
+def get_job_details(job_url):
+    """Fetch one job posting and extract its details."""
+    response = cached_get(job_url, headers=headers)
+    if response.from_cache:
+        # Unchanged page: reuse the record parsed from this exact body
+        record = load_parsed(job_url, DETAILS_PARSER_KEY)
+        if record is not None:
+            return DETAILS_PLAN.layout.from_mapping(record)
+
+    record = parse_job_details(response.text, job_url, page_url=response.url)
+    save_parsed(job_url, DETAILS_PARSER_KEY, record)
+    return record
+
+
+def parse_job_details(html, job_url, page_url=None, backend=None):
+    """Extract detailed info for one job posting from its HTML."""
+    soup = make_soup(html, backend)
+    return DETAILS_PLAN.extract(soup, job_url=job_url, page_url=page_url or job_url)
+
+
+# --------------------------------------------
+# MAIN SCRAPING WORKFLOW
+# --------------------------------------------
+def main(argv=None):
+    args = build_parser("Scrape today's MyJobMag jobs into the AlumUnite Job Board sheet.",
+                        "Google Sheets", full_crawl=True).parse_args(argv)
+    if args.parse_only:
+        print_parsed(args.parse_only, parse_job_details)
+        return
+    metrics.start_run("scraper")
+    if args.profile:
+        start_profiling("scraper", args.profile)
+    if args.replay:
+        enable_replay(args.replay)
+        # A replay never writes to Google Sheets or the job API
+        args.dry_run = True
+
+    # Step 1 -> 2: today's job listings stream into the detail fetcher page by page
+    # (pages download concurrently within the host's rate limit and parse in worker
+    # processes; unchanged jobs are reused from the seen-jobs index)
+    index = open_seen_index("scraper", DETAILS_PARSER_KEY)
+    known = {}
+    listed = set()
+
+    def listing():
+        for page_jobs in iter_today_job_pages(seen=index, full_crawl=args.full_crawl):
+            listed.update(job["link"] for job in page_jobs)
+            yield page_jobs
+
+    jobs = plan_stage(listing(), index, known)
+    details = (record for _, record in detail_stage(jobs, DETAILS_COLUMNS, DETAILS_PARSER_KEY, headers,
+                                                    known=known, index=index))
+
+    # Step 3 -> 4: records reach the Google Sheet in chunks, in listing order
+    chunks = chunked(chain(details, listed_earlier(index, listed, args.full_crawl)))
+    if args.dry_run:
+        print_sink(chunks)
+    else:
+        save_to_google_sheet(frames(chunks, DETAILS_COLUMNS), key="URL")
+    print_connection_stats()
+    close_cache()
+    close_archive()
+    if index:
+        index.close()
+
+
+def listed_earlier(index, listed, full_crawl=FULL_CRAWL):
+    """
+    Today's jobs from earlier runs that sat on the listing pages an incremental walk skipped.
+
+    The sheet is replaced every run, so these are added after the streamed
+    jobs. Evaluated lazily, once `listed` holds every link walked this run.
+    """
+    if not index or full_crawl:
+        return
+    today_start = datetime.combine(date.today(), datetime.min.time()).timestamp()
+    earlier = index.listed_since(today_start, exclude=listed)
+    if earlier:
+        print(f"📚 Adding {len(earlier)} jobs listed earlier today from the seen-jobs index.")
+        yield from (DETAILS_PLAN.layout.from_mapping(record) for record in earlier.values())
+
+# --------------------------------------------
+# GOOGLE SHEETS INTEGRATION
+# --------------------------------------------
+def save_to_google_sheet(df, sheet_name="AlumUnite Job Board", replace=True, key=None):
+    """
+    Write a DataFrame, or an iterable of DataFrame chunks, to the first worksheet.
+
+    With a `key` column the sheet is upserted (only new, changed and, with
+    replace, removed rows are written) instead of cleared and rewritten.
+    """
+    sh = open_spreadsheet(sheet_name)
+
+    try:
+        worksheet = sh.get_worksheet(0)
+    except IndexError:
+        worksheet = sh.add_worksheet(title="Today_Jobs", rows=1000, cols=20)
+
+    if key:
+        upsert_sink(worksheet, df, key, delete_missing=replace)
+    else:
+        sheet_sink(worksheet, df, replace)
+
+    print(f"🔗 Google Sheet link: https://docs.google.com/spreadsheets/d/{sh.id}")
+
+
+# --------------------------------------------
+# RUN SCRIPT
+# --------------------------------------------
+if __name__ == "__main__":
+    main()
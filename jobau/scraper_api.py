@@ -0,0 +1,398 @@
+import os
+import re
+from datetime import datetime, timedelta
+
+from . import metrics
+from .api_push import push_jobs
+from .archive import close_archive, enable_replay
+from .cli import build_parser, print_parsed
+from .fetch import polite_get, print_connection_stats
+from .filter_engine import compile_filters
+from .http_cache import cached_get, close_cache, load_parsed, save_parsed
+from .parsers import make_listing_soup, make_soup
+from .pipeline import detail_stage, filter_stage, plan_stage, reservoir_sample
+from .profiling import start_profiling
+from .records import ListingRecord
+from .schema import compile_plan
+from .seen_index import FULL_CRAWL, STOP_AFTER_KNOWN_PAGES, open_seen_index
+from .skills import extract_skills
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# SCRAPER_BASE_URL points the scraper at another host, e.g. the local stub (benchmarks/stub_server.py)
+BASE_URL = os.environ.get("SCRAPER_BASE_URL", "https://www.myjobmag.com").rstrip("/")
+TODAY_URL = f"{BASE_URL}/jobs-by-date/today"
+headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+# Cache key for parsed detail pages - bump it whenever get_job_details output changes
+DETAILS_PARSER_KEY = "scraper_api:2"
+
+# Detail page columns -> schema fields (see schema.py)
+DETAILS_COLUMNS = {
+    "Title": "title",
+    "Company": "company",
+    "Industry": "industry",
+    "Overview": "lead_text",
+    "Experience": "experience",
+    "Qualification": "qualification",
+    "Job Type": "job_type",
+    "State": "state",
+    "City": "city",
+    "Salary": "listed_salary",
+    "Field": "job_field",
+    "Posted on": "posted_date",
+    "Deadline": "deadline_date",
+    "Description": "clean_description",
+    "Apply Now": "application_method",
+    "Original URL": "job_url",
+}
+DETAILS_PLAN = compile_plan(DETAILS_COLUMNS)
+
+# API Configuration - CHANGE THIS WHEN READY
+API_BASE_URL = os.environ.get('API_BASE_URL', 'https://api.alumunite-staging.com').rstrip('/')  # Staging
+# API_BASE_URL = 'https://api.alumunite.co'  # Production
+API_ENDPOINT = f"{API_BASE_URL}/v1/store-job-api"
+
+# Test mode settings
+TEST_MODE = False  # Set to False to actually push to API
+MAX_JOBS_TO_SCRAPE = 2  # Limit jobs for testing (set to None for all jobs)
+
+# --------------------------------------------
+# SCRAPING FUNCTIONS
+# --------------------------------------------
+def iter_today_job_pages(max_jobs=None, seen=None, full_crawl=FULL_CRAWL):
+    """
+    Yield today's job listings one page (a list of jobs) at a time.
+
+    When a seen-jobs index is given, pagination stops early once
+    STOP_AFTER_KNOWN_PAGES consecutive pages hold only known jobs
+    (unless full_crawl, i.e. --full-crawl or SCRAPER_FULL_CRAWL=1).
+    """
+    total = 0
+    page = 1
+    known_pages = 0
+
+    while True:
+        if page == 1:
+            url = TODAY_URL
+        else:
+            url = f"{TODAY_URL}/{page}"
+
+        print(f"📄 Scraping page {page}: {url}")
+        with metrics.timed("listing") as call:
+            response = polite_get(url, headers=headers)
+            call["bytes"] = len(response.content)
+            call["error"] = response.status_code != 200
+            if not call["error"]:
+                soup = make_listing_soup(response.text)
+                job_divs = soup.select("li.job-list-li")
+                call["items"] = len(job_divs)
+        # polite_get already retried throttled (429/503) and dropped requests
+        if response.status_code != 200:
+            print(f"❌ Failed to fetch page {page} ({response.status_code}). Stopping.")
+            break
+
+        if not job_divs:
+            print(f"✅ No more jobs found after page {page-1}.")
+            break
+
+        page_jobs = []
+        stop = False
+        for job_div in job_divs:
+            title_tag = job_div.select_one("h2 a")
+            location_tag = job_div.select_one("span a")
+
+            if not title_tag or not title_tag.get("href"):
+                continue
+
+            title_text = title_tag.get_text(strip=True)
+
+            if " at " in title_text:
+                parts = title_text.split(" at ", 1)
+                title = parts[0].strip()
+                company = parts[1].strip()
+            else:
+                title = title_text.strip()
+                company = None
+
+            location = location_tag.get_text(strip=True) if location_tag else None
+            link = BASE_URL + title_tag["href"]
+
+            page_jobs.append(ListingRecord(title, company, location, link))
+
+            # Stop if we've reached max_jobs
+            if max_jobs and total + len(page_jobs) >= max_jobs:
+                print(f"✋ Reached limit of {max_jobs} jobs")
+                stop = True
+                break
+        # break
+        print(f"   Found {len(job_divs)} jobs on page {page}")
+
+        # Incremental mode: later pages only hold jobs we already have
+        # (checked before the page is handed on and marked as seen)
+        if seen is not None and not full_crawl and not stop:
+            known_pages = known_pages + 1 if seen.all_known(page_jobs) else 0
+            if known_pages >= STOP_AFTER_KNOWN_PAGES:
+                print(f"⏹️  {known_pages} pages in a row held only known jobs. Stopping early.")
+                stop = True
+
+        total += len(page_jobs)
+        yield page_jobs
+        if stop:
+            break
+        page += 1
+
+    print(f"\n🎯 Total jobs found: {total}")
+
+
+def get_today_jobs(max_jobs=None, seen=None, full_crawl=FULL_CRAWL):
+    """Fetch job listings from today's postings."""
+    return [job for page_jobs in iter_today_job_pages(max_jobs, seen, full_crawl) for job in page_jobs]
+
+def get_job_details(job_url):
+    """Fetch one job posting and extract its details."""
+    response = cached_get(job_url, headers=headers)
+    if response.from_cache:
+        # Unchanged page: reuse the record parsed from this exact body
+        record = load_parsed(job_url, DETAILS_PARSER_KEY)
+        if record is not None:
+            return DETAILS_PLAN.layout.from_mapping(record)
+
+    record = parse_job_details(response.text, job_url, page_url=response.url)
+    save_parsed(job_url, DETAILS_PARSER_KEY, record)
+    return record
+
+
+def parse_job_details(html, job_url, page_url=None, backend=None):
+    """Extract detailed info for one job posting from its HTML."""
+    soup = make_soup(html, backend)
+    return DETAILS_PLAN.extract(soup, job_url=job_url, page_url=page_url or job_url)
+
+
+# --------------------------------------------
+# API INTEGRATION
+# --------------------------------------------
+def map_job_to_api_format(job):
+    """Convert scraped job data to API format."""
+
+    # Extract skills from description/requirements (most mentioned first; see skills.py)
+    skills = extract_skills(job.get('Description'), limit=5)
+
+    # Parse deadline to expiration_date
+    expiration_date = None
+    deadline = job.get("Deadline")
+    if deadline:
+        try:
+            from datetime import datetime
+            # Try to parse common date formats
+            for fmt in ["%B %d, %Y", "%d %B %Y", "%Y-%m-%d", "%d/%m/%Y"]:
+                try:
+                    date_obj = datetime.strptime(deadline, fmt)
+                    expiration_date = date_obj.strftime("%Y-%m-%d")
+                    break
+                except:
+                    continue
+        except:
+            pass
+
+    # Build location
+    location_parts = [job.get("City"), job.get("State")]
+    location = ", ".join(filter(None, location_parts)) or "Nigeria"
+
+    # Parse salary
+    salary_range = None
+    currency = "NGN"
+    salary_raw = job.get("Salary")
+    if salary_raw:
+        # Clean salary string
+        salary_clean = re.sub(r'[₦N,]', '', str(salary_raw)).strip()
+        # Check if it's a range
+        if '-' in salary_clean or 'to' in salary_clean.lower():
+            salary_range = salary_clean
+        else:
+            salary_range = salary_clean
+
+    return {
+        "company": job.get("Company"),
+        "title": job.get("Title"),
+        "description": job.get("Description"),
+        # "industry": job.get("Industry"),
+        "overview": job.get("Overview") or job.get("Description"),
+        "responsibilities": job.get("Description"),
+        "url": job.get("Apply Now"),
+        "expiration_date": expiration_date or (datetime.today() + timedelta(days=30)).strftime("%Y-%m-%d"),
+        "location": location,
+        "job_type": job.get("Job Type"),
+        "employment_type": "full-time",
+        "experience_level": job.get("Experience") or "N/A",
+        "qualifications": job.get("Qualification"),
+        "skills": skills or ["General"],
+        "currency": currency,
+        "salary_range": salary_range or "N/A",
+        "pay_schedule": "Monthly",
+        "benefits": "Not specified"
+    }
+
+
+
+def push_job_to_api(job_data):
+    """Push a single job to the API."""
+    successful, _ = push_jobs([job_data], API_ENDPOINT, map_job_to_api_format, test_mode=TEST_MODE)
+    return successful == 1
+
+
+# --------------------------------------------
+# FILTERING FUNCTIONS
+# --------------------------------------------
+def should_send_job(job_data, filters):
+    """
+    Determine if a job should be sent to the API based on filters.
+
+    Args:
+        job_data: Dictionary containing job details
+        filters: Dictionary with filter criteria
+
+    Returns:
+        Tuple (should_send: bool, reason: str)
+
+    The compiled filters are reused while `filters` stays the same. To
+    filter many jobs, evaluate them over all jobs together (see
+    filter_engine.py).
+    """
+    return compile_filters(filters).check(job_data)
+
+
+# --------------------------------------------
+# MAIN SCRAPING WORKFLOW
+# --------------------------------------------
+def main(argv=None):
+    args = build_parser("Scrape today's MyJobMag jobs and push a selection to the AlumUnite job API.",
+                        "the job API", full_crawl=True).parse_args(argv)
+    if args.parse_only:
+        print_parsed(args.parse_only, parse_job_details)
+        return
+    metrics.start_run("scraper_api")
+    if args.profile:
+        start_profiling("scraper_api", args.profile)
+    if args.replay:
+        enable_replay(args.replay)
+        # A replay never writes to Google Sheets or the job API
+        args.dry_run = True
+    test_mode = TEST_MODE or args.dry_run
+
+    print(f"🔧 Configuration:")
+    print(f"   API: {API_ENDPOINT}")
+    print(f"   Test Mode: {test_mode}")
+
+    print(f"🚀 Starting job scraper...")
+    print(f"📡 API Endpoint: {API_ENDPOINT}\n")
+
+    # --------------------------------------------
+    # FILTER CONFIGURATION
+    # --------------------------------------------
+    filters = {
+        # Only send jobs with these required fields filled
+        'required_fields': ['Company', 'Description', 'Apply Now'],
+
+        # Only send jobs in these industries (leave empty [] to allow all)
+        'industries': [
+            'Telecommunication',
+            'Technical',
+            'Security / Intelligence',
+            'ict / computer', 
+            'ict / telecommunication',
+            'Data, Business Analysis and AI',
+            'Product Management',
+            'Project Management'
+            # Add more industries as needed
+        ],
+
+        # Block these industries (leave empty [] to block none)
+        'blocked_industries': [
+            # 'Sales',
+            # 'Marketing',
+        ],
+
+        # Only send these job types (leave empty [] to allow all)
+        'job_types': [
+            # 'Remote',
+            # 'Hybrid',
+            # 'Full-time',
+        ],
+
+        # Only send jobs in these locations (leave empty [] to allow all)
+        'locations': [
+            # 'Lagos',
+            # 'Abuja',
+            # 'Port Harcourt',
+        ],
+
+        # Minimum experience required (0 = entry level, set to None to disable)
+        'min_experience': None,
+
+        # Only send jobs with salary specified
+        'require_salary': False,
+    }
+
+    print("🔍 Active Filters:")
+    if filters['required_fields']:
+        print(f"   ✓ Required fields: {', '.join(filters['required_fields'])}")
+    if filters['industries']:
+        print(f"   ✓ Industries: {', '.join(filters['industries'])}")
+    if filters['blocked_industries']:
+        print(f"   ✗ Blocked industries: {', '.join(filters['blocked_industries'])}")
+    if filters['job_types']:
+        print(f"   ✓ Job types: {', '.join(filters['job_types'])}")
+    if filters['locations']:
+        print(f"   ✓ Locations: {', '.join(filters['locations'])}")
+    if filters.get('require_salary'):
+        print(f"   ✓ Salary required: Yes")
+    print()
+
+    # Step 1 -> 2: today's job listings stream into the detail fetcher page by page,
+    # and the details through the filters a chunk at a time
+    # (pages download concurrently within the host's rate limit and parse in worker
+    # processes; unchanged jobs are reused from the seen-jobs index)
+    index = open_seen_index("scraper_api", DETAILS_PARSER_KEY)
+    known = {}
+    stats = {}
+    jobs = plan_stage(iter_today_job_pages(seen=index, full_crawl=args.full_crawl), index, known)
+    details = (record for _, record in detail_stage(jobs, DETAILS_COLUMNS, DETAILS_PARSER_KEY, headers,
+                                                    known=known, index=index, stats=stats))
+    qualified = filter_stage(details, compile_filters(filters))
+
+    # -------------------------------------------
+    # ⚡ Randomly select ONLY 7 to send to API
+    # -------------------------------------------
+    selected_jobs, qualified_count = reservoir_sample(qualified, 7)
+
+    if not any(stats.values()):
+        print("❌ No jobs found. Exiting.")
+        close_cache()
+        close_archive()
+        if index:
+            index.close()
+        return
+
+    print(f"\n🎉 {qualified_count} jobs qualified after filter.")
+    print(f"🚀 Sending {len(selected_jobs)} randomly selected jobs...\n")
+
+    # Step 3: Push selected jobs to API (concurrently; see api_push.py)
+    successful, failed = push_jobs(selected_jobs, API_ENDPOINT, map_job_to_api_format, test_mode=test_mode)
+
+    # Summary
+    print(f"\n{'='*50}")
+    print(f"📊 SCRAPING SUMMARY")
+    print(f"{'='*50}")
+    print(f"✅ Successfully posted: {successful}")
+    print(f"❌ Failed: {failed}")
+    print(f"📝 Total processed: {successful + failed}")
+    print_connection_stats()
+    close_cache()
+    close_archive()
+    if index:
+        index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from . import metrics
+from .archive import close_archive, enable_replay
+from .cli import build_parser, print_parsed
+from .fetch import polite_get, print_connection_stats, run_concurrently
+from .google import open_spreadsheet
+from .http_cache import cached_get, close_cache, load_parsed, save_parsed
+from .parsers import make_listing_soup, make_soup
+from .pipeline import chunked, detail_stage, plan_stage, print_sink, unique
+from .profiling import start_profiling
+from .records import ListingRecord
+from .schema import compile_plan
+from .seen_index import open_seen_index
+from .sheets import frames, sheet_sink, upsert_sink
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# SCRAPER_BASE_URL points the scraper at another host, e.g. the local stub (benchmarks/stub_server.py)
+BASE_URL = os.environ.get("SCRAPER_BASE_URL", "https://www.myjobmag.com").rstrip("/")
+TODAY_URL = f"{BASE_URL}/jobs-by-date/today"
+headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+# Cache key for parsed detail pages - bump it whenever get_job_details output changes
+DETAILS_PARSER_KEY = "scraperr:1"
+
+# Detail page columns -> schema fields (see schema.py)
+DETAILS_COLUMNS = {
+    "Title": "title",
+    "Company": "company",
+    "Experience": "experience",
+    "Qualification": "qualification",
+    "Job Type": "job_type",
+    "State": "state",
+    "City": "city",
+    "Salary": "salary_in_text",
+    "Field": "job_field",
+    "Posted on": "posted_date",
+    "Deadline": "deadline_date",
+    "Apply": "job_url"
+}
+DETAILS_PLAN = compile_plan(DETAILS_COLUMNS)
+
+
+# --------------------------------------------
+# SCRAPING FUNCTIONS
+# --------------------------------------------
+def parse_total_pages(soup):
+    """Read the number of today's job pages from a parsed listing page."""
+    # Look for pagination - adjust selector based on actual HTML structure
+    pagination = soup.select("ul.setPaginate li a")
+    
+    if not pagination:
+        return 1  # Only one page
+    
+    # Get the last page number
+    page_numbers = []
+    for link in pagination:
+        text = link.get_text(strip=True)
+        if text.isdigit():
+            page_numbers.append(int(text))
+    
+    return max(page_numbers) if page_numbers else 1
+
+
+def parse_jobs(soup):
+    """Extract the job summaries from a parsed listing page."""
+    jobs = []
+    for job_div in soup.select("li.job-list-li"):
+        title_tag = job_div.select_one("h2 a")
+        location_tag = job_div.select_one("span a")
+
+        if not title_tag or not title_tag.get("href"):
+            continue
+
+        title_text = title_tag.get_text(strip=True)
+
+        if " at " in title_text:
+            parts = title_text.split(" at ", 1)
+            title = parts[0].strip()
+            company = parts[1].strip()
+        else:
+            title = title_text.strip()
+            company = None
+
+        location = location_tag.get_text(strip=True) if location_tag else None
+        link = BASE_URL + title_tag["href"]
+
+        jobs.append(ListingRecord(title, company, location, link))
+    return jobs
+
+
+def get_page_url(page_num):
+    """URL of one page of today's listings."""
+    if page_num == 1:
+        return TODAY_URL
+    return f"{TODAY_URL}?page={page_num}"
+
+
+def get_total_pages():
+    """Find out how many pages of jobs exist for today."""
+    return parse_total_pages(fetch_listing(TODAY_URL))
+
+
+def fetch_listing(url):
+    """Download and parse one listing page, timed as the "listing" stage."""
+    with metrics.timed("listing") as call:
+        response = polite_get(url, headers=headers)
+        call["bytes"] = len(response.content)
+        soup = make_listing_soup(response.text)
+        call["items"] = len(soup.select("li.job-list-li"))
+    return soup
+
+
+def get_jobs_from_page(page_num=1):
+    """Fetch job listings from a specific page number."""
+    url = get_page_url(page_num)
+    
+    print(f"📄 Scraping page {page_num}: {url}")
+    soup = fetch_listing(url)
+
+    jobs = parse_jobs(soup)
+    print(f"   Found {len(jobs)} jobs on page {page_num}")
+    return jobs
+
+
+def iter_today_job_pages(max_pages=5):
+    """
+    Yield today's job listings one page (a list of jobs) at a time.
+
+    Page 1 is downloaded once and used for both the page count and its jobs.
+    The remaining pages are fetched concurrently under the shared rate limit
+    and yielded in page order, de-duplicated, since jobs can shift across
+    page boundaries while the crawl runs.
+    """
+    print(f"📄 Scraping page 1: {TODAY_URL}")
+    soup = fetch_listing(TODAY_URL)
+
+    total_pages = parse_total_pages(soup)
+    print(f"📊 Total pages to scrape: {total_pages}")
+    
+    # Limit pages if specified
+    if max_pages:
+        total_pages = min(total_pages, max_pages)
+        print(f"   (Limited to {max_pages} pages)")
+
+    first_page_jobs = parse_jobs(soup)
+    print(f"   Found {len(first_page_jobs)} jobs on page 1")
+
+    seen_links = set()
+    total = duplicates = 0
+
+    def new_jobs(jobs):
+        nonlocal total, duplicates
+        fresh = []
+        for job in jobs:
+            if job["link"] in seen_links:
+                duplicates += 1
+                continue
+            seen_links.add(job["link"])
+            fresh.append(job)
+        total += len(fresh)
+        return fresh
+
+    yield new_jobs(first_page_jobs)
+
+    # run_concurrently yields in page order, whatever order the pages finish in
+    for page, jobs, error in run_concurrently(get_jobs_from_page, range(2, total_pages + 1)):
+        if error:
+            print(f"❌ Error scraping page {page}: {error}")
+            continue
+        yield new_jobs(jobs)
+
+    if duplicates:
+        print(f"   Dropped {duplicates} jobs that shifted across page boundaries")
+    print(f"\n✅ Total jobs found: {total}")
+
+
+def get_all_today_jobs(max_pages=5):
+    """Fetch all today's job listings from all pages."""
+    return [job for jobs in iter_today_job_pages(max_pages) for job in jobs]
+
+
+def get_job_details(job_url):
+    """Fetch one job posting and extract its details."""
+    response = cached_get(job_url, headers=headers)
+    if response.from_cache:
+        # Unchanged page: reuse the record parsed from this exact body
+        record = load_parsed(job_url, DETAILS_PARSER_KEY)
+        if record is not None:
+            return DETAILS_PLAN.layout.from_mapping(record)
+
+    record = parse_job_details(response.text, job_url, page_url=response.url)
+    save_parsed(job_url, DETAILS_PARSER_KEY, record)
+    return record
+
+
+def parse_job_details(html, job_url, page_url=None, backend=None):
+    """Extract detailed info for one job posting from its HTML."""
+    soup = make_soup(html, backend)
+    return DETAILS_PLAN.extract(soup, job_url=job_url, page_url=page_url or job_url)
+
+
+# --------------------------------------------
+# MAIN SCRAPING WORKFLOW
+# --------------------------------------------
+def main(argv=None):
+    args = build_parser("Scrape today's MyJobMag jobs into the MyJobMag_Jobs_Latest sheet.",
+                        "Google Sheets").parse_args(argv)
+    if args.parse_only:
+        print_parsed(args.parse_only, parse_job_details)
+        return
+    metrics.start_run("scraperr")
+    if args.profile:
+        start_profiling("scraperr", args.profile)
+    if args.replay:
+        enable_replay(args.replay)
+        # A replay never writes to Google Sheets or the job API
+        args.dry_run = True
+
+    # Step 1 -> 2: today's job listings from all pages stream into the detail fetcher
+    # Set max_pages=None to scrape all pages, or max_pages=5 to limit
+    # (pages download concurrently within the host's rate limit and parse in worker
+    # processes; unchanged jobs are reused from the seen-jobs index)
+    index = open_seen_index("scraperr", DETAILS_PARSER_KEY)
+    known = {}
+    jobs = plan_stage(iter_today_job_pages(max_pages=None), index, known)
+    details = (record for _, record in detail_stage(jobs, DETAILS_COLUMNS, DETAILS_PARSER_KEY, headers,
+                                                    known=known, index=index))
+
+    # Step 3 -> 4: de-duplicated records reach the Google Sheet in chunks
+    chunks = chunked(unique(details))
+    if args.dry_run:
+        print_sink(chunks)
+    else:
+        save_to_google_sheet(frames(chunks, DETAILS_COLUMNS), key="Apply")
+    print_connection_stats()
+    close_cache()
+    close_archive()
+    if index:
+        index.close()
+
+# --------------------------------------------
+# GOOGLE SHEETS INTEGRATION
+# --------------------------------------------
+def save_to_google_sheet(df, sheet_name="MyJobMag_Jobs_Latest", replace=True, key=None):
+    """
+    Write a DataFrame, or an iterable of DataFrame chunks, to the first worksheet.
+
+    With a `key` column the sheet is upserted (only new, changed and, with
+    replace, removed rows are written) instead of cleared and rewritten.
+    """
+    sh = open_spreadsheet(sheet_name)
+
+    try:
+        worksheet = sh.get_worksheet(0)
+    except IndexError:
+        worksheet = sh.add_worksheet(title="Today_Jobs", rows=1000, cols=20)
+
+    if key:
+        upsert_sink(worksheet, df, key, delete_missing=replace)
+    else:
+        sheet_sink(worksheet, df, replace)
+
+    print(f"🔗 Google Sheet link: https://docs.google.com/spreadsheets/d/{sh.id}")
+
+
+# --------------------------------------------
+# RUN SCRIPT
+# --------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""Persistent index of jobs already seen, so repeat runs only fetch new or changed jobs."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+from .archive import replaying
+from .http_cache import CACHE_DIR
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# Lives next to the HTTP cache so the same Actions cache step restores it
+SEEN_INDEX_PATH = os.environ.get("SCRAPER_SEEN_INDEX", os.path.join(CACHE_DIR, "seen_jobs.sqlite"))
+
+# Set SCRAPER_INCREMENTAL=0 to fetch every job's details regardless of the index
+INCREMENTAL = os.environ.get("SCRAPER_INCREMENTAL", "1") != "0"
+
+# Incremental pagination: stop after this many consecutive listing pages of known jobs
+STOP_AFTER_KNOWN_PAGES = int(os.environ.get("SCRAPER_STOP_AFTER_KNOWN_PAGES", "2"))
+
+# Set SCRAPER_FULL_CRAWL=1 to walk every listing page even when the index says we can stop
+FULL_CRAWL = os.environ.get("SCRAPER_FULL_CRAWL", "0") == "1"
+
+# Re-fetch a known, unchanged job once its stored details are this old
+REFETCH_SECONDS = int(os.environ.get("SCRAPER_REFETCH_HOURS", "24")) * 3600
+
+# Drop jobs that have not appeared in a listing for this long
+MAX_AGE_SECONDS = int(os.environ.get("SCRAPER_SEEN_MAX_AGE_DAYS", "30")) * 24 * 3600
+
+
+def canonical_job_key(link):
+    """Canonical key for a job link: its lowercased path, e.g. '/job/hr-associate-hr-aid'."""
+    path = urlparse(link).path.rstrip("/").lower()
+    return path or link
+
+
+def fingerprint(value):
+    """Stable short hash of any JSON-serializable value."""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def listing_fingerprint(job):
+    """Fingerprint of what the listing page shows about a job."""
+    return fingerprint([job.get("title"), job.get("company"), job.get("location")])
+
+
+class SeenIndex:
+    """
+    SQLite-backed record of each job's first sighting, last fetch and content fingerprint.
+
+    Stored records are only reused by the extractor that produced them:
+    rows written under another `parser_key` (e.g. before a scraper's
+    DETAILS_PARSER_KEY was bumped for new columns) count as stale.
+    """
+
+    def __init__(self, path, source, parser_key=None):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.source = source
+        self.parser_key = parser_key
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                source TEXT NOT NULL,
+                job_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_listed REAL NOT NULL,
+                last_fetched REAL,
+                listing_fingerprint TEXT,
+                content_fingerprint TEXT,
+                record TEXT,
+                parser_key TEXT,
+                PRIMARY KEY (source, job_key)
+            )
+        """)
+        # Indexes written before records carried their parser key: their rows read as stale
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if "parser_key" not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN parser_key TEXT")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_last_listed ON jobs (last_listed)")
+        self.conn.commit()
+
+    def contains(self, link):
+        """
+        True if the job behind this link has details stored by this parser.
+
+        Jobs that were listed but never fetched successfully (or were stored
+        by another parser) do not count, so they keep later pages in the crawl.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM jobs WHERE source = ? AND job_key = ? "
+                "AND record IS NOT NULL AND parser_key IS ?",
+                (self.source, canonical_job_key(link), self.parser_key),
+            ).fetchone()
+        return row is not None
+
+    def all_known(self, jobs):
+        """True if every job in a (non-empty) listing page already has stored details."""
+        return bool(jobs) and all(self.contains(job["link"]) for job in jobs)
+
+    def listed_since(self, cutoff, exclude=()):
+        """Stored details records (from this parser) of jobs listed at or after `cutoff`, keyed by link."""
+        exclude = {canonical_job_key(link) for link in exclude}
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT job_key, url, record FROM jobs "
+                "WHERE source = ? AND last_listed >= ? AND record IS NOT NULL AND parser_key IS ? "
+                "ORDER BY first_seen",
+                (self.source, cutoff, self.parser_key),
+            ).fetchall()
+        return {url: json.loads(record) for key, url, record in rows if key not in exclude}
+
+    def plan(self, jobs):
+        """
+        Mark listing entries as seen and split them by whether they need a fetch.
+
+        Returns (to_fetch, known) where `to_fetch` is the list of jobs that are
+        new, changed on the listing page, stale or stored by another parser,
+        and `known` maps each remaining job's link to the details record
+        stored for it.
+        """
+        now = time.time()
+        to_fetch, known = [], {}
+        with self.lock:
+            for job in jobs:
+                key = canonical_job_key(job["link"])
+                row = self.conn.execute(
+                    "SELECT last_fetched, listing_fingerprint, record, parser_key FROM jobs "
+                    "WHERE source = ? AND job_key = ?",
+                    (self.source, key),
+                ).fetchone()
+
+                if row is None:
+                    self.conn.execute(
+                        "INSERT INTO jobs (source, job_key, url, first_seen, last_listed) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (self.source, key, job["link"], now, now),
+                    )
+                    to_fetch.append(job)
+                    continue
+
+                self.conn.execute(
+                    "UPDATE jobs SET last_listed = ? WHERE source = ? AND job_key = ?",
+                    (now, self.source, key),
+                )
+                last_fetched, listed_fp, record, parser_key = row
+                if (record is None
+                        or parser_key != self.parser_key
+                        or listed_fp != listing_fingerprint(job)
+                        or now - (last_fetched or 0) > REFETCH_SECONDS):
+                    to_fetch.append(job)
+                else:
+                    known[job["link"]] = json.loads(record)
+            self.conn.commit()
+        return to_fetch, known
+
+    def record_fetch(self, job, details):
+        """Store a freshly fetched job's details. Returns True if its content changed."""
+        key = canonical_job_key(job["link"])
+        details = dict(details)
+        content_fp = fingerprint(details)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT content_fingerprint FROM jobs WHERE source = ? AND job_key = ?",
+                (self.source, key),
+            ).fetchone()
+            now = time.time()
+            self.conn.execute(
+                "INSERT INTO jobs (source, job_key, url, first_seen, last_listed, last_fetched, "
+                "listing_fingerprint, content_fingerprint, record, parser_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, job_key) DO UPDATE SET "
+                "url = excluded.url, last_fetched = excluded.last_fetched, "
+                "listing_fingerprint = excluded.listing_fingerprint, "
+                "content_fingerprint = excluded.content_fingerprint, record = excluded.record, "
+                "parser_key = excluded.parser_key",
+                (self.source, key, job["link"], now, now, now, listing_fingerprint(job),
+                 content_fp, json.dumps(details, ensure_ascii=False), self.parser_key),
+            )
+            self.conn.commit()
+        return row is None or row[0] != content_fp
+
+    def prune(self, max_age_seconds=MAX_AGE_SECONDS):
+        """Forget jobs not listed within `max_age_seconds`. Returns rows removed."""
+        with self.lock:
+            removed = self.conn.execute(
+                "DELETE FROM jobs WHERE last_listed < ?", (time.time() - max_age_seconds,)
+            ).rowcount
+            self.conn.commit()
+        return removed
+
+    def close(self):
+        removed = self.prune()
+        if removed:
+            print(f"🧹 Pruned {removed} old jobs from the seen-jobs index")
+        with self.lock:
+            self.conn.close()
+
+
+def open_seen_index(source, parser_key):
+    """
+    Open the shared seen-jobs index for one scraper, or None when incremental mode is off.
+
+    `parser_key` is the scraper's DETAILS_PARSER_KEY; only records stored
+    under it are reused.
+    """
+    # A replay re-extracts every archived job, so nothing counts as already seen
+    if not INCREMENTAL or replaying():
+        return None
+    return SeenIndex(SEEN_INDEX_PATH, source, parser_key)
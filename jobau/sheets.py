@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+Google Sheets sinks for the scrapers.
+
+`sheet_sink()` rewrites (or appends to) a worksheet chunk by chunk.
+`append_sink()` adds rows with the Sheets append API, so appending never
+has to read the sheet to find its last row.
+`upsert_sink()` keeps a worksheet in step with the latest records keyed on
+one column (the job URL): it reads only the key and (hidden) fingerprint
+columns, works out which rows were inserted, changed or deleted, and
+writes just those, so write volume follows the daily delta instead of the
+size of the board.
+
+Every sink writes cells as USER_ENTERED, like typing them in, so dates and
+numbers stay typed; text that would be read as a formula is escaped.
+
+pandas and gspread are imported on first use, so importing this module
+costs nothing on runs that never write to Sheets.
+"""
+
+import hashlib
+import math
+import os
+
+from . import metrics
+from .records import as_rows
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+# Extra trailing (hidden) column holding each row's fingerprint (hash of its
+# values). Renamed whenever the way rows are written changes, so sheets
+# written the old way get one full rewrite.
+FINGERPRINT_COLUMN = "_fingerprint_2"
+
+# Cell texts starting with these are prefixed with ' so Sheets keeps them as text
+ESCAPED_PREFIXES = ("=", "+", "'")
+
+# Appends are split into requests of at most this many bytes of cell text
+# (Google recommends payloads under 2 MB) and this many rows
+APPEND_MAX_BYTES = int(os.environ.get("SCRAPER_SHEETS_APPEND_MAX_BYTES", str(1024 * 1024)))
+APPEND_MAX_ROWS = int(os.environ.get("SCRAPER_SHEETS_APPEND_MAX_ROWS", "1000"))
+
+
+# --------------------------------------------
+# CHUNKED REWRITE / APPEND
+# --------------------------------------------
+def frames(chunks, columns):
+    """DataFrames of record chunks, with the columns in a fixed order (built from value tuples)."""
+    import pandas as pd
+
+    for chunk in chunks:
+        with metrics.timed("dataframe", items=len(chunk)):
+            frame = pd.DataFrame(as_rows(chunk, columns), columns=list(columns))
+        yield frame
+
+
+def _as_chunks(chunks):
+    """A lone DataFrame as a one-chunk list; anything else as it is."""
+    return [chunks] if hasattr(chunks, "itertuples") else chunks
+
+
+def sheet_sink(worksheet, chunks, replace=True):
+    """
+    Write DataFrame chunks one after another as they arrive.
+
+    With replace, the sheet is cleared and the header written with the first
+    chunk; every chunk after that lands below the rows already written.
+    Without it, chunks are appended below the existing table (append_sink).
+    """
+    chunks = _as_chunks(chunks)
+
+    from gspread_dataframe import set_with_dataframe
+
+    rows = 0
+    first = True
+    for chunk in chunks:
+        if first:
+            print(chunk.head())
+        if not replace:
+            append_sink(worksheet, chunk)
+        elif first:
+            with metrics.timed("sheet_write", items=len(chunk)):
+                worksheet.clear()
+                set_with_dataframe(worksheet, chunk)
+        else:
+            # Header on row 1, then the rows written so far
+            with metrics.timed("sheet_write", items=len(chunk)):
+                set_with_dataframe(worksheet, chunk, row=rows + 2, include_column_header=False)
+        first = False
+        rows += len(chunk)
+        print(f"   📝 {rows} rows written...")
+
+    if first and replace:
+        worksheet.clear()
+    if replace:
+        print(f"✅ Sheet replaced with latest job data ({rows} rows).")
+    else:
+        print(f"➕ New job data appended ({rows} rows).")
+
+
+def cell_text(value):
+    """A record value as the text stored in its cell ("" for missing)."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return str(value)
+
+
+def user_entered(text):
+    """A cell text as typed into the sheet: formula-like text is escaped with a leading '."""
+    return "'" + text if text.startswith(ESCAPED_PREFIXES) else text
+
+
+def append_batches(rows, max_bytes=None, max_rows=None):
+    """Split rows of cell texts into request-sized batches."""
+    max_bytes = max_bytes or APPEND_MAX_BYTES
+    max_rows = max_rows or APPEND_MAX_ROWS
+    batch, size = [], 0
+    for row in rows:
+        # Cell text plus JSON quoting and separators
+        row_size = sum(len(value.encode("utf-8")) + 3 for value in row) + 2
+        if batch and (size + row_size > max_bytes or len(batch) >= max_rows):
+            yield batch
+            batch, size = [], 0
+        batch.append(row)
+        size += row_size
+    if batch:
+        yield batch
+
+
+def append_sink(worksheet, chunks):
+    """
+    Append DataFrame chunks (without header) below a worksheet's table.
+
+    Uses values.append with INSERT_ROWS, so the API finds the end of the
+    table itself and the sheet is never read. Returns the number of rows
+    appended.
+    """
+    chunks = _as_chunks(chunks)
+
+    appended = 0
+    for chunk in chunks:
+        rows = ([user_entered(cell_text(value)) for value in record] for record in chunk.itertuples(index=False))
+        appended += _append_rows(worksheet, rows)
+    return appended
+
+
+def _append_rows(worksheet, rows):
+    """Append rows of cell texts below the table, in request-sized batches. Returns rows appended."""
+    appended = 0
+    for batch in append_batches(rows):
+        # USER_ENTERED, like set_with_dataframe, so numbers and dates stay typed
+        with metrics.timed("sheet_write", items=len(batch)) as call:
+            call["bytes"] = sum(len(value.encode("utf-8")) for row in batch for value in row)
+            worksheet.append_rows(batch, value_input_option="USER_ENTERED",
+                                  insert_data_option="INSERT_ROWS", table_range="A1")
+        appended += len(batch)
+    return appended
+
+
+# --------------------------------------------
+# UPSERT
+# --------------------------------------------
+def fingerprint(values):
+    """Short hash of a row's cell texts."""
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()[:16]
+
+
+def _sheet_row(values):
+    """Cell texts plus fingerprint as written: escaped, the fingerprint always as text."""
+    return [user_entered(value) for value in values[:-1]] + ["'" + values[-1]]
+
+
+def _row_ranges(rows):
+    """Group sorted 1-based row numbers into (first, last) runs."""
+    runs = []
+    for row in rows:
+        if runs and runs[-1][1] == row - 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return runs
+
+
+def _column_range(col):
+    """A1 range of one column below the header, e.g. 3 -> "C2:C"."""
+    from gspread.utils import rowcol_to_a1
+
+    letter = rowcol_to_a1(1, col)[:-1]
+    return f"{letter}2:{letter}"
+
+
+def _column_visibility(worksheet, first, last, hidden):
+    """Request hiding (or showing) the 1-based columns first..last for the people reading the sheet."""
+    return {"updateDimensionProperties": {
+        "range": {"sheetId": worksheet.id, "dimension": "COLUMNS", "startIndex": first - 1, "endIndex": last},
+        "properties": {"hiddenByUser": hidden},
+        "fields": "hiddenByUser",
+    }}
+
+
+def read_keys(worksheet, key_col, fp_col):
+    """
+    Read the header row plus the key and fingerprint columns in one request.
+
+    Returns (stored_header, {key: [(row, fingerprint), ...]}) with 1-based row numbers.
+    """
+    with metrics.timed("sheet_read") as call:
+        header_range, key_range, fp_range = worksheet.batch_get(
+            ["1:1", _column_range(key_col), _column_range(fp_col)]
+        )
+        call["items"] = len(key_range)
+    stored_header = header_range[0] if header_range else []
+
+    keys = [row[0] if row else "" for row in key_range]
+    fingerprints = [row[0] if row else "" for row in fp_range]
+    fingerprints += [""] * (len(keys) - len(fingerprints))
+
+    existing = {}
+    for offset, (key, fp) in enumerate(zip(keys, fingerprints)):
+        existing.setdefault(key, []).append((offset + 2, fp))
+    return stored_header, existing
+
+
+def upsert_sink(worksheet, chunks, key, delete_missing=True):
+    """
+    Upsert DataFrame chunks into a worksheet, keyed on the `key` column.
+
+    New keys are appended, rows whose fingerprint changed are rewritten in
+    place and, with delete_missing, rows whose key is no longer in the data
+    are removed. A sheet without the expected header (first run, or the
+    columns changed) is rewritten in full once, with the fingerprint
+    column hidden.
+    """
+    chunks = _as_chunks(chunks)
+
+    columns = None
+    rows = {}  # key -> cell texts + fingerprint, first occurrence wins
+    keyless = []  # rows without a key can't be matched; they are always re-inserted
+    for chunk in chunks:
+        if columns is None:
+            print(chunk.head())
+            columns = list(chunk.columns)
+            if key not in columns:
+                raise ValueError(f"Upsert key column {key!r} is not in the data")
+            key_index = columns.index(key)
+        for record in chunk.reindex(columns=columns).itertuples(index=False):
+            values = [cell_text(value) for value in record]
+            values.append(fingerprint(values))
+            if not values[key_index]:
+                keyless.append(values)
+            elif values[key_index] not in rows:
+                rows[values[key_index]] = values
+
+    if columns is None:
+        if delete_missing:
+            worksheet.clear()
+            print("✅ Sheet cleared (no job data).")
+        return
+
+    header = columns + [FINGERPRINT_COLUMN]
+    stored_header, existing = read_keys(worksheet, key_index + 1, len(header))
+
+    if stored_header != header:
+        # First run or different columns: one full rewrite in the upsert layout
+        with metrics.timed("sheet_write", items=0):
+            worksheet.clear()
+            if worksheet.col_count < len(header):
+                worksheet.resize(cols=len(header))
+            # clear() keeps column properties: show every column again so an old
+            # layout's fingerprint column doesn't stay hidden as a data column
+            worksheet.spreadsheet.batch_update({"requests": [
+                _column_visibility(worksheet, 1, max(worksheet.col_count, len(header)), False),
+                _column_visibility(worksheet, len(header), len(header), True),
+            ]})
+        _append_rows(worksheet, [[user_entered(name) for name in header],
+                                 *(_sheet_row(values) for values in [*rows.values(), *keyless])])
+        print(f"✅ Sheet rewritten with latest job data ({len(rows) + len(keyless)} rows; new header).")
+        return
+
+    updates, deletes, inserts = [], [], list(keyless)
+    for k, values in rows.items():
+        matches = existing.pop(k, None)
+        if not matches:
+            inserts.append(values)
+            continue
+        (row, stored_fp), duplicates = matches[0], matches[1:]
+        deletes.extend(duplicate_row for duplicate_row, _ in duplicates)
+        if stored_fp != values[-1]:
+            updates.append((row, values))
+    if delete_missing:
+        deletes.extend(row for matches in existing.values() for row, _ in matches)
+
+    # In order: rewrite changed rows in place, delete bottom-up so row numbers
+    # stay valid, then append the new rows after the last one
+    if updates:
+        from gspread.utils import absolute_range_name, rowcol_to_a1
+
+        data = [{"range": absolute_range_name(worksheet.title, f"A{row}:{rowcol_to_a1(row, len(header))}"),
+                 "values": [_sheet_row(values)]} for row, values in updates]
+        with metrics.timed("sheet_write", items=len(updates)):
+            worksheet.spreadsheet.values_batch_update({"valueInputOption": "USER_ENTERED", "data": data})
+    if deletes:
+        requests = [{"deleteDimension": {"range": {
+            "sheetId": worksheet.id, "dimension": "ROWS", "startIndex": first - 1, "endIndex": last,
+        }}} for first, last in reversed(_row_ranges(sorted(deletes)))]
+        with metrics.timed("sheet_write", items=len(deletes)):
+            worksheet.spreadsheet.batch_update({"requests": requests})
+    if inserts:
+        _append_rows(worksheet, (_sheet_row(values) for values in inserts))
+    print(f"✅ Sheet upserted: {len(inserts)} inserted, {len(updates)} changed, "
+          f"{len(deletes)} deleted, {len(rows) + len(keyless) - len(inserts) - len(updates)} unchanged.")
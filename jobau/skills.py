@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Skill extraction for job descriptions.
+
+The skill dictionary (data/skills.txt) is compiled once into a single
+prefix-trie regex with whole-word boundaries, so a description is scanned
+in one pass no matter how many skills are listed, and "Go" no longer
+matches inside "good". A batch of descriptions is scanned as one text.
+"""
+
+import os
+import re
+from bisect import bisect_right
+from collections import Counter
+
+# --------------------------------------------
+# CONFIGURATION
+# --------------------------------------------
+SKILLS_PATH = os.environ.get(
+    "SCRAPER_SKILLS_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skills.txt")
+)
+
+# Joins a batch of descriptions; can never be part of a match
+BATCH_SEPARATOR = "\n\x00\n"
+
+
+def load_skills(path=SKILLS_PATH):
+    """Read the skill dictionary: one skill per line, '#' comments, '=' prefix for exact case."""
+    skills = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            exact_case = line.startswith("=")
+            skills.append((line.lstrip("=").strip(), exact_case))
+    return skills
+
+
+# Offsets in the folded text match the original text (unlike str.lower())
+ASCII_FOLD = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def trie_pattern(words):
+    """Regex source for a prefix trie of `words`, e.g. ["go", "golang"] -> "go(?:lang)?"."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy: the longest skill at a position wins, shorter ones are the backtrack
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+class SkillMatcher:
+    """
+    All dictionary skills compiled into one whole-word regex.
+
+    The skills are merged into a prefix trie, so at each position the regex
+    engine follows one branch instead of trying every skill in turn, and the
+    text is case-folded once rather than per skill.
+    """
+
+    def __init__(self, skills):
+        self.order = {}
+        self.folded = {}
+        self.exact = {}
+        for name, exact_case in skills:
+            self.order.setdefault(name, len(self.order))
+            target = self.exact if exact_case else self.folded
+            target[name.translate(ASCII_FOLD)] = name
+
+        self.pattern = re.compile(
+            r"(?<!\w)" + trie_pattern(set(self.folded) | set(self.exact)) + r"(?!\w)"
+        )
+
+        # A longer match hides the skills inside it ("Power BI" contains "BI");
+        # count those too, as the old substring check did
+        self.contained = {name: self._inner_matches(name) for name in self.order}
+
+    def _inner_matches(self, name):
+        """Every dictionary skill that occurs as a whole word inside `name`."""
+        found = []
+        for other in self.order:
+            if other == name or len(other) >= len(name):
+                continue
+            flags = 0 if other in self.exact.values() else re.IGNORECASE
+            if re.search(r"(?<!\w)" + re.escape(other) + r"(?!\w)", name, flags):
+                found.append(other)
+        return found
+
+    def _matches(self, text):
+        """Yield (position, skill) for each whole-word skill mention in `text`."""
+        for match in self.pattern.finditer(text.translate(ASCII_FOLD)):
+            key = match.group(0)
+            skill = self.folded.get(key)
+            if skill is None:
+                # Exact-case skills ("Go", "Word") only count in their own spelling
+                skill = self.exact.get(key)
+                if skill is None or text[match.start():match.end()] != skill:
+                    continue
+            yield match.start(), skill
+
+    def count(self, text):
+        """Counter of skill -> occurrences in one text."""
+        counts = Counter()
+        for _, skill in self._matches(text or ""):
+            counts[skill] += 1
+            for inner in self.contained[skill]:
+                counts[inner] += 1
+        return counts
+
+    def count_batch(self, texts):
+        """One Counter per text, from a single scan over the whole batch."""
+        texts = [text or "" for text in texts]
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(BATCH_SEPARATOR)
+
+        counts = [Counter() for _ in texts]
+        for position, skill in self._matches(BATCH_SEPARATOR.join(texts)):
+            doc = counts[bisect_right(starts, position) - 1]
+            doc[skill] += 1
+            for inner in self.contained[skill]:
+                doc[inner] += 1
+        return counts
+
+    def rank(self, counts, limit=None):
+        """Skills by frequency, ties in dictionary order."""
+        ranked = sorted(counts, key=lambda skill: (-counts[skill], self.order[skill]))
+        return ranked[:limit] if limit else ranked
+
+
+_matcher = None
+
+
+def get_matcher():
+    """The shared matcher for the skill dictionary, compiled on first use."""
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher(load_skills())
+    return _matcher
+
+
+def extract_skills(text, limit=None):
+    """Skills mentioned in `text`, most frequent first."""
+    matcher = get_matcher()
+    return matcher.rank(matcher.count(text), limit)
+
+
+def extract_skills_batch(texts, limit=None):
+    """extract_skills for many texts at once, scanned in one pass."""
+    matcher = get_matcher()
+    return [matcher.rank(counts, limit) for counts in matcher.count_batch(texts)]
@@ -0,0 +1,34 @@
+import glob
+import os
+import sys
+
+import pytest
+
+# Run from anywhere: the jobau package lives at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+CORPUS = os.path.join(ROOT, "benchmarks", "corpus")
+
+
+@pytest.fixture
+def listing_pages(monkeypatch):
+    """Every scraper's polite_get answering with 4 saved listing pages, then an empty one."""
+    import requests
+
+    from jobau import scraper, scraper_api
+
+    html = open(sorted(glob.glob(os.path.join(CORPUS, "listing_*.html")))[0], encoding="utf-8").read()
+    requested = []
+
+    def polite_get(url, **kwargs):
+        requested.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = (html if len(requested) <= 4 else "<html></html>").encode("utf-8")
+        return response
+
+    for module in (scraper, scraper_api):
+        monkeypatch.setattr(module, "polite_get", polite_get)
+    return requested
@@ -0,0 +1,74 @@
+import os
+import time
+
+import pytest
+import requests
+
+from jobau import archive
+from jobau.http_cache import HttpCache
+
+
+def response(url, body, status=200, headers=None):
+    r = requests.Response()
+    r.url = url
+    r.status_code = status
+    r.headers.update(headers or {"Content-Type": "text/html"})
+    r.encoding = "utf-8"
+    r._content = body
+    return r
+
+
+@pytest.fixture
+def shared_archive(tmp_path, monkeypatch):
+    """The process-wide archive, in a temporary directory."""
+    monkeypatch.setattr(archive, "ARCHIVE_DIR", str(tmp_path / "archive"))
+    monkeypatch.setattr(archive, "ARCHIVE_ENABLED", True)
+    monkeypatch.setattr(archive, "_archive", None)
+    monkeypatch.setattr(archive, "_replay", False)
+    yield
+    archive.close_archive()
+
+
+def test_record_and_replay_round_trip(tmp_path):
+    store = archive.Archive(str(tmp_path))
+    store.record("https://x.test/a", response("https://x.test/a", b"<p>one</p>"))
+    store.record("https://x.test/a", response("https://x.test/a", b"<p>two</p>"))
+    replayed = store.response("https://x.test/a")
+    assert replayed.status_code == 200 and replayed.text == "<p>two</p>"
+    assert replayed.headers["content-type"] == "text/html"
+    assert store.response("https://x.test/missing").status_code == 404
+    assert store.reindex() == 2
+    store.close()
+
+
+def test_prune_drops_old_and_oversized_segments_but_keeps_the_newest(tmp_path):
+    store = archive.Archive(str(tmp_path), segment_bytes=1)  # one entry per segment
+    for i in range(4):
+        store.record(f"https://x.test/{i}", response(f"https://x.test/{i}", os.urandom(2000)))
+    store.conn.execute("UPDATE pages SET fetched_at = ? WHERE url = 'https://x.test/0'", (time.time() - 90 * 86400,))
+    store.conn.commit()
+
+    assert store.prune(max_age_seconds=30 * 86400, max_bytes=10 ** 9) == 1
+    assert not store.contains("https://x.test/0")
+    assert store.prune(max_age_seconds=30 * 86400, max_bytes=1) == 2
+    assert store.summary()[:3] == (1, 1, 1)
+    assert store.response("https://x.test/3").status_code == 200
+    store.close()
+
+
+def test_pages_served_by_the_http_cache_are_archived_once(tmp_path, shared_archive):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"))
+    url = "https://x.test/job/1"
+    cache.store(url, response(url, b"<p>cached</p>"))
+
+    assert cache.get(url).from_cache
+    assert cache.get(url).from_cache
+    store = archive.get_archive()
+    assert store.stats["archived"] == 1
+    assert store.response(url).text == "<p>cached</p>"
+    cache.close()
+
+
+def test_enable_replay_needs_an_archive(tmp_path, shared_archive):
+    with pytest.raises(FileNotFoundError):
+        archive.enable_replay(str(tmp_path / "nothing"))
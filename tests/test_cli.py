@@ -0,0 +1,26 @@
+import pytest
+
+from jobau import scraper, scraper_api
+from jobau.cli import build_parser
+
+
+def test_full_crawl_flag_only_where_asked():
+    assert build_parser("x", "y", full_crawl=True).parse_args(["--full-crawl"]).full_crawl
+    assert not build_parser("x", "y", full_crawl=True).parse_args([]).full_crawl
+    with pytest.raises(SystemExit):
+        build_parser("x", "y").parse_args(["--full-crawl"])
+
+
+class KnowsEverything:
+    def all_known(self, jobs):
+        return True
+
+
+@pytest.mark.parametrize("module", [scraper, scraper_api])
+def test_incremental_walk_stops_on_known_pages_unless_full_crawl(module, listing_pages):
+    pages = list(module.iter_today_job_pages(seen=KnowsEverything(), full_crawl=False))
+    assert len(pages) == module.STOP_AFTER_KNOWN_PAGES
+
+    listing_pages.clear()
+    pages = list(module.iter_today_job_pages(seen=KnowsEverything(), full_crawl=True))
+    assert len(pages) == 4 and len(listing_pages) == 5
@@ -0,0 +1,107 @@
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from jobau import scraper
+from jobau.extract import Field, Plan
+from jobau.records import JobRecord
+from jobau.schema import clean_text, compile_plan, split_title
+
+PAGE = """
+<html><body>
+  <h1>HR Associate at HR Aid</h1>
+  <ul class="job-key-info">
+    <li><span class="jkey-title">Job Type</span><span class="jkey-info">Full Time</span></li>
+    <li><span class="jkey-title">Location</span><span class="jkey-info"><a>Lagos</a></span></li>
+    <li><span class="jkey-title">Experience</span><span class="jkey-info">2 years</span></li>
+  </ul>
+  <div class="job-details-section">
+    <p>First paragraph.</p>
+    <p>Salary: N250,000 monthly.</p>
+    <h3>Responsibilities</h3>
+    <ul><li>Hire people</li></ul>
+  </div>
+  <div class="side" data-kind="ad promo"><p>Ad</p></div>
+  <h2 id="application-method">Method of Application</h2>
+</body></html>
+"""
+
+
+def soup(html=PAGE):
+    return BeautifulSoup(html, "html.parser")
+
+
+def test_scraper_details_in_one_pass():
+    record = scraper.parse_job_details(PAGE, "https://x.test/job/1")
+    assert list(record) == list(scraper.DETAILS_COLUMNS)
+    assert record["Title"] == "HR Associate"
+    assert record["Company"] == "HR Aid"
+    assert record["Job Type"] == "Full Time"
+    assert record["State"] == "Lagos"
+    assert record["Experience"] == "2 years"
+    assert record["Salary"].startswith("N250,000")
+    assert "Hire people" in record["Description"]
+    assert record["URL"] == "https://x.test/job/1"
+
+
+def test_selectors_match_like_css():
+    fields = [
+        Field("first_p", select="div.job-details-section p:first-of-type", text={"strip": True}),
+        Field("all_p", select="div p", all=True, extract=lambda nodes, r: [n.get_text() for n in nodes]),
+        Field("by_attr", select="div[data-kind*='promo'] p", text={"strip": True}),
+        Field("by_id", select="#application-method", text={"strip": True}),
+        Field("either", select="h3, h2", text={"strip": True}),
+    ]
+    record = Plan(fields, {f.name: f.name for f in fields}).extract(soup())
+    page = soup()
+    assert record["first_p"] == "First paragraph."
+    assert record["all_p"] == [p.get_text() for p in page.select("div p")]
+    assert record["by_attr"] == "Ad"
+    assert record["by_id"] == "Method of Application"
+    assert record["either"] == page.select_one("h3, h2").get_text(strip=True)
+
+
+def test_priority_lists_regex_derive_fallback_and_context():
+    fields = [
+        Field("summary", select=["div.job-summary", "div.job-details-section"], text={"strip": True}),
+        Field("missing", select="div.nothing-here", fallback="heading"),
+        Field("heading", select="h1", text={"strip": True}),
+        Field("salary", source="page_text", regex=re.compile(r"Salary:\s*(N[\d,]+)")),
+        Field("shout", derive=lambda r: r["heading"].upper(), needs=["heading"], post=[lambda v: v + "!"]),
+    ]
+    plan = Plan(fields, {"Summary": "summary", "Missing": "missing", "Salary": "salary",
+                         "Shout": "shout", "URL": "job_url"})
+    record = plan.extract(soup(), job_url="https://x.test/job/1", page_url="https://x.test/job/1")
+    assert isinstance(record, JobRecord)
+    assert list(record) == ["Summary", "Missing", "Salary", "Shout", "URL"]
+    assert record["Summary"].startswith("First paragraph.")
+    assert record["Missing"] == "HR Associate at HR Aid"
+    assert record["Salary"] == "N250,000"
+    assert record["Shout"] == "HR ASSOCIATE AT HR AID!"
+    assert record["URL"] == "https://x.test/job/1"
+
+
+def test_plans_compile_only_known_fields():
+    with pytest.raises(KeyError):
+        Plan([Field("a", select="p")], {"A": "a", "B": "b"})
+
+
+def test_schema_extracts_a_job_page():
+    plan = compile_plan({"Title": "title", "Company": "company", "Job Type": "job_type", "State": "state",
+                         "Experience": "experience", "Salary": "salary", "Responsibilities": "responsibilities"})
+    record = plan.extract(soup(), job_url="https://x.test/job/1", page_url="https://x.test/job/1")
+    assert record["Title"] == "HR Associate"
+    assert record["Company"] == "HR Aid"
+    assert record["Job Type"] == "Full Time"
+    assert record["State"] == "Lagos"
+    assert record["Experience"] == "2 years"
+    assert record["Salary"].startswith("N250,000")
+    assert "Hire people" in record["Responsibilities"]
+
+
+def test_schema_helpers():
+    assert split_title("HR Associate at HR Aid at Lagos") == ("HR Associate", "HR Aid at Lagos")
+    assert split_title("Driver") == ("Driver", None)
+    assert clean_text("  a\r\nb   c’s ") == "a b c's"
+    assert clean_text("") is None
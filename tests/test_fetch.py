@@ -0,0 +1,64 @@
+import random
+
+from jobau import fetch
+
+
+def controller(limit=4, rate=2.0):
+    return fetch.AdaptiveController("host.test", limit=limit, bucket=fetch.TokenBucket(rate))
+
+
+def respond(ctrl, latencies, monkeypatch):
+    # A clock that moves one response's latency per request, so rate-limited cuts can happen
+    clock = [1000.0]
+    monkeypatch.setattr(fetch.time, "monotonic", lambda: clock[0])
+    for latency in latencies:
+        ctrl.acquire()
+        clock[0] += latency
+        ctrl.release(latency)
+
+
+def test_jittery_unthrottled_host_keeps_its_throughput(monkeypatch):
+    rng = random.Random(1)
+    ctrl = controller()
+    respond(ctrl, [0.15 + rng.uniform(-0.1, 0.1) for _ in range(500)], monkeypatch)
+    assert ctrl.limit >= 4
+    assert ctrl.rate >= 2.0
+
+
+def test_jitter_on_a_fast_host_is_not_congestion(monkeypatch):
+    rng = random.Random(2)
+    ctrl = controller()
+    respond(ctrl, [rng.choice([0.001, 0.002, 0.02]) for _ in range(500)], monkeypatch)
+    assert ctrl.limit > 4
+    assert ctrl.rate > 2.0
+
+
+def test_sustained_latency_cuts_back_to_the_configured_floor(monkeypatch):
+    ctrl = controller()
+    respond(ctrl, [0.1] * 200, monkeypatch)
+    grown = ctrl.limit
+    assert grown > 4
+    respond(ctrl, [2.0] * 40, monkeypatch)
+    assert ctrl.limit < grown
+    assert ctrl.limit >= 4
+    assert ctrl.rate >= 2.0
+
+
+def test_a_single_slow_response_does_not_cut(monkeypatch):
+    ctrl = controller()
+    respond(ctrl, [0.1] * 50 + [3.0] + [0.1] * 3, monkeypatch)
+    assert ctrl.limit >= 4
+
+
+def test_throttling_goes_below_the_configured_floor(monkeypatch):
+    ctrl = controller()
+    clock = [1000.0]
+    monkeypatch.setattr(fetch.time, "monotonic", lambda: clock[0])
+    for _ in range(6):
+        ctrl.acquire()
+        clock[0] += 0.1
+        ctrl.release(throttled=True, retry_after=0)
+        clock[0] += 1
+    assert ctrl.limit == 1
+    assert ctrl.rate == fetch.MIN_REQUESTS_PER_SECOND
+    assert ctrl.throttled == 6
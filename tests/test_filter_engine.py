@@ -0,0 +1,74 @@
+import glob
+import os
+
+import pytest
+
+from jobau import scraper_api
+from jobau.filter_engine import PASSED, JobFilter, compile_filters, experience_years
+
+CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpus")
+
+FILTERS = {
+    'required_fields': ['Company', 'Description', 'Apply Now'],
+    'industries': ['ict / computer', 'Engineering / Technical'],
+    'blocked_industries': [],
+    'job_types': [],
+    'locations': [],
+    'min_experience': None,
+    'require_salary': False,
+}
+
+
+def job(**values):
+    base = {"Title": "Engineer", "Company": "Acme", "Description": "Build things",
+            "Apply Now": "https://acme.example/apply", "Field": "ICT / Computer", "Industry": None,
+            "Job Type": "Full Time", "City": "Ikeja", "State": "Lagos", "Experience": "Mid Level",
+            "Salary": "Not specified"}
+    base.update(values)
+    return base
+
+
+CASES = [
+    (job(), FILTERS, (True, PASSED)),
+    (job(Company=""), FILTERS, (False, "Missing required field: Company")),
+    (job(Description="   "), FILTERS, (False, "Missing required field: Description")),
+    (job(**{"Apply Now": "mailto:jobs@acme.example"}), FILTERS, (False, "Email-based application excluded")),
+    (job(Field="Sales / Marketing"), FILTERS, (False, "Industry not in allowed list: ['sales / marketing']")),
+    (job(Field=None, Industry=["Engineering / Technical"]), FILTERS, (True, PASSED)),
+    (job(), {**FILTERS, 'blocked_industries': ['ICT']}, (False, "Industry is blocked: ict / computer")),
+    (job(), {**FILTERS, 'job_types': ['contract']}, (False, "Job type not allowed: full time")),
+    (job(), {**FILTERS, 'locations': ['abuja']}, (False, "Location not in allowed list")),
+    (job(), {**FILTERS, 'locations': ['lagos']}, (True, PASSED)),
+    (job(), {**FILTERS, 'min_experience': 5}, (False, "Experience level too low: mid level")),
+    (job(), {**FILTERS, 'require_salary': True}, (False, "Salary not specified")),
+    (job(Salary=float("nan")), {**FILTERS, 'require_salary': True}, (False, "Salary not specified")),
+]
+
+
+@pytest.mark.parametrize("job_data, filters, expected", CASES)
+def test_check_and_evaluate_agree(job_data, filters, expected):
+    job_filter = JobFilter(filters)
+    assert job_filter.check(job_data) == expected
+    mask, reasons = job_filter.evaluate([job_data])
+    assert (bool(mask.iloc[0]), reasons.iloc[0]) == expected
+
+
+def test_check_matches_evaluate_over_the_corpus():
+    records = [scraper_api.parse_job_details(open(path, encoding="utf-8").read(), f"https://x.test/job/{i}")
+               for i, path in enumerate(sorted(glob.glob(os.path.join(CORPUS, "detail_*.html"))))]
+    assert records
+    job_filter = JobFilter(FILTERS)
+    mask, reasons = job_filter.evaluate(records)
+    assert [job_filter.check(record) for record in records] == list(zip(mask.tolist(), reasons.tolist()))
+
+
+def test_compile_filters_reuses_the_last_compiled_config():
+    filters = {**FILTERS, 'job_types': ['full time']}
+    first = compile_filters(filters)
+    assert compile_filters(dict(filters)) is first
+    filters['job_types'].append('contract')
+    assert compile_filters(filters) is not first
+
+
+def test_experience_years():
+    assert [experience_years(e) for e in ("Entry Level", "Senior", "Mid Level", None)] == [0, 5, 2, 0]
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+import requests
+
+from jobau import http_cache
+from jobau.http_cache import HttpCache
+
+URL = "https://www.myjobmag.com/job/engineer-1"
+
+
+def response(status, body=b"", headers=None):
+    r = requests.Response()
+    r.url = URL
+    r.status_code = status
+    r.headers.update(headers or {})
+    r.encoding = "utf-8"
+    r._content = body
+    return r
+
+
+@pytest.fixture
+def network(monkeypatch):
+    """polite_get answering from a queue of responses and recording the request headers."""
+    answers, sent = [], []
+
+    def polite_get(url, headers=None, **kwargs):
+        sent.append(dict(headers or {}))
+        return answers.pop(0)
+
+    monkeypatch.setattr(http_cache, "polite_get", polite_get)
+    monkeypatch.setattr(http_cache, "archive_cached", lambda url, response: None)
+    return answers, sent
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), fresh_seconds=60)
+    yield cache
+    cache.close()
+
+
+def test_fresh_entries_are_served_without_a_request(cache, network):
+    answers, sent = network
+    answers.append(response(200, b"<p>v1</p>", {"ETag": '"v1"'}))
+    assert not cache.get(URL).from_cache
+    again = cache.get(URL)
+    assert again.from_cache and again.text == "<p>v1</p>"
+    assert len(sent) == 1
+    assert cache.stats == {"fresh": 1, "revalidated": 0, "downloaded": 1}
+
+
+def test_stale_entries_are_revalidated_with_their_validators(cache, network):
+    answers, sent = network
+    answers.append(response(200, b"<p>v1</p>", {"ETag": '"v1"', "Last-Modified": "Sat, 17 Oct 2026 08:00:00 GMT"}))
+    cache.get(URL)
+    cache.fresh_seconds = 0
+
+    answers.append(response(304))
+    revalidated = cache.get(URL)
+    assert sent[-1]["If-None-Match"] == '"v1"'
+    assert sent[-1]["If-Modified-Since"] == "Sat, 17 Oct 2026 08:00:00 GMT"
+    assert revalidated.from_cache and revalidated.text == "<p>v1</p>"
+
+    answers.append(response(200, b"<p>v2</p>", {"ETag": '"v2"'}))
+    assert cache.get(URL).text == "<p>v2</p>"
+    assert cache.lookup(URL)["headers"]["ETag"] == '"v2"'
+
+
+def test_parsed_records_are_kept_per_parser_until_the_body_changes(cache, network):
+    answers, _ = network
+    answers.append(response(200, b"<p>v1</p>"))
+    cache.get(URL)
+    cache.save_parsed(URL, "scraper:2", {"Title": "Engineer"})
+    assert cache.load_parsed(URL, "scraper:2") == {"Title": "Engineer"}
+    assert cache.load_parsed(URL, "scraperr:1") is None
+
+    cache.fresh_seconds = 0
+    answers.append(response(200, b"<p>v2</p>"))
+    cache.get(URL)
+    assert cache.load_parsed(URL, "scraper:2") is None
+
+
+def test_prune_applies_the_age_and_size_limits(cache):
+    for i in range(5):
+        cache.store(f"{URL}-{i}", response(200, bytes(range(256)) * 40))
+        cache.conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (1000 + i, f"{URL}-{i}"))
+    cache.conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time() - 30 * 86400, f"{URL}-0"))
+    size = cache.conn.execute("SELECT size FROM responses LIMIT 1").fetchone()[0]
+    cache.max_bytes = size * 2
+    assert cache.prune() == 3
+    assert [row[0] for row in cache.conn.execute("SELECT url FROM responses ORDER BY url")] == [f"{URL}-3", f"{URL}-4"]
@@ -0,0 +1,49 @@
+import glob
+import os
+
+import pytest
+
+from jobau import scraper, scraper_api, scraperr
+from jobau.parsers import BACKENDS, make_listing_soup, make_soup
+
+CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpus")
+PAGE_URL = "https://www.myjobmag.com/job/corpus-page"
+
+
+def corpus(pattern):
+    paths = sorted(glob.glob(os.path.join(CORPUS, pattern)))
+    assert paths, f"no {pattern} in {CORPUS}"
+    return [(os.path.basename(path), open(path, encoding="utf-8").read()) for path in paths]
+
+
+def backend_param(backend):
+    try:
+        make_soup("<p></p>", backend)
+    except RuntimeError as e:
+        return pytest.param(backend, marks=pytest.mark.skip(reason=str(e)))
+    return backend
+
+
+OTHER_BACKENDS = [backend_param(backend) for backend in BACKENDS if backend != "html.parser"]
+
+
+@pytest.mark.parametrize("backend", OTHER_BACKENDS)
+@pytest.mark.parametrize("module", [scraper, scraperr, scraper_api], ids=lambda m: m.__name__.split(".")[-1])
+def test_every_backend_extracts_the_same_records(module, backend):
+    for name, html in corpus("detail_*.html"):
+        expected = module.parse_job_details(html, PAGE_URL, backend="html.parser")
+        assert dict(module.parse_job_details(html, PAGE_URL, backend=backend)) == dict(expected), name
+
+
+@pytest.mark.parametrize("backend", ["html.parser", *OTHER_BACKENDS])
+def test_strained_listing_parse_finds_the_same_jobs(backend):
+    for name, html in corpus("listing_*.html"):
+        full, strained = make_soup(html, backend), make_listing_soup(html, backend)
+        for css in ("li.job-list-li h2 a", "ul.setPaginate li a"):
+            assert [a.get("href") for a in strained.select(css)] == [a.get("href") for a in full.select(css)], name
+        assert strained.select("li.job-list-li"), name
+
+
+def test_unknown_backend_is_an_error():
+    with pytest.raises(ValueError):
+        make_soup("<p></p>", "lexbor")
@@ -0,0 +1,97 @@
+import sqlite3
+
+import pytest
+
+from jobau import scraper, scraper_api
+from jobau.seen_index import STOP_AFTER_KNOWN_PAGES, SeenIndex, canonical_job_key
+
+
+def listing(n, title="Engineer"):
+    return {"title": title, "company": "Acme", "location": "Lagos",
+            "link": f"https://www.myjobmag.com/job/engineer-{n}"}
+
+
+def test_canonical_job_key_ignores_case_query_and_trailing_slash():
+    assert canonical_job_key("https://www.myjobmag.com/Job/HR-Associate/?utm=x") == "/job/hr-associate"
+
+
+def test_unchanged_jobs_are_reused_and_changed_ones_refetched(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"), "scraper", "scraper:2")
+    jobs = [listing(1), listing(2)]
+    to_fetch, known = index.plan(jobs)
+    assert to_fetch == jobs and known == {}
+    for job in jobs:
+        assert index.record_fetch(job, {"Title": job["title"], "URL": job["link"]})
+
+    to_fetch, known = index.plan([listing(1), listing(2, title="Senior Engineer"), listing(3)])
+    assert [job["link"] for job in to_fetch] == [listing(2)["link"], listing(3)["link"]]
+    assert known == {listing(1)["link"]: {"Title": "Engineer", "URL": listing(1)["link"]}}
+    assert index.all_known([listing(1), listing(2)])
+    assert not index.all_known([listing(1), listing(4)])
+
+
+def test_record_fetch_reports_content_changes(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"), "scraper", "scraper:2")
+    job = listing(1)
+    index.plan([job])
+    assert index.record_fetch(job, {"Title": "Engineer"})
+    assert not index.record_fetch(job, {"Title": "Engineer"})
+    assert index.record_fetch(job, {"Title": "Engineer II"})
+
+
+def test_records_from_another_parser_are_stale(tmp_path):
+    path = str(tmp_path / "seen.sqlite")
+    old = SeenIndex(path, "scraper", "scraper:1")
+    old.plan([listing(1)])
+    old.record_fetch(listing(1), {"Title": "Engineer"})
+    old.conn.close()
+
+    index = SeenIndex(path, "scraper", "scraper:2")
+    to_fetch, known = index.plan([listing(1)])
+    assert to_fetch == [listing(1)] and known == {}
+    assert index.listed_since(0) == {}
+
+    index.record_fetch(listing(1), {"Title": "Engineer", "URL": listing(1)["link"]})
+    assert index.listed_since(0) == {listing(1)["link"]: {"Title": "Engineer", "URL": listing(1)["link"]}}
+    assert index.listed_since(0, exclude=[listing(1)["link"]]) == {}
+
+
+def test_indexes_without_parser_keys_are_migrated_as_stale(tmp_path):
+    path = str(tmp_path / "seen.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE jobs (
+            source TEXT NOT NULL, job_key TEXT NOT NULL, url TEXT NOT NULL,
+            first_seen REAL NOT NULL, last_listed REAL NOT NULL, last_fetched REAL,
+            listing_fingerprint TEXT, content_fingerprint TEXT, record TEXT,
+            PRIMARY KEY (source, job_key)
+        )
+    """)
+    conn.execute("INSERT INTO jobs VALUES ('scraper', '/job/engineer-1', ?, 0, 9e12, 9e12, NULL, NULL, '{}')",
+                 (listing(1)["link"],))
+    conn.commit()
+    conn.close()
+
+    index = SeenIndex(path, "scraper", "scraper:2")
+    assert not index.contains(listing(1)["link"])
+    assert index.listed_since(0) == {}
+    assert index.plan([listing(1)]) == ([listing(1)], {})
+
+
+@pytest.mark.parametrize("module", [scraper, scraper_api])
+def test_failed_fetches_keep_later_pages_in_the_crawl(module, listing_pages, tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"), module.__name__, "key:1")
+    jobs = next(module.iter_today_job_pages(seen=index))
+    to_fetch, _ = index.plan(jobs)
+    failed, fetched = to_fetch[0], to_fetch[1:]
+    for job in fetched:
+        index.record_fetch(job, {"URL": job["link"]})
+
+    # Every page lists the job whose detail fetch failed, so none of them is known
+    assert not index.contains(failed["link"])
+    listing_pages.clear()
+    assert len(list(module.iter_today_job_pages(seen=index))) == 4
+
+    index.record_fetch(failed, {"URL": failed["link"]})
+    listing_pages.clear()
+    assert len(list(module.iter_today_job_pages(seen=index))) == STOP_AFTER_KNOWN_PAGES
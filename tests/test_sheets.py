@@ -0,0 +1,166 @@
+import re
+
+import pandas as pd
+import pytest
+
+from jobau import sheets
+from jobau.sheets import FINGERPRINT_COLUMN, append_sink, upsert_sink, user_entered
+
+
+def typed(text):
+    """A cell as Sheets stores USER_ENTERED text: ' escapes, formulas, numbers."""
+    if text.startswith("'"):
+        return text[1:]
+    if text.startswith(("=", "+")):
+        return ("formula", text)
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def shown(cell):
+    """A stored cell as batch_get (FORMATTED_VALUE) returns it."""
+    if isinstance(cell, float):
+        return f"{cell:g}"
+    if isinstance(cell, tuple):
+        return "#ERROR!"
+    return cell
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet):
+        self.worksheet = worksheet
+        self.calls = []
+
+    def values_batch_update(self, body):
+        self.calls.append("values_batch_update")
+        assert body["valueInputOption"] == "USER_ENTERED"
+        for item in body["data"]:
+            row = int(re.search(r"!A(\d+):", item["range"]).group(1))
+            self.worksheet.grid[row - 1] = [typed(value) for value in item["values"][0]]
+
+    def batch_update(self, body):
+        self.calls.append("batch_update")
+        for request in body["requests"]:
+            if "deleteDimension" in request:
+                r = request["deleteDimension"]["range"]
+                del self.worksheet.grid[r["startIndex"]:r["endIndex"]]
+            elif "updateDimensionProperties" in request:
+                r = request["updateDimensionProperties"]["range"]
+                columns = range(r["startIndex"] + 1, r["endIndex"] + 1)
+                if request["updateDimensionProperties"]["properties"]["hiddenByUser"]:
+                    self.worksheet.hidden.update(columns)
+                else:
+                    self.worksheet.hidden.difference_update(columns)
+            else:
+                raise AssertionError(f"unexpected request {request}")
+
+
+class FakeWorksheet:
+    """Just enough of a gspread Worksheet for the sinks, storing cells the way Sheets would."""
+
+    id = 7
+    title = "Job Board"
+
+    def __init__(self):
+        self.grid = []
+        self.hidden = set()
+        self.col_count = 26
+        self.spreadsheet = FakeSpreadsheet(self)
+
+    def batch_get(self, ranges):
+        self.spreadsheet.calls.append("batch_get")
+        result = []
+        for a1 in ranges:
+            if a1 == "1:1":
+                result.append([[shown(cell) for cell in self.grid[0]]] if self.grid else [])
+                continue
+            col = ord(a1[0]) - ord("A")
+            column = [[shown(row[col])] if col < len(row) and row[col] != "" else [] for row in self.grid[1:]]
+            while column and not column[-1]:
+                column.pop()
+            result.append(column)
+        return result
+
+    def clear(self):
+        self.spreadsheet.calls.append("clear")
+        self.grid = []
+
+    def resize(self, cols):
+        self.col_count = cols
+
+    def append_rows(self, rows, value_input_option, insert_data_option, table_range):
+        self.spreadsheet.calls.append("append_rows")
+        assert value_input_option == "USER_ENTERED"
+        self.grid.extend([typed(value) for value in row] for row in rows)
+
+    def values(self):
+        return [[shown(cell) for cell in row] for row in self.grid]
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["Title", "Salary", "URL"])
+
+
+@pytest.fixture
+def sheet():
+    return FakeWorksheet()
+
+
+def test_user_entered_escapes_formula_like_text():
+    assert user_entered("=HYPERLINK(1)") == "'=HYPERLINK(1)"
+    assert user_entered("+234 803 000 0000") == "'+234 803 000 0000"
+    assert user_entered("'quoted") == "''quoted"
+    assert user_entered("2026-10-17") == "2026-10-17"
+    assert user_entered("") == ""
+
+
+def test_first_upsert_rewrites_with_typed_cells_and_a_hidden_fingerprint(sheet):
+    upsert_sink(sheet, frame([["Engineer", "250000", "u1"], ["=cmd()", None, "u2"]]), key="URL")
+    assert sheet.values()[0] == ["Title", "Salary", "URL", FINGERPRINT_COLUMN]
+    assert sheet.grid[1][1] == 250000.0  # a number, not text
+    assert sheet.grid[2][0] == "=cmd()"  # text, not a formula
+    assert sheet.hidden == {4}
+
+
+def test_header_change_shows_the_old_fingerprint_column_again(sheet):
+    upsert_sink(sheet, frame([["Engineer", "250000", "u1"]]), key="URL")
+    assert sheet.hidden == {4}
+
+    rows = pd.DataFrame([["Engineer", "250000", "Lagos", "u1"]], columns=["Title", "Salary", "State", "URL"])
+    upsert_sink(sheet, rows, key="URL")
+    assert sheet.values()[0] == ["Title", "Salary", "State", "URL", FINGERPRINT_COLUMN]
+    assert sheet.hidden == {5}
+
+
+def test_upsert_writes_only_the_delta(sheet):
+    upsert_sink(sheet, frame([["A", "1", "u1"], ["B", "2", "u2"], ["C", "3", "u3"]]), key="URL")
+    sheet.spreadsheet.calls.clear()
+
+    upsert_sink(sheet, frame([["A", "1", "u1"], ["B", "20", "u2"], ["D", "4", "u4"]]), key="URL")
+    assert [row[:3] for row in sheet.values()[1:]] == [["A", "1", "u1"], ["B", "20", "u2"], ["D", "4", "u4"]]
+    assert sheet.spreadsheet.calls == ["batch_get", "values_batch_update", "batch_update", "append_rows"]
+
+    sheet.spreadsheet.calls.clear()
+    upsert_sink(sheet, frame([["A", "1", "u1"], ["B", "20", "u2"], ["D", "4", "u4"]]), key="URL")
+    assert sheet.spreadsheet.calls == ["batch_get"]
+
+
+def test_upsert_keeps_rows_missing_from_the_data_without_delete_missing(sheet):
+    upsert_sink(sheet, frame([["A", "1", "u1"], ["B", "2", "u2"]]), key="URL")
+    upsert_sink(sheet, frame([["C", "3", "u3"]]), key="URL", delete_missing=False)
+    assert [row[2] for row in sheet.values()[1:]] == ["u1", "u2", "u3"]
+
+
+def test_upsert_needs_the_key_column(sheet):
+    with pytest.raises(ValueError):
+        upsert_sink(sheet, frame([["A", "1", "u1"]]), key="Link")
+
+
+def test_append_sink_batches_and_escapes(sheet, monkeypatch):
+    monkeypatch.setattr(sheets, "APPEND_MAX_ROWS", 2)
+    appended = append_sink(sheet, frame([["A", "1", "u1"], ["=B", "2", "u2"], ["C", None, "u3"]]))
+    assert appended == 3
+    assert sheet.spreadsheet.calls == ["append_rows", "append_rows"]
+    assert sheet.values() == [["A", "1", "u1"], ["=B", "2", "u2"], ["C", "", "u3"]]